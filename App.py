@@ -1,11 +1,12 @@
 import streamlit as st
-import random
 import re
+import uuid
 import pandas as pd
-from copy import deepcopy  # Import deepcopy to clone teams
+import altair as alt
 
 from Players import get_teams  # Returns a deep copy of the master teams.
-from basebrawl5 import play_full_game
+from head_to_head import build_matrix, load_matrix
+from reservoir import GameReservoir
 
 # --- Page Layout ---
 st.set_page_config(
@@ -23,6 +24,8 @@ if "stats_df" not in st.session_state:
     st.session_state.stats_df = None
 if "show_stats" not in st.session_state:
     st.session_state.show_stats = False
+if "show_matrix" not in st.session_state:
+    st.session_state.show_matrix = False
 
 # --- Title & Intro ---
 st.title("Basebrawl: The Reckoning")
@@ -32,55 +35,42 @@ st.markdown("*welcome back, mortal... craft fates, make clones, scramblerize the
 teams = get_teams()
 team_names = list(teams.keys())
 
+@st.cache_resource
+def get_reservoir():
+    """One shared stock of pre-simulated games, refilled in the background."""
+    return GameReservoir()
+
+reservoir = get_reservoir()
+
+if "flip_order" not in st.session_state:
+    st.session_state.flip_order = False
+# Tells this session's wanted matchups apart from other sessions' in the shared reservoir.
+if "reservoir_session" not in st.session_state:
+    st.session_state.reservoir_session = uuid.uuid4().hex
+
 # --- Team Selection Dropdowns ---
 selected_team_a = st.selectbox("Select Team A", team_names, key="selected_team_a")
 selected_team_b = st.selectbox("Select Team B", team_names, key="selected_team_b")
 
+# Keep the current pair stocked in both orders, the next one to be played first.
+reservoir.want([
+    (selected_team_a, selected_team_b, st.session_state.flip_order),
+    (selected_team_a, selected_team_b, not st.session_state.flip_order)
+], session=st.session_state.reservoir_session)
+
 def run_game():
     """
     Runs a game using the teams selected by the user via the dropdowns.
     If the same team is selected for both positions, two independent copies
-    are created. For Team A, the display name is updated to include "(CLONES)"
+    are used. For Team A, the display name is updated to include "(CLONES)"
     and each player's name is prefixed with "CLONE ".
+    The game is normally already finished in the reservoir.
     """
     team_a_name = st.session_state.selected_team_a
     team_b_name = st.session_state.selected_team_b
 
-    if team_a_name == team_b_name:
-        # Create two independent copies of the chosen team.
-        original_team = teams[team_a_name]
-        team_a_master = deepcopy(original_team)
-        team_b_master = deepcopy(original_team)
-
-        # Update Team A's display name and each player's name.
-        display_team_a_name = team_a_name + " (CLONES)"
-        for player in team_a_master:
-            if isinstance(player, dict) and "name" in player:
-                player["name"] = "CLONE " + player["name"]
-            elif hasattr(player, "name"):
-                player.name = "CLONE " + player.name
-    else:
-        # If the teams are different, use them directly.
-        team_a_master = teams[team_a_name]
-        team_b_master = teams[team_b_name]
-        display_team_a_name = team_a_name
-
-    if "flip_order" not in st.session_state:
-        st.session_state.flip_order = False
-
     # Use the flip_order logic to alternate game order.
-    if st.session_state.flip_order:
-        st.session_state.game_log = play_full_game(
-            team_b_master, team_a_master,
-            team_b_master, team_a_master,
-            team_b_name, display_team_a_name
-        )
-    else:
-        st.session_state.game_log = play_full_game(
-            team_a_master, team_b_master,
-            team_a_master, team_b_master,
-            display_team_a_name, team_b_name
-        )
+    st.session_state.game_log = reservoir.take(team_a_name, team_b_name, st.session_state.flip_order)
 
     st.session_state.flip_order = not st.session_state.flip_order
     st.session_state.game_run = True
@@ -90,28 +80,7 @@ def run_random_game():
     Runs a game using two random teams selected from the available teams.
     This function always uses the teams' original names.
     """
-    team_names_random = random.sample(team_names, 2)
-    team_a_name = team_names_random[0]
-    team_b_name = team_names_random[1]
-
-    team_a_master = teams[team_a_name]
-    team_b_master = teams[team_b_name]
-
-    if "flip_order" not in st.session_state:
-        st.session_state.flip_order = False
-
-    if st.session_state.flip_order:
-        st.session_state.game_log = play_full_game(
-            team_b_master, team_a_master,
-            team_b_master, team_a_master,
-            team_b_name, team_a_name
-        )
-    else:
-        st.session_state.game_log = play_full_game(
-            team_a_master, team_b_master,
-            team_a_master, team_b_master,
-            team_a_name, team_b_name
-        )
+    st.session_state.game_log = reservoir.take_random()
 
     st.session_state.flip_order = not st.session_state.flip_order
     st.session_state.game_run = True
@@ -142,10 +111,23 @@ def toggle_stats():
             st.error("Error loading stats: " + str(e))
             st.session_state.show_stats = False  # Turn off if error occurs
 
+def toggle_matrix():
+    """
+    Toggle the head-to-head heatmap.
+    The matrix is read from disk, so showing it never runs any games.
+    """
+    st.session_state.show_matrix = not st.session_state.show_matrix
+
+def refresh_matrix():
+    """Simulate only the pairings whose rosters changed since the matrix was saved."""
+    with st.spinner("The Oracle is watching the games..."):
+        build_matrix(teams)
+
 # --- Primary Buttons ---
 st.button("PLAY BALL!", on_click=run_game)
 st.button("SCRAMBLERIZER", on_click=run_random_game)
 st.button("THE GRIMOIRE", on_click=toggle_stats)
+st.button("THE ORACLE", on_click=toggle_matrix)
 
 # --- Display Game Log ---
 def reformat_log_line(line: str) -> str:
@@ -164,6 +146,27 @@ if st.session_state.show_stats and st.session_state.stats_df is not None:
     st.subheader("Player Stats")
     st.dataframe(st.session_state.stats_df, height=1200)
 
+# --- Conditionally Display the Head-to-Head Heatmap ---
+if st.session_state.show_matrix:
+    st.subheader("Head-to-Head Win Probabilities")
+    matrix = load_matrix(teams)
+    if matrix["stale"]:
+        st.warning(f"{matrix['stale']} pairings have no results for the current rosters yet.")
+        st.button("CONSULT THE ORACLE", on_click=refresh_matrix)
+    heatmap_rows = []
+    for team_name, row in zip(matrix["teams"], matrix["probabilities"]):
+        for opponent_name, probability in zip(matrix["teams"], row):
+            if probability is not None:
+                heatmap_rows.append({"Team": team_name, "Opponent": opponent_name, "Win %": round(probability * 100, 1)})
+    if heatmap_rows:
+        heatmap = alt.Chart(pd.DataFrame(heatmap_rows)).mark_rect().encode(
+            x=alt.X("Opponent:N", sort=matrix["teams"]),
+            y=alt.Y("Team:N", sort=matrix["teams"]),
+            color=alt.Color("Win %:Q", scale=alt.Scale(scheme="redyellowgreen", domain=[0, 100])),
+            tooltip=["Team", "Opponent", "Win %"]
+        )
+        st.altair_chart(heatmap, use_container_width=True)
+
 # --- "Back to Top" Button ---
 back_to_top_html = """
 <style>
@@ -1,4 +1,5 @@
 import csv
+import itertools
 import random
 def calculate_pitching_stint(p):
     """
@@ -13,8 +14,50 @@ def calculate_pitching_stint(p):
     stint = base_stint + bonus
     return min(stint, 12)  # 12 half–innings = 6 full innings
 
+STAT_NAMES = ("power", "agility", "chutzpah", "batting", "pitching", "baserunning", "fielding", "brawling")
+NO_DELTAS = (0,) * len(STAT_NAMES)
+
+class StatModifiers:
+    """
+    Named stat modifiers, each a tuple of deltas in STAT_NAMES order, and
+    their totals. A player has their own; a team's are stored once and
+    shared by all its players.
+    """
+    def __init__(self):
+        self.modifiers = {}
+        self.totals = NO_DELTAS
+
+    def get(self, name):
+        return self.modifiers.get(name)
+
+    def set(self, name, deltas):
+        """Sets (or with None or all zeros, removes) a modifier."""
+        if deltas is None or not any(deltas):
+            self.modifiers.pop(name, None)
+        else:
+            self.modifiers[name] = tuple(deltas)
+        self.totals = tuple(map(sum, zip(*self.modifiers.values()))) if self.modifiers else NO_DELTAS
+
+    def __deepcopy__(self, memo):
+        # The totals and deltas are immutable; rosters are deep-copied every game.
+        copied = StatModifiers.__new__(StatModifiers)
+        copied.modifiers = dict(self.modifiers)
+        copied.totals = self.totals
+        return copied
+
+# Player IDs are handed out as players are created (when a roster is loaded or
+# uploaded); copies of a player keep its ID.
+_player_ids = itertools.count(1)
+
+def next_player_id():
+    return next(_player_ids)
+
 class Player:
+    # Replaced by the team's modifiers when the player joins a Roster for a game.
+    team_modifiers = StatModifiers()
+
     def __init__(self, name, power, agility, chutzpah, batting, pitching, baserunning, fielding, brawling):
+        self.player_id = next_player_id()
         self.name = name
         self.base_power = power
         self.base_agility = agility
@@ -24,33 +67,45 @@ class Player:
         self.base_baserunning = baserunning
         self.base_fielding = fielding
         self.base_brawling = brawling
-        self.power = power
-        self.agility = agility
-        self.chutzpah = chutzpah
-        self.batting = batting
-        self.pitching = pitching
-        self.baserunning = baserunning
-        self.fielding = fielding
-        self.brawling = brawling
+        self.modifiers = StatModifiers()
         self.is_dead = False
         self.injury_status = None
         self.injury_debuff = 0
+        self.refresh_stats()
         self.recovery_bonus = 0.0
         self.knockout_halves_remaining = 0
         self.pending_death = False
         self.remaining_innings = calculate_pitching_stint(self)
         self.exhausted = False
 
+    def refresh_stats(self):
+        """
+        Works out the effective stats from the modifier stack: the base stat,
+        minus the injury debuff but not below 0, plus the player's own and their
+        team's modifiers. Call after changing any of those.
+        """
+        own, team, debuff = self.modifiers.totals, self.team_modifiers.totals, self.injury_debuff
+        self.power       = max(0, self.base_power - debuff) + own[0] + team[0]
+        self.agility     = max(0, self.base_agility - debuff) + own[1] + team[1]
+        self.chutzpah    = max(0, self.base_chutzpah - debuff) + own[2] + team[2]
+        self.batting     = max(0, self.base_batting - debuff) + own[3] + team[3]
+        self.pitching    = max(0, self.base_pitching - debuff) + own[4] + team[4]
+        self.baserunning = max(0, self.base_baserunning - debuff) + own[5] + team[5]
+        self.fielding    = max(0, self.base_fielding - debuff) + own[6] + team[6]
+        self.brawling    = max(0, self.base_brawling - debuff) + own[7] + team[7]
+
+    def set_modifier(self, name, deltas):
+        self.modifiers.set(name, deltas)
+        self.refresh_stats()
+
     def __eq__(self, other):
         if isinstance(other, Player):
-            # Compare using a unique field. Here we use name.
-            # (Better: add a unique player ID if possible.)
-            return self.name == other.name
+            # Players are the same player if they share an ID; names are only for display.
+            return self.player_id == other.player_id
         return False
 
     def __hash__(self):
-        # Hash based on unique name.
-        return hash(self.name)
+        return self.player_id
 
 def load_master_teams(csv_file_path):
     teams = {}
@@ -1,9 +1,17 @@
 import random
 import copy
+import heapq
+import threading
+
+from rng import current_rng
+from phase_timing import state as timing_state
+from metrics import begin_game, end_game, game_called, game_state as metrics_state, injury_tier
+from watchdog import GameCalled, begin_watchdog, end_watchdog, state as watchdog_state
 
 # ------------------ Updated Team Loading Block ------------------
 # Import get_teams from Players.py (which returns a fresh deep copy of MASTER_TEAMS)
 from Players import get_teams
+from Team_Upload import STAT_NAMES, StatModifiers
 
 # Get all teams from Players.py (already deep-copied)
 teams = get_teams()
@@ -27,16 +35,11 @@ pitchers_b = copy.deepcopy(team_b_master)
 
 def update_player_stats(player):
     """
-    Recalculate a player's current stats from their base values minus the current injury debuff.
+    Recalculate a player's current stats from their base values minus the current
+    injury debuff, plus their own and their team's modifiers.
     """
-    player.power       = max(0, player.base_power - player.injury_debuff)
-    player.agility     = max(0, player.base_agility - player.injury_debuff)
-    player.chutzpah    = max(0, player.base_chutzpah - player.injury_debuff)
-    player.batting     = max(0, player.base_batting - player.injury_debuff)
-    player.pitching    = max(0, player.base_pitching - player.injury_debuff)
-    player.baserunning = max(0, player.base_baserunning - player.injury_debuff)
-    player.fielding    = max(0, player.base_fielding - player.injury_debuff)
-    player.brawling    = max(0, player.base_brawling - player.injury_debuff)
+    player.refresh_stats()
+    refresh_status(player)
 
 
 #===== Foul Mood =====#
@@ -106,40 +109,35 @@ class FoulMood:
 
 #===== Riled Up =====#
 
+def riled_modifier(bonus):
+    """The riled-up modifier: a flat bonus to every stat but brawling."""
+    return tuple(0 if stat == "brawling" else bonus for stat in STAT_NAMES)
+
+def set_team_modifier(team, name, deltas):
+    """
+    Sets a modifier for the whole team: stored once on a Roster (its players'
+    stats are then worked out again), or on each player of a plain list.
+    """
+    if isinstance(team, Roster):
+        team.modifiers.set(name, deltas)
+        for player in team:
+            player.refresh_stats()
+    else:
+        for player in team:
+            player.set_modifier(name, deltas)
+    restack_pitchers(team)
+
 def apply_riled_buff(team, bonus):
     """
-    Apply a flat bonus to all eight stats of every player on the team.
-    The function checks if the player already has a buff and updates accordingly.
+    Sets the team's riled-up bonus, replacing any earlier one.
     """
-    for player in team:
-        if not hasattr(player, 'riled_buff'):
-            player.riled_buff = 0
-        diff = bonus - player.riled_buff
-        player.power       += diff
-        player.agility     += diff
-        player.chutzpah    += diff
-        player.batting     += diff
-        player.pitching    += diff
-        player.baserunning += diff
-        player.fielding    += diff
-        player.riled_buff = bonus
+    set_team_modifier(team, "riled", riled_modifier(bonus))
 
 def remove_riled_buff(team):
     """
-    Remove any applied riled buff from each player, restoring their base stats.
+    Removes the team's riled-up bonus.
     """
-    for player in team:
-        if hasattr(player, 'riled_buff'):
-            bonus = player.riled_buff
-            player.power       -= bonus
-            player.agility     -= bonus
-            player.chutzpah    -= bonus
-            player.batting     -= bonus
-            player.pitching    -= bonus
-            player.baserunning -= bonus
-            player.fielding    -= bonus
-            player.brawling    -= bonus
-            player.riled_buff = 0
+    set_team_modifier(team, "riled", None)
 
 class RiledUp:
     """
@@ -237,6 +235,88 @@ class RiledUp:
                 return f"Scoring points calms {team_name}'s frustration. Riled down to {RiledUp.riled_fires(self.tier)}"
         return ""
 
+#===== Game State =====#
+
+class GameState:
+    """
+    What the whole game shares: both teams by index (0 bats at the top of the
+    inning, 1 at the bottom), their display names, the score, each team's
+    RiledUp and batter count, and the game's FoulMood. Scores are kept by
+    index, so two teams with the same display name still score separately.
+    It also tracks where the game is (the inning, the half-inning being played,
+    the batter at the plate and the pitch of their at-bat) for anything that
+    watches a game from outside (see current_game); the engine itself only
+    reads the inning, when a game is called.
+    """
+    __slots__ = ("teams", "team_names", "score", "riled_up", "batter_index", "foul_mood",
+                 "inning", "half", "batter", "pitch_number")
+
+    def __init__(self, team_a_name, team_b_name, team_a=None, team_b=None, foul_mood=None):
+        self.teams = (team_a, team_b)
+        self.team_names = (team_a_name, team_b_name)
+        self.score = [0, 0]
+        self.riled_up = (RiledUp(), RiledUp())
+        self.batter_index = [0, 0]
+        self.foul_mood = foul_mood if foul_mood is not None else FoulMood()
+        self.inning = 0
+        self.half = None
+        self.batter = None
+        self.pitch_number = 0
+
+    @property
+    def is_top(self):
+        return self.half is None or self.half.is_top
+
+    def score_line(self, label="Current Score"):
+        team_a_name, team_b_name = self.team_names
+        return f"📊 {label}: {team_a_name}: {self.score[0]}, {team_b_name}: {self.score[1]}"
+
+
+class HalfInningState:
+    """
+    One half-inning in progress: the game, the batting team's index, the
+    pitcher and fielders it faces, the bases and the outs. The engine
+    functions below update it in place instead of passing these around.
+    """
+    __slots__ = ("game", "batting", "is_top", "team_name", "riled_up", "pitcher", "defensive_positions",
+                 "base_runners", "outs")
+
+    def __init__(self, game, is_top, pitcher, defensive_positions, base_runners=None, outs=0):
+        self.game = game
+        self.batting = 0 if is_top else 1
+        self.is_top = is_top
+        self.team_name = game.team_names[self.batting]
+        self.riled_up = game.riled_up[self.batting]
+        self.pitcher = pitcher
+        self.defensive_positions = defensive_positions
+        self.base_runners = base_runners if base_runners is not None else [None, None, None]
+        self.outs = outs
+
+    def score_run(self, log):
+        """
+        Scores one run for the batting team, then logs the riled-down message
+        (applying the lowered bonus) and the new score.
+        """
+        game = self.game
+        game.score[self.batting] += 1
+        reduce_msg = self.riled_up.reduce_on_score(self.team_name)
+        if reduce_msg:
+            log.append(reduce_msg)
+            apply_riled_buff(game.teams[self.batting], self.riled_up.get_bonus())
+        log.append(game.score_line())
+
+
+class _CurrentGame(threading.local):
+    game = None
+
+
+current_game_state = _CurrentGame()
+
+
+def current_game():
+    """The GameState of the game being played on this thread, or None between games."""
+    return current_game_state.game
+
 # ===== Helper Functions ===== #
 
 # Check if a team is empty #
@@ -244,11 +324,57 @@ def is_team_empty(team):
     """Return True if the team has no players (i.e. all players are dead/removed)."""
     return len(team) == 0
 
+#===== Base State =====#
+# Base runners are a fixed [first, second, third] array of players or None.
+# Which bases are taken is a 3-bit mask (bit 0 first, bit 1 second, bit 2
+# third), used to look up everything that only depends on occupancy.
+FIRST, SECOND, THIRD = 1, 2, 4
+BASES_LOADED = FIRST | SECOND | THIRD
+
+def base_mask(base_runners):
+    return ((base_runners[0] is not None) | (base_runners[1] is not None) << 1 |
+            (base_runners[2] is not None) << 2)
+
+# The scoreboard squares (third, second, first) for each mask.
+BASE_SQUARES = tuple(("🟩" if mask & THIRD else "⬜") + ("🟩" if mask & SECOND else "⬜") +
+                     ("🟩" if mask & FIRST else "⬜") for mask in range(8))
+
+# Forced advances on a walk, for each mask: the bases the new runners on second
+# and third come from (the batter takes first; with the bases loaded, third scores).
+WALK_FORCES = tuple((1, 2) if not mask & FIRST else (0, 2) if not mask & SECOND else (0, 1)
+                    for mask in range(8))
+
+# On a hit, the base each runner (on first, second, third) runs for (3 is home)
+# and the base the batter runs for.
+HIT_ADVANCES = {
+    "potential_single": ((1, 2, 3), 0),
+    "potential_bunt_hit": ((1, 2, 3), 0),
+    "potential_double": ((2, 3, 3), 1),
+    "potential_triple": ((3, 3, 3), 2),
+}
+# Outcomes of attempt_base_advancement that put the runner out, freezing the base they ran for.
+BASERUNNING_OUTS = ("collision_out", "close_call_out", "tag_out")
+
 def display_bases_as_squares(base_runners):
-    third_base = "🟩" if base_runners[2] else "⬜"
-    second_base = "🟩" if base_runners[1] else "⬜"
-    first_base = "🟩" if base_runners[0] else "⬜"
-    return f"{third_base}{second_base}{first_base}"
+    return BASE_SQUARES[base_mask(base_runners)]
+
+def advance_all_runners(base_runners):
+    """Moves every runner up one base in place (balks, sacrifices) and returns the runner forced home, if any."""
+    scorer = base_runners[2]
+    base_runners[2] = base_runners[1]
+    base_runners[1] = base_runners[0]
+    base_runners[0] = None
+    return scorer
+
+def walk_batter(base_runners, batter):
+    """Puts the batter on first in place, forcing runners ahead; returns the runner forced home, if any."""
+    mask = base_mask(base_runners)
+    scorer = base_runners[2] if mask == BASES_LOADED else None
+    second_from, third_from = WALK_FORCES[mask]
+    base_runners[2] = base_runners[third_from]
+    base_runners[1] = base_runners[second_from]
+    base_runners[0] = batter
+    return scorer
 
 #unused
 def verb_for_team(team_name, singular="gets", plural="get"):
@@ -297,28 +423,39 @@ def format_player_status(player):
 def remove_dead_from_bases(base_runners):
     """
     Iterates over the list of base runners (positions for first, second, and third)
-    and sets any runner who is not active (i.e. dead or knocked out) to None.
+    and sets any runner who is not active (i.e. dead or knocked out) to None, in place.
     """
-    return [runner if (runner is not None and is_active(runner, ignore_exhausted_for_batting=True))
-            else None for runner in base_runners]
+    for base_index in (0, 1, 2):
+        runner = base_runners[base_index]
+        if runner is not None and not is_active(runner, ignore_exhausted_for_batting=True):
+            base_runners[base_index] = None
+    return base_runners
 
 def finalize_pending_deaths(team):
     """
     Iterates over the team and, for any player flagged as pending death,
     sets them as dead and removes the pending flag.
     """
+    events = metrics_state.events
     for player in team:
         if getattr(player, "pending_death", False):
             player.is_dead = True
             player.final_bat_allowed = True
             del player.pending_death
+            refresh_status(player)
+            if events:
+                events.deaths += 1
 
 
 def get_next_batter(batting_order, last_batter, batters_remaining, current_baserunners):
+    rng = current_rng()
     # Rebuild batters_remaining if needed.
     if not batters_remaining:
         # Start with batters not on base.
         eligible = [b for b in batting_order if b not in current_baserunners]
+        # If every active player is already on base, one of the runners has to bat.
+        if not eligible:
+            eligible = batting_order[:]
 
         # Try to remove last_batter if we have more than one eligible batter.
         if last_batter is not None and len(eligible) > 1:
@@ -326,7 +463,7 @@ def get_next_batter(batting_order, last_batter, batters_remaining, current_baser
 
         # Shuffle randomly.
         batters_remaining = eligible[:]
-        random.shuffle(batters_remaining)
+        rng.lineup.shuffle(batters_remaining)
 
         # Ensure that the first batter is not the last batter if possible.
         if last_batter is not None and len(batters_remaining) > 1 and batters_remaining[0] == last_batter:
@@ -336,12 +473,12 @@ def get_next_batter(batting_order, last_batter, batters_remaining, current_baser
     if last_batter is not None and len(batters_remaining) > 1:
         alternatives = [b for b in batters_remaining if b != last_batter]
         if alternatives:
-            next_batter = random.choice(alternatives)
+            next_batter = rng.lineup.choice(alternatives)
             batters_remaining.remove(next_batter)
             return next_batter, batters_remaining
 
     # Otherwise, simply pick and remove one at random.
-    next_batter = random.choice(batters_remaining)
+    next_batter = rng.lineup.choice(batters_remaining)
     batters_remaining.remove(next_batter)
     return next_batter, batters_remaining
 
@@ -355,30 +492,113 @@ def calculate_pitching_stint(p):
     If you want a maximum of 6 full innings (i.e. 12 half–innings), then use 12 here.
     Adjust the bonus as needed.
     """
+    rng = current_rng()
     base_stint = 4  # for example, every pitcher gets at least 4 half-innings
     bonus = p.agility // 2
-    if p.agility % 2 == 1 and random.random() < 0.5:
+    if p.agility % 2 == 1 and rng.lineup.random() < 0.5:
         bonus += 1
     stint = base_stint + bonus
     return min(stint, 12)  # 12 half–innings = 6 full innings
 
+class PitchingStaff:
+    """
+    A Roster's pitchers for one game: a heap of the active, non-exhausted
+    players keyed by pitching_priority, with roster order breaking ties like
+    the stable sort it replaces. Entries are never removed in place; update()
+    pushes a new entry whenever a player's stats, status or stint change, and
+    older entries are skipped when they reach the top. Team-wide buffs shift
+    everyone at once, so they just mark the heap for re-heapifying.
+    """
+    def __init__(self, roster):
+        self.roster = roster
+        self.order = {player.player_id: i for i, player in enumerate(roster)}
+        self.versions = dict.fromkeys(self.order, 0)
+        # Players with innings left in their stint; when it's empty, everyone's stint is reset.
+        self.fresh = {player.player_id for player in roster if getattr(player, "remaining_innings", 0) > 0}
+        self.heap = []
+        self.stale = True
+
+    def eligible(self, player):
+        return player.active and not getattr(player, "exhausted", False)
+
+    def update(self, player):
+        key = player.player_id
+        if key not in self.order:
+            return
+        self.versions[key] += 1
+        if getattr(player, "remaining_innings", 0) > 0:
+            self.fresh.add(key)
+        else:
+            self.fresh.discard(key)
+        if not self.stale and self.eligible(player):
+            heapq.heappush(self.heap, (-pitcher_priority(player), self.order[key], self.versions[key], player))
+
+    def rebuild(self):
+        self.heap = [(-pitcher_priority(player), self.order[player.player_id], self.versions[player.player_id], player)
+                     for player in self.roster if self.eligible(player)]
+        heapq.heapify(self.heap)
+        self.stale = False
+
+    def best(self):
+        """The active, non-exhausted player with the highest pitching, or None."""
+        if self.stale:
+            self.rebuild()
+        heap = self.heap
+        while heap:
+            _, _, version, player = heap[0]
+            if version == self.versions[player.player_id]:
+                return player
+            heapq.heappop(heap)
+        return None
+
+    def reset_stints(self):
+        for player in self.roster:
+            player.remaining_innings = calculate_pitching_stint(player)
+            player.exhausted = False
+        self.fresh = set(self.order)
+        self.stale = True
+
+def restack_pitchers(team):
+    """Marks the team's PitchingStaff for re-heapifying after a change to everyone's stats."""
+    staff = getattr(team, "staff", None)
+    if staff is not None:
+        staff.stale = True
+
 def select_new_pitcher(team):
-    non_exhausted = [p for p in team if is_active(p) and not getattr(p, 'exhausted', False)]
-    if non_exhausted:
-        best_pitchers = sorted(non_exhausted, key=pitcher_priority, reverse=True)
-        return best_pitchers[0]
+    rng = current_rng()
+    staff = getattr(team, "staff", None)
+    if staff is not None:
+        best = staff.best()
+        if best is not None:
+            return best
     else:
-        active_pitchers = [p for p in team if is_active(p)]
-        if active_pitchers:
-            return random.choice(active_pitchers)
-        else:
-            return None
+        non_exhausted = [p for p in active_players(team) if not getattr(p, 'exhausted', False)]
+        if non_exhausted:
+            best_pitchers = sorted(non_exhausted, key=pitcher_priority, reverse=True)
+            return best_pitchers[0]
+    active_pitchers = active_players(team)
+    if active_pitchers:
+        return rng.lineup.choice(active_pitchers)
+    else:
+        return None
+
+def end_pitching_half(pitcher):
+    """Counts a half-inning against the pitcher's stint, exhausting them when it runs out."""
+    pitcher.remaining_innings -= 1
+    if pitcher.remaining_innings <= 0:
+        pitcher.exhausted = True
+    refresh_status(pitcher)
 
 def reset_pitchers_if_exhausted(team):
     """
     Check if every pitcher in the team has exhausted their remaining innings.
     If yes, reset all pitchers' remaining innings using calculate_pitching_stint.
     """
+    staff = getattr(team, "staff", None)
+    if staff is not None:
+        if not staff.fresh:
+            staff.reset_stints()
+        return
     if all(getattr(p, 'remaining_innings', 0) <= 0 for p in team):
         for p in team:
             p.remaining_innings = calculate_pitching_stint(p)
@@ -393,6 +613,72 @@ def is_active(player, ignore_exhausted_for_batting=False):
         return False
     return True
 
+class Roster(list):
+    """
+    A team's players for one game, with an index of which of them are active
+    (see is_active) and which are knocked out. The index only changes when a
+    player's status does: code that sets is_dead, final_bat_allowed or
+    knockout_halves_remaining calls refresh_status(player) afterwards, so the
+    "who can still play" checks don't rescan the whole roster every at-bat.
+    """
+    def __init__(self, players=()):
+        super().__init__(players)
+        self.active_count = 0
+        self.staff = None  # the PitchingStaff, once stints are rolled
+        self.modifiers = StatModifiers()  # teamwide, e.g. the riled-up bonus
+        self.knocked_out = {}  # player id -> player, in the order they were knocked out
+        self._active_players = None
+        for player in self:
+            player.roster = self
+            player.team_modifiers = self.modifiers
+            player.active = is_active(player)
+            if player.active:
+                self.active_count += 1
+            if getattr(player, "knockout_halves_remaining", 0) > 0:
+                self.knocked_out[player.player_id] = player
+
+    def refresh(self, player):
+        active = is_active(player)
+        if active != player.active:
+            player.active = active
+            self.active_count += 1 if active else -1
+            self._active_players = None
+        if getattr(player, "knockout_halves_remaining", 0) > 0:
+            self.knocked_out[player.player_id] = player
+        else:
+            self.knocked_out.pop(player.player_id, None)
+        if self.staff is not None:
+            self.staff.update(player)
+
+    def active_players(self):
+        """The active players in roster order. Shared until the next status change, so don't modify it."""
+        if self._active_players is None:
+            self._active_players = [player for player in self if player.active]
+        return self._active_players
+
+def refresh_status(player):
+    """Updates the player's Roster index after their status changed (players outside a Roster need nothing)."""
+    roster = getattr(player, "roster", None)
+    if roster is not None:
+        roster.refresh(player)
+
+def active_players(team):
+    """The active players of team, in order."""
+    if isinstance(team, Roster):
+        return team.active_players()
+    return [player for player in team if is_active(player)]
+
+def any_active(team):
+    if isinstance(team, Roster):
+        return team.active_count > 0
+    return any(is_active(player) for player in team)
+
+def knocked_out_players(team):
+    """The players of team with knockout halves remaining."""
+    if isinstance(team, Roster):
+        return list(team.knocked_out.values())
+    return [player for player in team if getattr(player, "knockout_halves_remaining", 0) > 0]
+
 def assign_defensive_positions(roster):
     """
     Randomly assigns defensive positions from the full roster.
@@ -400,8 +686,9 @@ def assign_defensive_positions(roster):
     so that their status can be logged (e.g., "Dread Malakar is dead").
     (Note: The pitcher is handled separately and must be active.)
     """
+    rng = current_rng()
     roster_copy = roster.copy()
-    random.shuffle(roster_copy)
+    rng.lineup.shuffle(roster_copy)
 
     positions = {
         "catcher": roster_copy.pop() if roster_copy else None,
@@ -422,6 +709,7 @@ def batter_status_message(batter, team_name):
     if getattr(batter, "is_dead", False):
         if getattr(batter, "final_bat_allowed", False):
             batter.final_bat_allowed = False  # Use their final appearance now
+            refresh_status(batter)
             return f"{batter.name} was called to the plate... but they're dead."
         else:
             return None
@@ -445,7 +733,8 @@ def calculate_fielder_score(fielder):
     return fielder.fielding
 
 def baserunning_roll(runner, fielder):
-    roll = random.randint(1, 100)
+    rng = current_rng()
+    roll = rng.baserunning.randint(1, 100)
     total_roll = roll + (calculate_runner_score(runner) - calculate_fielder_score(fielder))
     if total_roll >= 90:
         return "extra_base", total_roll
@@ -460,7 +749,8 @@ def baserunning_roll(runner, fielder):
 
 def resolve_extra_bases():
     # Determine how many extra bases to advance using the 85/14/1 breakdown
-    extra_roll = random.randint(1, 100)
+    rng = current_rng()
+    extra_roll = rng.baserunning.randint(1, 100)
     if extra_roll <= 85:
         return 1
     elif extra_roll <= 85 + 14:
@@ -486,6 +776,7 @@ position_abbr = {
 }
 
 def get_fielder_for_base(base, defensive_positions):
+    rng = current_rng()
     primary_status_message = ""
     if base == 0:
         primary_position = "first_base"
@@ -521,11 +812,11 @@ def get_fielder_for_base(base, defensive_positions):
             outfield_candidates.append((p, pos))
 
     if outfield_candidates:
-        candidate, candidate_position = random.choice(outfield_candidates)
+        candidate, candidate_position = rng.baserunning.choice(outfield_candidates)
         assist_attempt_probability = max(candidate.agility / 10.0, 0.05)
-        if random.random() <= assist_attempt_probability:
-            assist_roll = random.randint(1, 100) + candidate.agility
-            primary_roll = random.randint(1, 100) if primary_status == "active" else 0
+        if rng.baserunning.random() <= assist_attempt_probability:
+            assist_roll = rng.baserunning.randint(1, 100) + candidate.agility
+            primary_roll = rng.baserunning.randint(1, 100) if primary_status == "active" else 0
             if assist_roll > primary_roll:
                 assist_fielder = candidate
                 assist_position = candidate_position
@@ -536,24 +827,27 @@ def get_fielder_for_base(base, defensive_positions):
 
     return expected_fielder, primary_position, primary_status_message, assist_fielder, assist_position, assist_info
 
-def attempt_base_advancement(runner, current_base, target_base, defensive_positions, occupied_bases, frozen_bases,
-                             is_top, score, team_a_name, team_b_name, team_a, team_b,
-                             foul_mood, riled_up, final_bso, outs, allow_extra=True):
-    runner_movements = []
+def attempt_base_advancement(half, runner, current_base, target_base, occupied, frozen,
+                             runner_movements, play_by_play_message, allow_extra=True):
+    """
+    Sends one runner from current_base toward target_base (3 is home), adding
+    to half.outs and the score as it goes. Messages are appended to
+    runner_movements and play_by_play_message.
+    Returns (outcome, runs_scored, new_base).
+    """
+    rng = current_rng()
     runs_scored = 0
-    play_by_play_message = []
-    batting_team = team_a_name if is_top else team_b_name
     # new_base will hold the base index (0,1,2) that the runner occupies if safe.
     # If the runner scores (target_base == 3) or is out, new_base remains None.
     new_base = None
 
-    # Immediately check if the target base is frozen.
-    if frozen_bases.get(target_base, False):
-        return ("frozen", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+    # Immediately check if the target base is frozen (frozen and occupied are masks over bases 0-3).
+    if frozen & (1 << target_base):
+        return ("frozen", runs_scored, new_base)
 
     # Retrieve defender info for the target base.
     (expected_fielder, primary_position, primary_status_message,
-     assist_fielder, assist_position, assist_info) = get_fielder_for_base(target_base, defensive_positions)
+     assist_fielder, assist_position, assist_info) = get_fielder_for_base(target_base, half.defensive_positions)
     active_defender = assist_fielder if assist_fielder is not None else expected_fielder
 
     # If no active defender is present, the runner advances safely.
@@ -569,31 +863,15 @@ def attempt_base_advancement(runner, current_base, target_base, defensive_positi
         runner_movements.append(msg)
 
         if target_base == 3:
-            if outs < 3:
+            if half.outs < 3:
                 runs_scored += 1
-                if is_top:
-                    score[team_a_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_a_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_a, bonus)
-                else:
-                    score[team_b_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_b_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_b, bonus)
-                play_by_play_message.append(
-                    f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
-                )
+                half.score_run(play_by_play_message)
                 # Runner scores; new_base remains None.
-                return ("score", runner_movements, runs_scored, play_by_play_message, outs, None)
+                return ("score", runs_scored, None)
         else:
             # For bases 0-2, set new_base accordingly.
             new_base = target_base if target_base in (0, 1, 2) else None
-            return ("safe", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+            return ("safe", runs_scored, new_base)
 
     # Otherwise, perform the baserunning roll.
     roll_result, total_roll = baserunning_roll(runner, active_defender)
@@ -608,28 +886,12 @@ def attempt_base_advancement(runner, current_base, target_base, defensive_positi
         # simply score the runner.
         starting_base = target_base if target_base == 0 else target_base - 1
         if target_base == 3:
-            if outs < 3:
+            if half.outs < 3:
                 runs_scored += 1
                 runner_movements.append(f"{format_player_status(runner)} scores!")
-                if is_top:
-                    score[team_a_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_a_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_a, bonus)
-                else:
-                    score[team_b_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_b_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_b, bonus)
-                play_by_play_message.append(
-                    f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
-                )
+                half.score_run(play_by_play_message)
             new_base = target_base
-            return ("score", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+            return ("score", runs_scored, new_base)
 
         # Otherwise, calculate the extra base target.
         if target_base != 3:
@@ -637,7 +899,7 @@ def attempt_base_advancement(runner, current_base, target_base, defensive_positi
         else:
             extra_target = 3
 
-        if occupied_bases.get(extra_target) is not None or frozen_bases.get(extra_target, False):
+        if (occupied | frozen) & (1 << extra_target):
             new_target = target_base
         else:
             new_target = extra_target
@@ -649,76 +911,43 @@ def attempt_base_advancement(runner, current_base, target_base, defensive_positi
 
         # If the new target is home (3), update scoring.
         if new_target == 3:
-            if outs < 3:
+            if half.outs < 3:
                 runs_scored += 1
                 runner_movements.append(f"{format_player_status(runner)} takes an extra base and scores!")
-                if is_top:
-                    score[team_a_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_a_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_a, bonus)
-                else:
-                    score[team_b_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_b_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_b, bonus)
-                play_by_play_message.append(
-                    f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
-                )
-            return ("score", runner_movements, runs_scored, play_by_play_message, outs, new_target)
+                half.score_run(play_by_play_message)
+            return ("score", runs_scored, new_target)
         else:
             new_base = new_target if new_target in (0, 1, 2) else None
-            return ("safe", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+            return ("safe", runs_scored, new_base)
 
     # --- Outcome: Safe Advance ---
     elif roll_result == "safe":
         if target_base == 3:
-            if outs < 3:
+            if half.outs < 3:
                 runs_scored += 1
                 runner_movements.append(f"{format_player_status(runner)} scores!")
-                if is_top:
-                    score[team_a_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_a_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_a, bonus)
-                else:
-                    score[team_b_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_b_name)
-                    if reduce_msg:
-                        play_by_play_message.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_b, bonus)
-                play_by_play_message.append(
-                    f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
-                )
-                return ("score", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+                half.score_run(play_by_play_message)
+                return ("score", runs_scored, new_base)
         else:
             new_base = target_base if target_base in (0, 1, 2) else None
-            return ("safe", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+            return ("safe", runs_scored, new_base)
 
     # --- Outcome: Collision ---
     elif roll_result == "collision":
         base_text = base_number_to_text(target_base)
-        if random.random() < 0.5:
+        if rng.baserunning.random() < 0.5:
             # Safe advancement: no injury processing here.
             runner_movements.append(
                 f"{format_player_status(runner)} collides with {format_player_status(active_defender)} but reaches {base_text} safely!"
             )
             new_base = target_base if target_base in (0, 1, 2) else None
-            return ("safe", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+            return ("safe", runs_scored, new_base)
         else:
             # Out on collision.
-            outs += 1
+            half.outs += 1
             collision_message = (
                 f"{format_player_status(runner)} collides with {format_player_status(active_defender)} and is tagged out at {base_text}!"
             )
-            frozen_bases[target_base] = True
             new_base = None
             knockout_message = ""
             angry_message = ""
@@ -728,38 +957,38 @@ def attempt_base_advancement(runner, current_base, target_base, defensive_positi
                 injury_chance += 0.2
             elif target_base == 3:
                 injury_chance += 0.4
-            if random.random() < injury_chance:
+            if rng.injury.random() < injury_chance:
                 # Determine which player is injured.
-                injured_player = active_defender if random.random() < 0.75 else runner
-                apply_injury_to_player(injured_player, "Collision Injury", team_a if injured_player == runner else team_b)
+                injured_player = active_defender if rng.injury.random() < 0.75 else runner
+                teams = half.game.teams
+                apply_injury_to_player(injured_player, "Collision Injury", teams[0] if injured_player == runner else teams[1])
                 # If the injured player is the defender (team_b), append extra text and possibly trigger a brawl.
                 if injured_player == active_defender:
                     angry_message = "The defense is angry..."
-                    maybe_trigger_brawl("collision", team_a, team_b, team_a_name, team_b_name, play_by_play_message, foul_mood)
+                    maybe_trigger_brawl("collision", half.game, play_by_play_message)
                 knockout_message = f"{injured_player.name} is knocked out from the collision!"
             runner_movements.append(collision_message)
             if knockout_message:
                 runner_movements.append(knockout_message)
             if angry_message:
                 runner_movements.append(angry_message)
-            return ("collision_out", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+            return ("collision_out", runs_scored, new_base)
 
     # --- Outcome: Close Call ---
     elif roll_result == "close_tag_out":
         base_text = base_number_to_text(target_base)
-        outs += 1
-        updated_bso = format_bso(0, 0, outs)
+        half.outs += 1
+        updated_bso = format_bso(0, 0, half.outs)
         runner_movements.append(
             f"It's a close call, but {format_player_status(runner)} is tagged out at {base_text}! The offense is brooding... {updated_bso}"
         )
-        frozen_bases[target_base] = True
         new_base = None
-        maybe_trigger_brawl("close_tag_out", team_a, team_b, team_a_name, team_b_name, play_by_play_message, foul_mood)
-        return ("close_call_out", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+        maybe_trigger_brawl("close_tag_out", half.game, play_by_play_message)
+        return ("close_call_out", runs_scored, new_base)
 
     # --- Outcome: Outs ---
     else:
-        outs += 1
+        half.outs += 1
         base_text = base_number_to_text(target_base)
         if assist_fielder is not None and expected_fielder is not None:
             message = (f"{position_names.get(assist_position, assist_position).capitalize()} {assist_fielder.name} fires a quick pass to "
@@ -769,39 +998,32 @@ def attempt_base_advancement(runner, current_base, target_base, defensive_positi
             runner_movements.append(message)
         else:
             runner_movements.append(f"{format_player_status(runner)} is tagged out at {base_text}!")
-        frozen_bases[target_base] = True
         new_base = None
-        return ("tag_out", runner_movements, runs_scored, play_by_play_message, outs, new_base)
+        return ("tag_out", runs_scored, new_base)
 
 #===== Baserunning ===== #
 def process_hit_with_correct_base_running(
+    half,
     batter,
-    potential_hit,  # expects strings like "potential_single", "potential_double", etc.
-    base_runners,   # list: index 0 = runner on first, 1 = second, 2 = third
-    is_top,
-    team_a_name,
-    team_b_name,
-    defensive_positions,
-    score,
-    team_a,
-    team_b,
-    foul_mood,
-    riled_up,
-    final_bso,
-    outs
+    potential_hit  # expects strings like "potential_single", "potential_double", etc.
 ):
-
+    """
+    Runs the bases for a hit: moves half.base_runners (index 0 = runner on
+    first, 1 = second, 2 = third), adding to half.outs and the score.
+    Returns (runs scored, play-by-play lines).
+    """
     allow_extra = True
+    base_runners = half.base_runners
 
     # --- New check to bypass processing if outcome is not a potential hit ---
     if not (potential_hit.startswith("potential_") or potential_hit == "home run"):
         # Outcome was something like "out", "fly out", etc.
         # Ensure the batter is removed from the bases (if present) and return the current state unchanged.
-        return (base_runners, 0, [], "", [], [], 0)
+        return 0, []
 
     # If the half-inning is over, return early.
-    if outs >= 3:
-        return (base_runners, 0, [], "", [], [], 0)
+    if half.outs >= 3:
+        return 0, []
 
     # --- Special Handling for Home Runs (when potential_hit is "home run") ---
     if potential_hit == "home run":
@@ -809,21 +1031,15 @@ def process_hit_with_correct_base_running(
         scoring_runners = sum(1 for r in base_runners if r is not None) + 1
         runners_scoring = [r.name for r in base_runners if r is not None] + [batter.name]
         # Update the score if outs < 3
-        if outs < 3:
-            if is_top:
-                score[team_a_name] += scoring_runners
-            else:
-                score[team_b_name] += scoring_runners
+        if half.outs < 3:
+            half.game.score[half.batting] += scoring_runners
         # Clear the bases
         updated_bases = [None, None, None]
         batter_movement = ""
         # Build the riled-down message by calling reduce_on_score
-        if is_top:
-            riled_message = riled_up.reduce_on_score(team_a_name)
-        else:
-            riled_message = riled_up.reduce_on_score(team_b_name)
+        riled_message = half.riled_up.reduce_on_score(half.team_name)
         # Build the current score update string.
-        score_update = f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
+        score_update = half.game.score_line()
         # Call the refactored describe_full_play to get the full message.
         play_description, event = describe_full_play(
             batter,
@@ -832,109 +1048,79 @@ def process_hit_with_correct_base_running(
             batter_movement,
             updated_bases,
             runners_scoring,
-            format_bso(0, 0, outs),
+            format_bso(0, 0, half.outs),
             score_update,
             riled_message
         )
-        play_by_play_message = [play_description]
-        return (updated_bases, scoring_runners, [], batter_movement, play_by_play_message, runners_scoring, 0)
+        half.base_runners = updated_bases
+        return scoring_runners, [play_description]
 
     # --- Determine Intended Advancement Based on Potential Hit ---
     # Base numbering: 0 = first, 1 = second, 2 = third, 3 = home plate.
-    if potential_hit == "potential_single" or potential_hit == "potential_bunt_hit":
-        intended_targets = {2: 3, 1: 2, 0: 1}  # runners: 3rd->home, 2nd->third, 1st->second
-        batter_target = 0  # batter reaches first
-    elif potential_hit == "potential_double":
-        intended_targets = {2: 3, 1: 3, 0: 2}  # 3rd->home, 2nd->home, 1st->second
-        batter_target = 1  # batter reaches second
-    elif potential_hit == "potential_triple":
-        intended_targets = {2: 3, 1: 3, 0: 3}  # all runners attempt to score (target = home)
-        batter_target = 2  # batter reaches third
-    else:
-        # Default to single if potential_hit is unrecognized.
-        intended_targets = {2: 3, 1: 2, 0: 1}
-        batter_target = 0
+    # Unrecognized hits are treated as singles.
+    intended_targets, batter_target = HIT_ADVANCES.get(potential_hit, HIT_ADVANCES["potential_single"])
 
     # --- Initialize Base State ---
-    # Map current base runners to base indices (0: first, 1: second, 2: third).
-    occupied_bases = {0: None, 1: None, 2: None, 3: None}
-    frozen_bases = {0: False, 1: False, 2: False, 3: False}
+    # Bases runners have safely reached, and bases frozen by an out there (masks over 0-3).
+    occupied = 0
+    frozen = 0
 
-    # We'll accumulate runner messages with sequence numbers.
-    ordered_runner_msgs = []          # list of (sequence, message)
-    seq_counter = 0                   # sequence counter for ordering
+    runner_movements = []
     play_by_play_message = []         # Additional messages (score updates, etc.)
     runners_scoring = []              # List of names for runners who score
     scoring_runners = 0
 
-    # Create a new dictionary for updated bases (indices 0,1,2)
-    new_bases = {0: None, 1: None, 2: None}
+    # The updated bases [first, second, third]
+    new_base_runners = [None, None, None]
 
     # --- Process Runners in Reverse Order ---
     # Process runner on third (base index 2), then second (1), then first (0)
-    frozen_bases = {0: False, 1: False, 2: False, 3: False}
-    for base_index in [2, 1, 0]:
+    for base_index in (2, 1, 0):
         runner = base_runners[base_index]
         if runner is None:
             continue
 
-        # Determine intended target for this runner.
-        intended_target = intended_targets.get(base_index)
-        if intended_target == 3 and frozen_bases[3]:
+        # Determine intended target for this runner, falling back past frozen bases.
+        intended_target = intended_targets[base_index]
+        if intended_target == 3 and frozen & 8:
             intended_target = 2
-        if intended_target == 2 and frozen_bases[2]:
+        if intended_target == 2 and frozen & 4:
             intended_target = 1
-        if intended_target == 1 and frozen_bases[1]:
+        if intended_target == 1 and frozen & 2:
             intended_target = 0
 
-        outcome, msgs, runs, pbp, outs, new_base = attempt_base_advancement(
-            runner, base_index, intended_target, defensive_positions,
-            occupied_bases, frozen_bases, is_top, score, team_a_name, team_b_name,
-            team_a, team_b, foul_mood, riled_up, final_bso, outs, allow_extra=allow_extra
+        outcome, runs, new_base = attempt_base_advancement(
+            half, runner, base_index, intended_target, occupied, frozen,
+            runner_movements, play_by_play_message, allow_extra=allow_extra
         )
 
-        for msg in msgs:
-            ordered_runner_msgs.append((seq_counter, msg))
-            seq_counter += 1
-
         scoring_runners += runs
         if outcome == "score":
             runners_scoring.append(runner.name)
-            # Runner scored; do not occupy any base.
-            # Optionally, clear the base from new_bases (it should be None anyway).
         elif outcome == "safe":
             # If new_base is provided (i.e. 0,1,2), then place the runner there.
             if new_base is not None:
-                new_bases[new_base] = runner
+                new_base_runners[new_base] = runner
             else:
                 # If no new_base was returned, keep the runner at his original base.
-                new_bases[base_index] = runner
-        elif outcome in ("frozen", "knocked out"):
-            # Runner is not on base.
-            pass
+                new_base_runners[base_index] = runner
+        elif outcome in BASERUNNING_OUTS:
+            frozen |= 1 << intended_target
 
-        play_by_play_message.extend(pbp)
-        # Also update the occupied_bases dictionary if needed:
-        # (This may be used for defenders; however, new_bases is what we'll use for base occupancy.)
         if outcome == "safe":
-            occupied_bases[intended_target] = runner
+            occupied |= 1 << intended_target
         else:
-            occupied_bases[base_index] = None
-
-    # Now extract the runner messages in order.
-    runner_movements = [msg for seq, msg in sorted(ordered_runner_msgs, key=lambda x: x[0])]
+            occupied &= ~(1 << base_index)
 
     # Adjust batter_target based on frozen bases.
-    if batter_target == 3 and frozen_bases[3]:
-        batter_target = 2
-    if batter_target == 2 and frozen_bases[2]:
+    if batter_target == 2 and frozen & 4:
         batter_target = 1
-    if batter_target == 1 and frozen_bases[1]:
+    if batter_target == 1 and frozen & 2:
         batter_target = 0
 
     # --- Assign Batter's Advancement ---
     if potential_hit not in ["home run", "near_miss_hr"]:
-        new_bases[batter_target] = batter
+        new_base_runners[batter_target] = batter
         if batter_target == 0:
             batter_movement = "reaching first base"
         elif batter_target == 1:
@@ -958,9 +1144,7 @@ def process_hit_with_correct_base_running(
         final_event = "double"
 
     # Use the current value of outs to build the final BSO display.
-    final_bso_display = format_bso(0, 0, outs)
-    # Convert new_bases to a list [first, second, third]
-    new_base_runners = [new_bases[0], new_bases[1], new_bases[2]]
+    final_bso_display = format_bso(0, 0, half.outs)
     play_description, new_event = describe_full_play(
          batter,
          final_event,
@@ -972,24 +1156,19 @@ def process_hit_with_correct_base_running(
     )
 
     play_by_play_message.insert(0, play_description)
-
-    return (new_base_runners,
-            scoring_runners,
-            runner_movements,
-            batter_movement,
-            play_by_play_message,
-            runners_scoring,
-            outs)
+    half.base_runners = new_base_runners
+    return scoring_runners, play_by_play_message
 
 #==== At-Bat Start ====
 
 #==== pickoff attempt ====
 def attempt_pickoff(runner, pitcher):
+    rng = current_rng()
     attempt_probability = max(pitcher.agility / 25, 0.02)
-    if random.random() >= attempt_probability:
+    if rng.baserunning.random() >= attempt_probability:
         return "no_attempt", 0
     pitcher_score = max(pitcher.pitching, pitcher.agility)
-    roll = random.randint(1, 100) + (pitcher_score - runner.baserunning)
+    roll = rng.baserunning.randint(1, 100) + (pitcher_score - runner.baserunning)
     if roll >= 80:
         outcome = "picked_off"
     elif roll >= 30:
@@ -1000,8 +1179,13 @@ def attempt_pickoff(runner, pitcher):
         outcome = "balk"
     return outcome, roll
 
-def process_pickoff_attempts(base_runners, pitcher, play_by_play_log, score, is_top, team_a_name,
-                             team_b_name, defensive_positions, balls, strikes, outs, riled_up, team_a, team_b):
+def process_pickoff_attempts(half, play_by_play_log):
+    """
+    Gives the pitcher one pickoff throw before an at-bat, updating half's bases,
+    outs and score. Returns whether the throw ended the half-inning.
+    """
+    base_runners = half.base_runners
+    pitcher = half.pitcher
     end_at_bat = False
     attempted_pickoff = False  # >>> ADD CODE HERE: flag to allow only one attempt per at-bat
     for base_index in [0, 1, 2]:
@@ -1009,16 +1193,16 @@ def process_pickoff_attempts(base_runners, pitcher, play_by_play_log, score, is_
             break  # >>> ADD CODE HERE: exit loop if an attempt has been made
         runner = base_runners[base_index]
         if runner is not None and is_active(runner, ignore_exhausted_for_batting=True):
-            result, roll = attempt_pickoff(runner, defensive_positions.get("pitcher"))
+            result, roll = attempt_pickoff(runner, half.defensive_positions.get("pitcher"))
             attempted_pickoff = True  # >>> ADD CODE HERE: mark that we've attempted a pickoff
             base_text = base_number_to_text(base_index)
             if result == "picked_off":
                 base_runners[base_index] = None
-                outs += 1
-                updated_bso = format_bso(balls, strikes, outs)
+                half.outs += 1
+                updated_bso = format_bso(0, 0, half.outs)
                 play_by_play_log.append(f"⚾ Pitcher {pitcher.name} spins around and throws to {base_text}... OUT! "
                                         f"{format_player_status(runner)} is picked off! {updated_bso}")
-                if outs >= 3:
+                if half.outs >= 3:
                     end_at_bat = True
                     break
 
@@ -1028,38 +1212,14 @@ def process_pickoff_attempts(base_runners, pitcher, play_by_play_log, score, is_
                     f"runs back just in time. Safe!")
 
             elif result == "balk":
-                new_bases = [None, None, None]
-                scored = False
-                scoring_runner_name = ""
-                # If there's a runner on third, they score.
-                if base_runners[2] is not None:
-                    scored = True
-                    scoring_runner_name = base_runners[2].name
-                    if is_top:
-                        score[team_a_name] += 1
-                    else:
-                        score[team_b_name] += 1
                 # Advance runners: runner on second moves to third, runner on first moves to second.
-                new_bases[2] = base_runners[1]
-                new_bases[1] = base_runners[0]
-                base_runners = new_bases
-                if scored:
+                # If there's a runner on third, they score.
+                scoring_runner = advance_all_runners(base_runners)
+                if scoring_runner is not None:
                     play_by_play_log.append(
-                        f"Pitcher {pitcher.name} slips up on the mound... and it's a balk! All baserunners advance. {scoring_runner_name} scores! {display_bases_as_squares(base_runners)}"
+                        f"Pitcher {pitcher.name} slips up on the mound... and it's a balk! All baserunners advance. {scoring_runner.name} scores! {display_bases_as_squares(base_runners)}"
                     )
-                    if is_top:
-                        reduce_msg = riled_up.reduce_on_score(team_a_name)
-                    else:
-                        reduce_msg = riled_up.reduce_on_score(team_b_name)
-                    if reduce_msg:
-                        play_by_play_log.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        if is_top:
-                            apply_riled_buff(team_a, bonus)
-                        else:
-                            apply_riled_buff(team_b, bonus)
-                    score_line = f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
-                    play_by_play_log.append(score_line)
+                    half.score_run(play_by_play_log)
                 else:
                     play_by_play_log.append(
                         f"{pitcher.name} slips up on the mound... and it's a balk! All baserunners advance. {display_bases_as_squares(base_runners)}"
@@ -1067,35 +1227,37 @@ def process_pickoff_attempts(base_runners, pitcher, play_by_play_log, score, is_
 
             elif result == "no_attempt":
                 pass
-    return base_runners, score, outs, end_at_bat
+    return end_at_bat
 
-def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defensive_positions,
-                               is_top, team_a_name, team_b_name, score, team_a, team_b, riled_up,
-                               declared=True, foul_mood=None):
+def at_bat_with_pitch_sequence(half, batter, declared=True):
     """
     Process an at-bat pitch-by-pitch. In this reworked version, we delay the termination of the pitch loop
     when the third out is reached, so that we can log all events leading up to that moment.
+    The bases, outs and score in half are updated in place; returns (result, pitch-by-pitch lines).
     """
-    if foul_mood is None:
-        foul_mood = FoulMood()  # Create a new instance if none is passed in
+    rng = current_rng()
+    events = metrics_state.events
+    watchdog = watchdog_state.watchdog
+    game = half.game
+    pitcher = half.pitcher
+    base_runners = half.base_runners
+    foul_mood = game.foul_mood
     # Reset the at-bat consecutive foul state (but leave bonus intact)
     foul_mood.reset_per_atbat()
     foul_count = 0
     strikes = 0
     balls = 0
     pitches = []
-    scoring_names = []
 
     if declared:
-        team_name = team_a_name if is_top else team_b_name
-        pitches.append(batter_status_message(batter, team_name))
+        pitches.append(batter_status_message(batter, half.team_name))
 
 # --- Bunt Attempt: for batters with low power and if a runner is on third base ---
-    if batter.power <= batter.chutzpah and base_runners[2] is not None and current_outs < 2:
+    if batter.power <= batter.chutzpah and base_runners[2] is not None and half.outs < 2:
         base_bunt_probability = 0.05 + (batter.chutzpah * 0.05)
         adjusted_bunt_probability = base_bunt_probability + (base_runners[2].baserunning * 0.02)
-        if random.random() < adjusted_bunt_probability:
-            bunt_outcome = random.randint(1, 100) + batter.batting + batter.chutzpah
+        if rng.pitch.random() < adjusted_bunt_probability:
+            bunt_outcome = rng.pitch.randint(1, 100) + batter.batting + batter.chutzpah
             # Determine which base is eligible for scoring; prioritize third.
             if base_runners[2] is not None:
                 scoring_runner_index = 2
@@ -1107,7 +1269,7 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
             # Bunt Hit: Batter bunts successfully.
             if bunt_outcome >= 86:
                 # Instead of custom advancement, treat the outcome as a potential bunt.
-                return "potential_bunt_hit", base_runners, pitches, current_outs, balls, strikes, []
+                return "potential_bunt_hit", pitches
 
             # Sacrifice Bunt: Batter bunts, is put out, but a runner (typically on third) scores.
             elif bunt_outcome >= 16:
@@ -1119,43 +1281,26 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                 # Advance remaining runners one base:
                 # - Runner on first moves to second;
                 # - Runner on second moves to third.
-                new_bases = [None, None, None]
-                if base_runners[0] is not None:
-                    new_bases[1] = base_runners[0]
-                if base_runners[1] is not None:
-                    new_bases[2] = base_runners[1]
+                advance_all_runners(base_runners)
                 # Batter is recorded as an out.
-                current_outs += 1
+                half.outs += 1
 
                 # Construct and append the bunt outcome message first.
-                bso_display = format_bso(balls, strikes, current_outs)
+                bso_display = format_bso(balls, strikes, half.outs)
                 bunt_msg = f"{format_player_status(batter)} makes a sacrifice bunt play! {batter.name} is out, but "
                 if scored_runner is not None:
                     bunt_msg += f"{scored_runner.name} scores! "
                 else:
                     bunt_msg += "the runners advance! "
-                bunt_msg += f"{display_bases_as_squares(new_bases)} {bso_display}"
+                bunt_msg += f"{display_bases_as_squares(base_runners)} {bso_display}"
                 pitches.append(bunt_msg)
 
-                # Now, if a runner scored, update score and log the riled down message.
+                # Now, if a runner scored, update score and log the riled down message and the new score.
                 if scored_runner is not None:
-                    if is_top:
-                        score[team_a_name] += 1
-                    else:
-                        score[team_b_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_a_name if is_top else team_b_name)
-                    if reduce_msg:
-                        pitches.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        if is_top:
-                            apply_riled_buff(team_a, bonus)
-                        else:
-                            apply_riled_buff(team_b, bonus)
-
-                # Finally, append the current score update.
-                score_line = f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
-                pitches.append(score_line)
-                return "bunt_out", new_bases, pitches, current_outs, balls, strikes, []
+                    half.score_run(pitches)
+                else:
+                    pitches.append(half.game.score_line())
+                return "bunt_out", pitches
 
             # Awry Bunt: The bunt goes awry, resulting in a double play.
             else:
@@ -1164,23 +1309,32 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                     base_runners[scoring_runner_index] = None
                 else:
                     runner_name = "runner"
-                current_outs += 2  # Both the batter and a runner are out.
-                bso_display = format_bso(balls, strikes, current_outs)
+                half.outs += 2  # Both the batter and a runner are out.
+                bso_display = format_bso(balls, strikes, half.outs)
                 bunt_msg = (f"{format_player_status(batter)} attempts a bunt but it goes awry! Double play: both {batter.name} and "
                             f"{runner_name} are out. {display_bases_as_squares(base_runners)} {bso_display}")
                 pitches.append(bunt_msg)
-                return "bunt_dp", base_runners, pitches, current_outs, balls, strikes, []
+                return "bunt_dp", pitches
 
     # --- Process pitch-by-pitch outcomes ---
+    pitch_number = 0
     while strikes < 3 and balls < 4:
         # Reset heat effect for the current pitch.
         heat_message = ""
         heat_printed = False
-
-        # Roll for the pitch.
-        raw_roll = random.randint(1, 100)
+        pitch_number += 1
+        game.pitch_number = pitch_number
+        if watchdog:
+            watchdog.pitch()
+
+        # Roll for the pitch, from the first_pitch or later_pitch site (see rng.py).
+        raw_roll = (rng.first_pitch if pitch_number == 1 else rng.later_pitch).randint(1, 100)
+        if events:
+            events.pitches += 1
         roll = raw_roll + (batter.batting - pitcher.pitching)
-        heat_roll = random.randint(1, 100)
+        # On a raw 75 the heat roll and beaning check use the beaning site (see rng.py).
+        beaning_stream = rng.beaning if raw_roll == 75 else rng.pitch
+        heat_roll = beaning_stream.randint(1, 100)
         heat_triggered = False
         heat_message = ""
         if heat_roll <= pitcher.power:
@@ -1190,7 +1344,7 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
 
         # --- LUCKY OUTCOMES ---
         # Beaned walk: raw_roll == 75 and 25% chance
-        if raw_roll == 75 and random.random() < 0.25:
+        if raw_roll == 75 and rng.beaning.random() < 0.25:
             foul_mood.update(False)
             if heat_triggered:
                 incineration_msg = (f"{heat_message}\n"
@@ -1199,29 +1353,23 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                 pitches.append(incineration_msg)
                 batter.pending_death = True
                 # Use 'pitches' instead of play_by_play_message so the brawl log is not lost.
-                maybe_trigger_brawl("incinerated", team_a, team_b, team_a_name, team_b_name, pitches, foul_mood)
-                return "incinerated", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                maybe_trigger_brawl("incinerated", half.game, pitches)
+                return "incinerated", pitches
             else:
-                return "beaned_walk", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "beaned_walk", pitches
 
         # Near-miss home run: raw_roll == 100 with 50% chance.
-        if raw_roll == 100 and random.random() <= 0.5:
+        if raw_roll == 100 and rng.pitch.random() <= 0.5:
             foul_mood.update(False)
-            bso_display = format_bso(balls, strikes, current_outs)
+            bso_display = format_bso(balls, strikes, half.outs)
             event = "near_miss_hr"
             scoring_names = [runner.name for runner in base_runners if runner is not None] + [batter.name]
             scoring = len(scoring_names)
-            if is_top:
-                score[team_a_name] += scoring
-            else:
-                score[team_b_name] += scoring
+            half.game.score[half.batting] += scoring
             new_bases = [None, None, None]
-            score_update_msg = f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
+            score_update_msg = half.game.score_line()
             # The riled-up message comes directly via the reduce_on_score call.
-            if is_top:
-                riled_message = riled_up.reduce_on_score(team_a_name)
-            else:
-                riled_message = riled_up.reduce_on_score(team_b_name)
+            riled_message = half.riled_up.reduce_on_score(half.team_name)
             play_description, event = describe_full_play(
                 batter,
                 "near_miss_hr",
@@ -1234,24 +1382,19 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                 riled_message
             )
             pitches.append(play_description)
-            return event, new_bases, pitches, current_outs, balls, strikes, scoring_names
+            half.base_runners = new_bases
+            return event, pitches
 
         # STEP 3: If the roll is very high (>= 101), it's an automatic home run.
         if roll >= 101:
             foul_mood.update(False)
-            bso_display = format_bso(balls, strikes, current_outs)
+            bso_display = format_bso(balls, strikes, half.outs)
             scoring_names = [runner.name for runner in base_runners if runner is not None] + [batter.name]
             scoring = len(scoring_names)
-            if is_top:
-                score[team_a_name] += scoring
-            else:
-                score[team_b_name] += scoring
+            half.game.score[half.batting] += scoring
             new_bases = [None, None, None]
-            if is_top:
-                riled_message = riled_up.reduce_on_score(team_a_name)
-            else:
-                riled_message = riled_up.reduce_on_score(team_b_name)
-            score_update_msg = f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
+            riled_message = half.riled_up.reduce_on_score(half.team_name)
+            score_update_msg = half.game.score_line()
             play_description, event = describe_full_play(
                 batter,
                 "home run",
@@ -1264,32 +1407,27 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                 riled_message
             )
             pitches.append(play_description)
-            return "home run", new_bases, pitches, current_outs, balls, strikes, scoring_names
+            half.base_runners = new_bases
+            return "home run", pitches
 
         # STEP 4: Check for the POWER system opportunity.
         # If (roll equals 100 and batter.power is at least 1) or (roll equals 99 and batter.power >= 6),
         # then try a second roll to determine if the power-adjusted home run happens.
         if (roll == 100 and batter.power >= 1) or (roll == 99 and batter.power >= 6):
             if batter.power < 6:
-                second_roll = random.randint(1, 5)
+                second_roll = rng.pitch.randint(1, 5)
             else:
-                second_roll = random.randint(6, 10)
+                second_roll = rng.pitch.randint(6, 10)
             if second_roll <= batter.power:
                 # Home run via power.
                 foul_mood.update(False)
-                bso_display = format_bso(balls, strikes, current_outs)
+                bso_display = format_bso(balls, strikes, half.outs)
                 scoring_names = [runner.name for runner in base_runners if runner is not None] + [batter.name]
                 scoring = len(scoring_names)
-                if is_top:
-                    score[team_a_name] += scoring
-                else:
-                    score[team_b_name] += scoring
+                half.game.score[half.batting] += scoring
                 new_bases = [None, None, None]
-                if is_top:
-                    riled_message = riled_up.reduce_on_score(team_a_name)
-                else:
-                    riled_message = riled_up.reduce_on_score(team_b_name)
-                score_update_msg = f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}"
+                riled_message = half.riled_up.reduce_on_score(half.team_name)
+                score_update_msg = half.game.score_line()
                 play_description, event = describe_full_play(
                     batter,
                     "home run",
@@ -1302,14 +1440,17 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                     riled_message
                 )
                 pitches.append(play_description)
-                return "home run", new_bases, pitches, current_outs, balls, strikes, scoring_names
+                half.base_runners = new_bases
+                return "home run", pitches
             # If the power-based chance fails, continue on to the next step.
 
         # STEP 5: Determine whether a contact attempt is made.
         # A roll of 67 or greater (after score adjustments) triggers a second roll to attempt a hit.
         if roll >= 60:
             # The contact roll is contested between batting and chutzpah
-            rand_val = random.randint(1, 100)
+            # The contact roll uses the contact site, or the foul_streak site deep into a foul streak (see rng.py).
+            contact_stream = rng.foul_streak if foul_count >= 3 else rng.contact
+            rand_val = contact_stream.randint(1, 100)
             contact_roll = rand_val + (batter.batting - pitcher.chutzpah)
 
             # Compute the whole-number agility bonus.
@@ -1325,15 +1466,15 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
             if batter.agility % 2 == 1:
                 # Potential triple check:
                 if contact_roll == triple_threshold:
-                    if random.random() >= 0.5:
+                    if rng.pitch.random() >= 0.5:
                         base_bonus += 1
                 # Potential double check:
                 elif contact_roll == double_threshold:
-                    if random.random() >= 0.5:
+                    if rng.pitch.random() >= 0.5:
                         base_bonus += 1
                 # Potential single check:
                 elif contact_roll == single_threshold:
-                    if random.random() >= 0.5:
+                    if rng.pitch.random() >= 0.5:
                         base_bonus += 1
 
             # Now recalculate effective thresholds using the (possibly upgraded) bonus.
@@ -1342,24 +1483,24 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
             effective_single_threshold = 55 - base_bonus
 
             if contact_roll >= effective_triple_threshold:
-                return "potential_triple", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "potential_triple", pitches
             elif contact_roll >= effective_double_threshold:
-                return "potential_double", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "potential_double", pitches
             elif contact_roll >= effective_single_threshold:
-                return "potential_single", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "potential_single", pitches
             elif contact_roll >= 35:
                 foul_count += 1
                 if foul_count >= 6:
-                    bso_display = format_bso(balls, strikes, current_outs)
+                    bso_display = format_bso(balls, strikes, half.outs)
                     pitches.append(f"{format_player_status(batter)} - Foul Ball! {bso_display}")
                     pitches.append(
                         f"⚡ THE GODS ARE FED UP WITH {format_player_status(batter)}'s FOULS! {format_player_status(batter)} is SMITED! ⚡")
                     batter.pending_death = True
-                    return "foul_limit_out", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                    return "foul_limit_out", pitches
                 else:
                     if strikes < 2:
                         strikes += 1
-                    bso_display = format_bso(balls, strikes, current_outs)
+                    bso_display = format_bso(balls, strikes, half.outs)
                     pitches.append(f"{format_player_status(batter)} - Foul Ball! {bso_display}")
                     bonus_increased = foul_mood.update(True)
                     if bonus_increased:
@@ -1369,20 +1510,20 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
             elif contact_roll >= 16:
                 # Fly ball or pop-out.
                 foul_mood.update(False)
-                current_outs += 1
-                bso_display = format_bso(balls, strikes, current_outs)
-                out_description = random.choice([
+                half.outs += 1
+                bso_display = format_bso(balls, strikes, half.outs)
+                out_description = rng.flavor.choice([
                     "sends the ball a bit too high... Flyout!",
                     "pops it up and the ball is caught infield. Popout!",
                     "lines it sharply for a Line Out!"
                 ])
                 pitches.append(f"{format_player_status(batter)} {out_description} {bso_display}")
-                return "fly out", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "fly out", pitches
             else:
                 # The ball is hit on the ground (line/ground out).
                 foul_mood.update(False)
-                current_outs += 1
-                bso_display = format_bso(balls, strikes, current_outs)
+                half.outs += 1
+                bso_display = format_bso(balls, strikes, half.outs)
                 default_ground_message = "Ground Out!"
                 flavor_ground_messages = [
                     "chops it to the infield. Ground Out!",
@@ -1392,7 +1533,7 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                 combined_msg = f"{format_player_status(batter)} - {default_ground_message} {bso_display}"
                 base_tag_chance = 0.20
                 extra_bonus = 0
-                shortstop = defensive_positions.get("shortstop")
+                shortstop = half.defensive_positions.get("shortstop")
                 if shortstop is not None and is_active(shortstop, ignore_exhausted_for_batting=True):
                     extra_bonus = shortstop.fielding * 0.02
                     shortstop_name = shortstop.name
@@ -1403,11 +1544,11 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                 shortstop_called = False
                 for base_idx, runner in enumerate(base_runners):
                     if runner is not None:
-                        if random.random() < extra_tag_chance:
+                        if rng.baserunning.random() < extra_tag_chance:
                             tag_occurred = True
                             base_text = base_number_to_text(base_idx)
-                            current_outs += 1
-                            bso_display = format_bso(balls, strikes, current_outs)
+                            half.outs += 1
+                            bso_display = format_bso(balls, strikes, half.outs)
                             if not shortstop_called:
                                 tag_msg = f" {format_player_status(runner)} is caught in a rundown and tagged out by {shortstop_name} at {base_text}! {bso_display}"
                                 shortstop_called = True
@@ -1416,10 +1557,10 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
                             combined_msg += tag_msg
                             base_runners[base_idx] = None
                 if not tag_occurred:
-                    ground_text = random.choice(flavor_ground_messages)
+                    ground_text = rng.flavor.choice(flavor_ground_messages)
                     combined_msg = f"{format_player_status(batter)} {ground_text} {bso_display}"
                 pitches.append(combined_msg)
-                return "ground out", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "ground out", pitches
 
         # STEP 6: If roll is less than 67, the batter does not make contact.
         # We now use the CHUTZPAH system to decide a ball versus a strike.
@@ -1427,38 +1568,38 @@ def at_bat_with_pitch_sequence(batter, pitcher, base_runners, current_outs, defe
         ball_threshold = max(23, 33 - batter.chutzpah)
         if roll >= ball_threshold:
             balls += 1
-            bso_display = format_bso(balls, strikes, current_outs)
+            bso_display = format_bso(balls, strikes, half.outs)
             pitches.append(f"{format_player_status(batter)} - Ball {balls}! {bso_display}")
             if balls == 4:
-                return ("walk", base_runners, pitches, current_outs, balls, strikes, scoring_names)
+                return "walk", pitches
             continue
         else:
             # Determine whether the batter is looking or swinging
-            strike_type = "looking" if random.random() < 0.67 else "swinging"
+            strike_type = "looking" if rng.flavor.random() < 0.67 else "swinging"
             # Build a heat message prefix if the heat effect was triggered earlier
             heat_prefix = f"{heat_message}\n" if heat_triggered else ""
             # If this is the third strike (i.e., strikes are already 2)
             if strikes == 2:
                 strikes += 1  # now reaching 3 strikes
-                current_outs += 1
-                bso_display = format_bso(balls, strikes, current_outs)
+                half.outs += 1
+                bso_display = format_bso(balls, strikes, half.outs)
                 outcome_message = (
                     f"{heat_prefix}{format_player_status(batter)} - Strike 3! {batter.name} strikes out, {strike_type}. "
                     f"{bso_display}"
                 )
                 pitches.append(outcome_message)
-                return "strike_out", base_runners, pitches, current_outs, balls, strikes, scoring_names
+                return "strike_out", pitches
             else:
                 # Otherwise, increment the strike count and log the strike outcome
                 strikes += 1
-                bso_display = format_bso(balls, strikes, current_outs)
+                bso_display = format_bso(balls, strikes, half.outs)
                 outcome_message = f"{heat_prefix}{format_player_status(batter)} - Strike {strikes}! {bso_display}"
                 pitches.append(outcome_message)
             continue
 
     print("Warning: at_bat_with_pitch_sequence reached the end without returning a result!")
-    print(f"batter: {batter.name}, balls: {balls}, strikes: {strikes}, outs: {current_outs}")
-    return "error", base_runners, pitches, current_outs, balls, strikes, scoring_names
+    print(f"batter: {batter.name}, balls: {balls}, strikes: {strikes}, outs: {half.outs}")
+    return "error", pitches
 
 # === Brawl System === #
 # Base chances (in percentages) for various brawl-triggering events.
@@ -1471,28 +1612,40 @@ BRAWL_BASE_CHANCES = {
                      "strike_out", "fly out", "ground out", "home run"], -50)
 }
 
-def maybe_trigger_brawl(event_type, team_a, team_b, team_a_name, team_b_name, log, foul_mood):
+def maybe_trigger_brawl(event_type, game, log):
+    rng = current_rng()
     if event_type in BRAWL_BASE_CHANCES:
         base_chance = BRAWL_BASE_CHANCES[event_type]
+        foul_mood = game.foul_mood
         bonus = foul_mood.get_bonus()
         chance = max(0, min(100, base_chance + bonus))
-        roll = random.randint(1, 100)
+        roll = rng.brawl.randint(1, 100)
         if roll <= chance:
-            brawl_log = simulate_brawl(team_a, team_b, team_a_name, team_b_name)
+            timer = timing_state.timer
+            if timer:
+                timer.enter("brawls")
+            events = metrics_state.events
+            if events:
+                events.brawls += 1
+            team_a, team_b = game.teams
+            brawl_log = simulate_brawl(team_a, team_b, *game.team_names)
             log.extend(brawl_log)
             finalize_pending_deaths(team_a)
             finalize_pending_deaths(team_b)
             foul_mood.reset()
+            if timer:
+                timer.exit()
 
 def simulate_brawl(team_a, team_b, team_a_name, team_b_name):
+    rng = current_rng()
     log = []
     log.append("💪 A BRAWL HAS ERUPTED ON THE FIELD! 💪")
     team_a_brawlers = simulate_brawl_team(team_a)
     team_b_brawlers = simulate_brawl_team(team_b)
-    random.shuffle(team_a_brawlers)
-    random.shuffle(team_b_brawlers)
-    team_a_total = sum(b['score'] for b in team_a_brawlers) + random.randint(1, 100)
-    team_b_total = sum(b['score'] for b in team_b_brawlers) + random.randint(1, 100)
+    rng.brawl.shuffle(team_a_brawlers)
+    rng.brawl.shuffle(team_b_brawlers)
+    team_a_total = sum(b['score'] for b in team_a_brawlers) + rng.brawl.randint(1, 100)
+    team_b_total = sum(b['score'] for b in team_b_brawlers) + rng.brawl.randint(1, 100)
     log.append(f"{team_a_name} ({team_a_total}) vs {team_b_name} ({team_b_total})")
     if team_a_total > team_b_total:
         margin = team_a_total - team_b_total
@@ -1511,7 +1664,7 @@ def simulate_brawl(team_a, team_b, team_a_name, team_b_name):
     for i in range(casualties_team_a):
         if i >= len(team_a_brawlers):
             break
-        roll = random.randint(1, 100)
+        roll = rng.casualty.randint(1, 100)
         outcome = resolve_injury(roll)
         if team_a_total > team_b_total and outcome in ["Knocked Out", "Killed"]:
             outcome = "Injured"
@@ -1523,7 +1676,7 @@ def simulate_brawl(team_a, team_b, team_a_name, team_b_name):
     for i in range(casualties_team_b):
         if i >= len(team_b_brawlers):
             break
-        roll = random.randint(1, 100)
+        roll = rng.casualty.randint(1, 100)
         outcome = resolve_injury(roll)
         if team_b_total > team_a_total and outcome in ["Knocked Out", "Killed"]:
             outcome = "Injured"
@@ -1589,10 +1742,9 @@ def simulate_brawl(team_a, team_b, team_a_name, team_b_name):
 
 def simulate_brawl_team(team):
     results = []
-    for player in team:
-        if is_active(player):
-            score_val = player.brawling
-            results.append({"player": player, "score": score_val})
+    for player in active_players(team):
+        score_val = player.brawling
+        results.append({"player": player, "score": score_val})
     return results
 
 def calculate_num_injuries(score_diff):
@@ -1616,12 +1768,16 @@ def apply_injury_to_player(player, outcome, team):
         return
     if hasattr(player, "knockout_halves_remaining") and player.knockout_halves_remaining > 0:
         return
+    events = metrics_state.events
+    if events and injury_tier(outcome):
+        events.injuries[injury_tier(outcome)] += 1
 
     if outcome.startswith("Killed"):
         player.pending_death = True
         return
     elif outcome.startswith("Knocked Out") or outcome.startswith("Collision"):
         player.knockout_halves_remaining = 5
+        refresh_status(player)
         return
 
     # Determine reduction and corresponding new injury status.
@@ -1649,6 +1805,7 @@ def calculate_recovery_chance(player):
 
 def update_injury_status(team, team_name, recovery_messages):
     # Define the order of injury tiers and the associated reduction values.
+    rng = current_rng()
     tier_order = ["Knocked Out", "Injured", "Shook Up", "Winded"]
     injury_reductions = {
          "Winded": 2,
@@ -1672,19 +1829,20 @@ def update_injury_status(team, team_name, recovery_messages):
             base_chance = calculate_recovery_chance(player)
             effective_chance = min(1.0, base_chance + player.recovery_bonus)
             # Full recovery: 5% chance on a 1d100 roll
-            if random.randint(1, 100) <= 5:
+            if rng.injury.randint(1, 100) <= 5:
                 player.injury_status = None
                 player.injury_debuff = 0
                 update_player_stats(player)
                 if hasattr(player, "knockout_halves_remaining"):
                     delattr(player, "knockout_halves_remaining")
+                    refresh_status(player)
                 recovery_messages.append(
                     f"💖 {player.name} makes an extraordinary recovery and is fully healed!"
                 )
                 player.recovery_bonus = 0.0
             else:
                 # Attempt partial recovery using an effective roll (0-1)
-                effective_roll = random.uniform(0, 1)
+                effective_roll = rng.injury.uniform(0, 1)
                 if effective_roll < effective_chance:
                     if current_tier in tier_order:
                         current_index = tier_order.index(current_tier)
@@ -1695,6 +1853,7 @@ def update_injury_status(team, team_name, recovery_messages):
                     player.injury_status = new_status
                     if current_tier == "Knocked Out" and hasattr(player, "knockout_halves_remaining"):
                         delattr(player, "knockout_halves_remaining")
+                        refresh_status(player)
                     if new_status is None:
                         player.injury_debuff = 0
                         update_player_stats(player)
@@ -1712,6 +1871,7 @@ def get_hit_description(hit_type, batter_name):
     """
     Returns a randomized description string based on the hit type.
     """
+    rng = current_rng()
     single_descriptions = [
         f"{batter_name} punches a single through the infield,",
         f"{batter_name} rolls a single past the diving infielder,",
@@ -1745,13 +1905,13 @@ def get_hit_description(hit_type, batter_name):
     ]
 
     if hit_type == "single":
-        return random.choice(single_descriptions)
+        return rng.flavor.choice(single_descriptions)
     elif hit_type == "double":
-        return random.choice(double_descriptions)
+        return rng.flavor.choice(double_descriptions)
     elif hit_type == "triple":
-        return random.choice(triple_descriptions)
+        return rng.flavor.choice(triple_descriptions)
     elif hit_type == "bunt_hit":
-        return random.choice(bunt_descriptions)
+        return rng.flavor.choice(bunt_descriptions)
     # For home runs, the description is handled separately.
     raise ValueError(f"Unhandled hit type: {hit_type}")
 
@@ -1772,6 +1932,23 @@ def format_scorers(scorers):
 def describe_full_play(batter, hit_type, runner_movements, batter_movement, base_runners,
                          runners_scoring=[], final_bso="", score_update="", riled_message=""):
     """
+    Build a complete play-by-play description for a hit (timed as log rendering, see phase_timing.py).
+    """
+    timer = timing_state.timer
+    if not timer:
+        return _describe_full_play(batter, hit_type, runner_movements, batter_movement, base_runners,
+                                   runners_scoring, final_bso, score_update, riled_message)
+    timer.enter("log_rendering")
+    try:
+        return _describe_full_play(batter, hit_type, runner_movements, batter_movement, base_runners,
+                                   runners_scoring, final_bso, score_update, riled_message)
+    finally:
+        timer.exit()
+
+
+def _describe_full_play(batter, hit_type, runner_movements, batter_movement, base_runners,
+                        runners_scoring, final_bso, score_update, riled_message):
+    """
     Build a complete play-by-play description for a hit.
 
     For home runs and near-miss HRs, the output will be built as:
@@ -1838,98 +2015,113 @@ def describe_full_play(batter, hit_type, runner_movements, batter_movement, base
         return base_desc, event
 
 #====== Half Innings ======#
-def half_inning_with_fixed_base_running(
-    team_name,
-    batting_order,
-    pitcher,
-    base_runners,
-    current_batter_index,
-    inning,
-    is_top,
-    team_a_name,
-    team_b_name,
-    defensive_positions,
-    score,
-    team_a,
-    team_b,
-    riled_up,
-    foul_mood=None,
-    suppress_riled=False
-):
+def half_inning_with_fixed_base_running(game, inning, is_top, pitcher, defensive_positions, suppress_riled=False):
+    """
+    Play one half-inning of game: team 0 bats at the top, team 1 at the bottom,
+    against pitcher and defensive_positions. The score and the batting team's
+    batter count in game are updated in place.
+    Returns the play-by-play lines and whether the batting team forfeited.
+    """
+    rng = current_rng()
+    game.inning = inning
+    # Phase timing hooks (see phase_timing.py); a no-op unless a timer is set.
+    timer = timing_state.timer
+    events = metrics_state.events
+    watchdog = watchdog_state.watchdog
+    # The bases start empty and the outs at zero.
+    half = game.half = HalfInningState(game, is_top, pitcher, defensive_positions)
+    batting = half.batting
+    team_name = half.team_name
+    riled_up = half.riled_up
+    team_a, team_b = game.teams
+    team_a_name, team_b_name = game.team_names
+    batting_order = game.teams[batting]
+    score = game.score
+    if events:
+        runs_before = score[batting]
     play_by_play_log = []
-    # Reset bases at the start of the half–inning.
-    base_runners = [None, None, None]
-    balls = 0
-    strikes = 0
-    outs = 0
-    inning_score = 0
-    bso_display = format_bso(balls, strikes, outs)
     # Update injury statuses and capture recovery messages.
     recovery_messages = []
+    if timer:
+        timer.enter("injury_recovery")
     update_injury_status(team_a, team_a_name, recovery_messages)
     update_injury_status(team_b, team_b_name, recovery_messages)
+    if timer:
+        timer.exit()
     play_by_play_log.extend(recovery_messages)
-    # Ensure we have a FoulMood instance.
-    if foul_mood is None:
-        foul_mood = FoulMood()
     # Decrement knockout timers for players on both teams.
-    for player in team_a:
-        if hasattr(player, 'knockout_halves_remaining') and player.knockout_halves_remaining > 0:
-            player.knockout_halves_remaining -= 1
-    for player in team_b:
-        if hasattr(player, 'knockout_halves_remaining') and player.knockout_halves_remaining > 0:
-            player.knockout_halves_remaining -= 1
+    if timer:
+        timer.enter("knockout_decrement")
+    for player in knocked_out_players(team_a) + knocked_out_players(team_b):
+        player.knockout_halves_remaining -= 1
+        if player.knockout_halves_remaining == 0:
+            refresh_status(player)
+    if timer:
+        timer.exit()
     # Auto-forfeit: if there are no batters left, forfeit immediately.
     if len(batting_order) == 0:
         play_by_play_log = [f"{team_name} has no players left and must forfeit immediately!"]
-        return 0, current_batter_index, play_by_play_log, True
+        return play_by_play_log, True
 
     # Initialize state variables for batter selection once per half–inning:
     batters_remaining = batting_order.copy()
     last_batter = None
 
     while True:
+        if watchdog:
+            watchdog.plate_appearance()
+        if timer:
+            timer.enter("batter_selection")
         # Forfeit if no active batters remain.
-        if not any(is_active(b, ignore_exhausted_for_batting=True) for b in batting_order):
+        if not any_active(batting_order):
+            if timer:
+                timer.exit()
             play_by_play_log.append(f"{team_name} has no active players left and must forfeit immediately!")
-            return inning_score, current_batter_index, play_by_play_log, True
+            return play_by_play_log, True
 
         # --- BATTER SELECTION (State Management) ---
-        eligible_batters = [b for b in batting_order if is_active(b, ignore_exhausted_for_batting=True)]
+        eligible_batters = active_players(batting_order)
+        base_runners = half.base_runners
         current_baserunners = [runner for runner in base_runners if runner is not None]
         batter, batters_remaining = get_next_batter(eligible_batters, last_batter, batters_remaining,
                                                     current_baserunners)
         last_batter = batter
-
+        game.batter = batter
+        game.pitch_number = 0
+        # A runner called up to bat (only when everyone active is on base) steps off their base.
+        left_base = None
+        if batter in base_runners:
+            left_base = base_runners.index(batter)
+            base_runners = half.base_runners = [None if runner == batter else runner for runner in base_runners]
+        if timer:
+            timer.exit()
+            timer.enter("log_rendering")
         status_msg = batter_status_message(batter, team_name)
         if status_msg is not None:
             play_by_play_log.append(status_msg)
+        if left_base is not None:
+            play_by_play_log.append(f"With nobody else left to bat, {format_player_status(batter)} leaves "
+                                    f"{base_number_to_text(left_base)} to take the plate. {display_bases_as_squares(base_runners)}")
+        if timer:
+            timer.exit()
 
         if getattr(batter, "pending_death", False):
             batter.is_dead = True
             batter.pending_death = False
+            refresh_status(batter)
+            if events:
+                events.deaths += 1
 
         # If the batter is inactive, move on to the next at-bat.
         if not is_active(batter, ignore_exhausted_for_batting=True):
-            current_batter_index += 1
+            game.batter_index[batting] += 1
             continue
 
-        base_runners, score, outs, end_at_bat = process_pickoff_attempts(
-            base_runners,
-            pitcher,
-            play_by_play_log,
-            score,
-            is_top,
-            team_a_name,
-            team_b_name,
-            defensive_positions,
-            balls,
-            strikes,
-            outs,
-            riled_up,
-            team_a,
-            team_b
-        )
+        if timer:
+            timer.enter("pickoffs")
+        end_at_bat = process_pickoff_attempts(half, play_by_play_log)
+        if timer:
+            timer.exit()
         if end_at_bat:
             # End the at-bat immediately.
             play_by_play_log.append(f"{batter.name} mopes out of the batter's box, disappointed. 😞")
@@ -1948,13 +2140,15 @@ def half_inning_with_fixed_base_running(
             runner_score = max(runner.baserunning, runner.chutzpah)
             # Use calculate_fielder_score so that an inactive catcher contributes 0
             catcher_score = calculate_fielder_score(catcher)
-            steal_roll = random.randint(1, 100) + (runner_score - catcher_score)
+            steal_roll = rng.baserunning.randint(1, 100) + (runner_score - catcher_score)
             if steal_roll >= 40:
                 return "steal_success", steal_roll
             else:
                 return "caught", steal_roll
 
         # --- At-Bat Delay Steal Attempt ---
+        if timer:
+            timer.enter("steals")
         for base_index in [2, 1, 0]:
             if base_runners[base_index] is not None and is_active(base_runners[base_index], ignore_exhausted_for_batting=True):
                 if base_index < 2 and base_runners[base_index + 1] is not None:
@@ -1962,30 +2156,14 @@ def half_inning_with_fixed_base_running(
                 runner = base_runners[base_index]
                 multiplier = {0: 1.0, 1: 0.6, 2: 0.2}[base_index]
                 steal_probability = max((runner.chutzpah / 5) * 0.275 * multiplier, 0.01)
-                if random.random() < steal_probability:
+                if rng.baserunning.random() < steal_probability:
                     result, steal_roll = attempt_steal(runner, defensive_positions)
                     if result == "steal_success":
                         if base_index == 2:
                             base_runners[2] = None
-                            if is_top:
-                                score[team_a_name] += 1
-                            else:
-                                score[team_b_name] += 1
                             play_by_play_log.append(
                                 f"{format_player_status(runner)} steals home base and scores! {display_bases_as_squares(base_runners)}")
-                            if is_top:
-                                reduce_msg = riled_up.reduce_on_score(team_a_name)
-                                if reduce_msg:
-                                    play_by_play_log.append(reduce_msg)
-                                    bonus = riled_up.get_bonus()
-                                    apply_riled_buff(team_a, bonus)
-                            else:
-                                reduce_msg = riled_up.reduce_on_score(team_b_name)
-                                if reduce_msg:
-                                    play_by_play_log.append(reduce_msg)
-                                    bonus = riled_up.get_bonus()
-                                    apply_riled_buff(team_b, bonus)
-                            play_by_play_log.append(f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}")
+                            half.score_run(play_by_play_log)
                         else:
                             next_base_text = base_number_to_text(base_index + 1)
                             base_runners[base_index + 1] = runner
@@ -1996,16 +2174,18 @@ def half_inning_with_fixed_base_running(
                     elif result == "caught":
                         next_base_text = base_number_to_text(base_index + 1)
                         base_runners[base_index] = None
-                        outs += 1
-                        updated_bso = format_bso(balls, strikes, outs)
+                        half.outs += 1
+                        updated_bso = format_bso(0, 0, half.outs)
                         play_by_play_log.append(
                             f"{format_player_status(runner)} attempts to steal {next_base_text} and is caught backtracking! Out! "
                             f"{updated_bso} {display_bases_as_squares(base_runners)}"
                         )
-                        if outs >= 3:
+                        if half.outs >= 3:
                             break
         # --- End Delayed Steal Attempt ---
-        if outs >= 3:
+        if timer:
+            timer.exit()
+        if half.outs >= 3:
             end_at_bat = True
 
         if end_at_bat:
@@ -2013,30 +2193,13 @@ def half_inning_with_fixed_base_running(
             play_by_play_log.append(f"{batter.name} squints disapprovingly at {format_player_status(runner)} and exits the batter's box, annoyed. 😒")
             break
 
-        old_total = score[team_a_name] if is_top else score[team_b_name]
-
         # --- At–Bat Outcome ---
+        if timer:
+            timer.enter("pitch_loop")
         while True:
-            at_bat_result, updated_base_runners, pitches, current_outs, balls, strikes, scoring_names = at_bat_with_pitch_sequence(
-                batter,
-                pitcher,
-                base_runners,
-                outs,
-                defensive_positions,
-                is_top,
-                team_a_name,
-                team_b_name,
-                score,
-                team_a,
-                team_b,
-                riled_up,
-                declared=False,
-                foul_mood=foul_mood
-            )
+            at_bat_result, pitches = at_bat_with_pitch_sequence(half, batter, declared=False)
             play_by_play_log.extend(pitches)
-            outs = current_outs
-            base_runners = updated_base_runners
-            base_runners = remove_dead_from_bases(base_runners)
+            remove_dead_from_bases(half.base_runners)
 
             # Only break if a decisive outcome is reached.
             if at_bat_result in ["potential_single", "potential_double", "potential_triple", "walk",
@@ -2045,39 +2208,18 @@ def half_inning_with_fixed_base_running(
                                  "foul_limit_out", "incinerated"]:
                 break
             # Otherwise, the at–bat continues (i.e. more pitches for the same batter).
-
-        old_total = score[team_a_name] if is_top else score[team_b_name]
-        # Compute a BSO display to pass into baserunning.
-        final_bso = format_bso(0, 0, outs)
+        if timer:
+            timer.exit()
+        if events:
+            events.at_bats[at_bat_result] = events.at_bats.get(at_bat_result, 0) + 1
 
         if at_bat_result.startswith("potential_"):
             # Outcome is a hit. Process it to update bases and generate hit descriptions.
-            (updated_bases,
-            scoring_runners,
-            runner_movements,
-            batter_movement,
-            play_by_play_message_hit,
-            runners_scoring,
-            updated_outs
-             ) = process_hit_with_correct_base_running(
-                batter,
-                at_bat_result,
-                base_runners,
-                is_top,
-                team_a_name,
-                team_b_name,
-                defensive_positions,
-                score,
-                team_a,
-                team_b,
-                foul_mood,
-                riled_up,
-                final_bso,
-                outs
-            )
-            outs = updated_outs
-            inning_score += scoring_runners
-            base_runners = updated_bases
+            if timer:
+                timer.enter("hit_baserunning")
+            _, play_by_play_message_hit = process_hit_with_correct_base_running(half, batter, at_bat_result)
+            if timer:
+                timer.exit()
             play_by_play_log.extend(play_by_play_message_hit)
         elif at_bat_result in ["walk", "beaned_walk"]:
             # These outcomes are handled by the walk block later.
@@ -2087,69 +2229,42 @@ def half_inning_with_fixed_base_running(
             # (You might log an additional message here if desired.)
             pass
 
-        new_total = score[team_a_name] if is_top else score[team_b_name]
-        inning_score += (new_total - old_total)
-        balls = 0
-        strikes = 0
 
         # --- Handle Walks ---
         if at_bat_result in ["walk", "beaned_walk"]:
-            loaded_walk = (base_runners[0] is not None and base_runners[1] is not None and base_runners[2] is not None)
-            if loaded_walk:
-                forced_runner = base_runners[2]
+            if timer:
+                timer.enter("walks")
+            base_runners = half.base_runners
+            forced_runner = walk_batter(base_runners, batter)
+            if forced_runner is not None:
                 # First, build and log the walk action message:
-                new_first = batter
-                new_second = base_runners[0]
-                new_third = base_runners[1]
-                base_runners = [new_first, new_second, new_third]
                 walk_msg = (f"{format_player_status(batter)} takes a walk and advances to first. "
                             f"{forced_runner.name} advances to home plate on the walk! {display_bases_as_squares(base_runners)}")
                 play_by_play_log.append(walk_msg)
-                # Next, update score and then log the riled down message:
-                if is_top:
-                    score[team_a_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_a_name)
-                    if reduce_msg:
-                        play_by_play_log.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_a, bonus)
-                else:
-                    score[team_b_name] += 1
-                    reduce_msg = riled_up.reduce_on_score(team_b_name)
-                    if reduce_msg:
-                        play_by_play_log.append(reduce_msg)
-                        bonus = riled_up.get_bonus()
-                        apply_riled_buff(team_b, bonus)
-                # Finally, log the current score update.
-                play_by_play_log.append(f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}")
+                # Next, update score and log the riled down message and the current score.
+                half.score_run(play_by_play_log)
             else:
-                if base_runners[0] is not None:
-                    if base_runners[1] is None:
-                        base_runners[1] = base_runners[0]
-                    else:
-                        base_runners[2] = base_runners[1]
-                        base_runners[1] = base_runners[0]
-                    base_runners[0] = batter
-                else:
-                    base_runners[0] = batter
                 if at_bat_result == "beaned_walk":
                     play_by_play_log.append(f"{format_player_status(batter)} is beaned by {pitcher.name}! "
                                             f"Automatic walk! {batter.name} advances to first. "
                                             f"The offense is brooding... {display_bases_as_squares(base_runners)}")
-                    maybe_trigger_brawl("beaned", team_a, team_b, team_a_name, team_b_name, play_by_play_log, foul_mood)
+                    maybe_trigger_brawl("beaned", game, play_by_play_log)
                 else:
                     walk_msg = f"{format_player_status(batter)} takes a walk and advances to first."
                     play_by_play_log.append(f"{walk_msg} {display_bases_as_squares(base_runners)}")
+            if timer:
+                timer.exit()
 
         # Check if a brawl needs to be triggered.
         if at_bat_result in ["beaned_walk", "near_miss_hr", "grand_slam", "close_call_out",
                              "potential_single", "potential_double", "potential_triple", "strike_out",
                              "fly out", "ground out", "home run"]:
-            maybe_trigger_brawl(at_bat_result, team_a, team_b, team_a_name, team_b_name, play_by_play_log, foul_mood)
+            maybe_trigger_brawl(at_bat_result, game, play_by_play_log)
 
         #next batter
-        current_batter_index += 1
+        game.batter_index[batting] += 1
 
+        outs = half.outs
         if outs >= 3:
             if outs == 4:
                 play_by_play_log.append("The offense is insulted by the defense's unnecessary 4th out! 🤡")
@@ -2161,62 +2276,112 @@ def half_inning_with_fixed_base_running(
 
     # Riled Up check on the score deficit.
     if not suppress_riled:  # Only do this if we're not suppressing riled messages
-        if is_top:
-            offense_score = score[team_a_name]
-            defense_score = score[team_b_name]
-        else:
-            offense_score = score[team_b_name]
-            defense_score = score[team_a_name]
-
-        deficit = defense_score - offense_score
+        deficit = score[1 - batting] - score[batting]
         if deficit >= 3 and riled_up is not None:
             deficit_msg = riled_up.trigger_by_deficit(deficit, team_name)
             if deficit_msg:
                 bonus = riled_up.get_bonus()
-                batting_team = team_a if is_top else team_b
-                apply_riled_buff(batting_team, bonus)
+                apply_riled_buff(batting_order, bonus)
                 play_by_play_log.append(deficit_msg)
 
+    if timer:
+        timer.enter("log_rendering")
     summary_lines = []
     summary_lines.append("")
     end_message = f"END OF THE {'TOP' if is_top else 'BOTTOM'} OF INNING {inning}."
-    if not is_top and inning >= 9 and score[team_b_name] > score[team_a_name]:
+    if not is_top and inning >= 9 and score[1] > score[0]:
         end_message += " 🍌 SHAME! 🍌"
     summary_lines.append(end_message)
 
-    summary_lines.append(f"📊 Current Score: {team_a_name}: {score[team_a_name]}, {team_b_name}: {score[team_b_name]}")
+    summary_lines.append(game.score_line())
     summary_lines.append("")
     play_by_play_log.extend(summary_lines)
+    if timer:
+        timer.exit()
 
     # Finalize pending deaths for both teams.
     finalize_pending_deaths(team_a)
     finalize_pending_deaths(team_b)
 
-    return inning_score, current_batter_index, play_by_play_log, False
+    if events:
+        events.half_inning_runs.append(score[batting] - runs_before)
+    return play_by_play_log, False
 
 #==== Full Game Compiler ====
-def play_full_game(team_a_master, team_b_master, pitchers_a, pitchers_b, team_a_name, team_b_name):
-    team_a = copy.deepcopy(team_a_master)
-    team_b = copy.deepcopy(team_b_master)
-    # Use a mutable score dictionary.
-    score = {team_a_name: 0, team_b_name: 0}
+def record_game_result(result, game, inning, winner=None, called=None):
+    """
+    Fill in the optional result dict handed to play_full_game, and report the
+    end of the game to the metrics (see metrics.py).
+    winner is "a" or "b" for forfeits; otherwise it is taken from the score
+    (None means the game ended tied and everyone died, or was called while tied).
+    called is the reason a game was called by the watchdog (see watchdog.py).
+    """
+    end_game(winner is not None, inning)
+    if result is None:
+        return
+    forfeit = winner is not None
+    score_a, score_b = game.score
+    if winner is None:
+        if score_a > score_b:
+            winner = "a"
+        elif score_b > score_a:
+            winner = "b"
+    result["score_a"] = score_a
+    result["score_b"] = score_b
+    result["winner"] = winner
+    result["forfeit"] = forfeit
+    result["innings"] = inning
+    result["called"] = called
+
+def play_full_game(team_a_master, team_b_master, pitchers_a, pitchers_b, team_a_name, team_b_name, result=None):
+    """
+    Play a complete game and return the play-by-play log.
+    If a dict is passed as result, it is filled with the final score, the winner
+    ("a", "b" or None), whether the game ended by forfeit, the last inning played,
+    and why the game was called (None unless it ran past its limits, see watchdog.py).
+    """
+    begin_watchdog()
+    # The game's state; _play_full_game fills in the teams.
+    game = current_game_state.game = GameState(team_a_name, team_b_name)
     full_play_by_play = []
+    try:
+        return _play_full_game(team_a_master, team_b_master, game, result, full_play_by_play)
+    except GameCalled as called:
+        inning = game.inning
+        game_called(called.reason)
+        full_play_by_play.append("")
+        full_play_by_play.append(f"🛑 GAME CALLED in inning {inning}: {called.reason} reached! 🛑")
+        full_play_by_play.append(game.score_line("Final Score"))
+        record_game_result(result, game, inning, called=called.reason)
+        return full_play_by_play
+    finally:
+        end_watchdog()
+        current_game_state.game = None
+
+def _play_full_game(team_a_master, team_b_master, game, result, full_play_by_play):
+    rng = current_rng()
+    team_a_name, team_b_name = game.team_names
+    score = game.score
+    begin_game()
+    timer = timing_state.timer
+    if timer:
+        timer.enter("roster_copy")
+    team_a = Roster(copy.deepcopy(team_a_master))
+    team_b = Roster(copy.deepcopy(team_b_master))
+    if timer:
+        timer.exit()
+    # Roll this game's pitching stints from the game's own random streams,
+    # so a seeded game doesn't depend on when the rosters were loaded.
+    for player in team_a + team_b:
+        player.remaining_innings = calculate_pitching_stint(player)
+    team_a.staff = PitchingStaff(team_a)
+    team_b.staff = PitchingStaff(team_b)
+    game.teams = (team_a, team_b)
     full_play_by_play.append("🚩️ Welcome to today's game! 🚩️")
     full_play_by_play.append(f"🏆 Matchup: {team_a_name} vs. {team_b_name} 🏆")
     full_play_by_play.append("💥 PLAY BALL! 💥\n")
 
-    # Create a single persistent FoulMood instance for the entire game.
-    foul_mood = FoulMood()
-
-    # Create a RiledUp instance for each team.
-    riled_up_a = RiledUp()
-    riled_up_b = RiledUp()
-
-    # Set up batting orders and pointers.
-    batting_order_a = team_a.copy()  # contains player objects directly
-    batting_order_b = team_b.copy()
-    current_batter_a = 0
-    current_batter_b = 0
+    # The game's single FoulMood, each team's RiledUp and the batter counts live in game.
 
     # Set up pitcher orders and pointers.
     current_pitcher_a_index = 0
@@ -2227,18 +2392,20 @@ def play_full_game(team_a_master, team_b_master, pitchers_a, pitchers_b, team_a_
         # --- Select pitcher for Team B with fallback ---
         pitcher_b = select_new_pitcher(team_b)
         if pitcher_b not in team_b:
-            pitcher_b = random.choice(team_b) if team_b else None
+            pitcher_b = rng.lineup.choice(team_b) if team_b else None
         if pitcher_b is None:
             full_play_by_play.append(f"{team_b_name} has no eligible pitchers left! {team_a_name} wins by forfeit.")
+            record_game_result(result, game, inning, winner="a")
             return full_play_by_play
         current_pitcher_b_index += 1
 
         # --- Select pitcher for Team A with fallback ---
         pitcher_a = select_new_pitcher(team_a)
         if pitcher_a not in team_a:
-            pitcher_a = random.choice(team_a) if team_a else None
+            pitcher_a = rng.lineup.choice(team_a) if team_a else None
         if pitcher_a is None:
             full_play_by_play.append(f"{team_a_name} has no eligible pitchers left! {team_b_name} wins by forfeit.")
+            record_game_result(result, game, inning, winner="b")
             return full_play_by_play
         current_pitcher_a_index += 1
 
@@ -2251,87 +2418,81 @@ def play_full_game(team_a_master, team_b_master, pitchers_a, pitchers_b, team_a_
         # --- Top of the Inning ---
         full_play_by_play.append(f"=== Inning {inning}, Top: {team_a_name} Batting ===")
         full_play_by_play.append(f"⚾ Pitching for {team_b_name}: {pitcher_b.name}")
-        inning_score_a, current_batter_a, play_by_play_a, forfeit_a = \
-            half_inning_with_fixed_base_running(
-                team_a_name, team_a, pitcher_b, [], current_batter_a, inning, True,
-                team_a_name, team_b_name, defensive_positions_b, score, team_a, team_b,
-                foul_mood=foul_mood, riled_up=riled_up_a
-            )
+        play_by_play_a, forfeit_a = half_inning_with_fixed_base_running(
+            game, inning, True, pitcher_b, defensive_positions_b
+        )
         full_play_by_play.extend(play_by_play_a)
         if forfeit_a:
             full_play_by_play.append(f"{team_a_name} has forfeited! {team_b_name} is declared the winner.")
+            record_game_result(result, game, inning, winner="b")
             return full_play_by_play
 
         #Decrement Team B's pitcher stint after the top half inning
         if pitcher_b is not None:
-            pitcher_b.remaining_innings -= 1
-            if pitcher_b.remaining_innings <= 0:
-                pitcher_b.exhausted = True
+            end_pitching_half(pitcher_b)
 
         # --- Bottom of the Inning ---
-        if inning in [9] and score[team_b_name] > score[team_a_name]:
+        if inning in [9] and score[1] > score[0]:
             bottom_header = f"=== Inning {inning}, Bottom: {team_b_name} Batting === 🍌 SHAME! 🍌"
         else:
             bottom_header = f"=== Inning {inning}, Bottom: {team_b_name} Batting ==="
         full_play_by_play.append(bottom_header)
         full_play_by_play.append(f"⚾ Pitching for {team_a_name}: {pitcher_a.name}")
         bottom_suppress = True if inning == 9 else False
-        inning_score_b, current_batter_b, play_by_play_b, forfeit_b = \
-            half_inning_with_fixed_base_running(
-                team_b_name, team_b, pitcher_a, [], current_batter_b, inning, False,
-                team_a_name, team_b_name, defensive_positions_a, score, team_a, team_b,
-                foul_mood=foul_mood, riled_up=riled_up_b, suppress_riled=bottom_suppress
-            )
+        play_by_play_b, forfeit_b = half_inning_with_fixed_base_running(
+            game, inning, False, pitcher_a, defensive_positions_a, suppress_riled=bottom_suppress
+        )
         full_play_by_play.extend(play_by_play_b)
         if forfeit_b:
             full_play_by_play.append(f"{team_b_name} has forfeited! {team_a_name} is declared the winner.")
+            record_game_result(result, game, inning, winner="a")
             return full_play_by_play
 
         # Decrement Team A's pitcher stint after the top half inning
         if pitcher_a is not None:
-            pitcher_a.remaining_innings -= 1
-            if pitcher_a.remaining_innings <= 0:
-                pitcher_a.exhausted = True
+            end_pitching_half(pitcher_a)
 
     # --- Extra Innings (if tied after 9 innings) ---
-    if score[team_a_name] == score[team_b_name]:
+    if score[0] == score[1]:
         full_play_by_play.append("✨ Game tied at the end of the 9th inning. Extra innings begin! ✨\n")
         inning = 10
-        while inning <= 13 and score[team_a_name] == score[team_b_name]:
+        while inning <= 13 and score[0] == score[1]:
             # --- Top of extra inning ---
             if not team_b:
                 full_play_by_play.append(f"{team_b_name} has no players left! {team_a_name} wins by forfeit.")
+                record_game_result(result, game, inning, winner="a")
                 return full_play_by_play
             reset_pitchers_if_exhausted(team_b)
             pitcher_top = select_new_pitcher(team_b)
             if pitcher_top is None:
                 full_play_by_play.append(
                     f"{team_b_name} has no eligible pitchers left in extra innings! {team_a_name} wins by forfeit.")
+                record_game_result(result, game, inning, winner="a")
                 return full_play_by_play
             defensive_positions_top = assign_defensive_positions([p for p in team_b if p != pitcher_top])
             defensive_positions_top["pitcher"] = pitcher_top
             full_play_by_play.append(f"=== Inning {inning}, Top: {team_a_name} Batting ===")
             full_play_by_play.append(f"⚾ Pitching for {team_b_name}: {pitcher_top.name}")
-            inning_score_a, current_batter_a, play_by_play_a, forfeit_a = \
-                half_inning_with_fixed_base_running(
-                    team_a_name, team_a, pitcher_top, [], current_batter_a, inning, True,
-                    team_a_name, team_b_name, defensive_positions_top, score, team_a, team_b,
-                    foul_mood=foul_mood, riled_up=riled_up_a
-                )
+            play_by_play_a, forfeit_a = half_inning_with_fixed_base_running(
+                game, inning, True, pitcher_top, defensive_positions_top
+            )
             full_play_by_play.extend(play_by_play_a)
             if forfeit_a:
                 full_play_by_play.append(f"{team_a_name} has no players left! {team_b_name} wins by forfeit.")
+                record_game_result(result, game, inning, winner="b")
                 return full_play_by_play
 
             # --- Bottom of extra inning ---
             if not team_a:
                 full_play_by_play.append(f"{team_a_name} has no players left! {team_b_name} wins by forfeit.")
+                record_game_result(result, game, inning, winner="b")
                 return full_play_by_play
             reset_pitchers_if_exhausted(team_a)
             pitcher_bottom = select_new_pitcher(team_a)
             if pitcher_bottom is None:
                 full_play_by_play.append(
                     f"{team_a_name} has no eligible pitchers left in extra innings! {team_b_name} wins by forfeit.")
+                record_game_result(result, game, inning, winner="b")
                 return full_play_by_play
             defensive_positions_bottom = assign_defensive_positions([p for p in team_a if p != pitcher_bottom])
             defensive_positions_bottom["pitcher"] = pitcher_bottom
@@ -2340,27 +2501,26 @@ def play_full_game(team_a_master, team_b_master, pitchers_a, pitchers_b, team_a_
             bottom_header = f"=== Inning {inning}, Bottom: {team_b_name} Batting ==="
             full_play_by_play.append(bottom_header)
             full_play_by_play.append(f"⚾ Pitching for {team_a_name}: {pitcher_bottom.name}")
-            inning_score_b, current_batter_b, play_by_play_b, forfeit_b = \
-                half_inning_with_fixed_base_running(
-                    team_b_name, team_b, pitcher_bottom, [], current_batter_b, inning, False,
-                    team_a_name, team_b_name, defensive_positions_bottom, score, team_a, team_b,
-                    foul_mood=foul_mood, riled_up=riled_up_b, suppress_riled=False
-                )
+            play_by_play_b, forfeit_b = half_inning_with_fixed_base_running(
+                game, inning, False, pitcher_bottom, defensive_positions_bottom, suppress_riled=False
+            )
             full_play_by_play.extend(play_by_play_b)
             if forfeit_b:
                 full_play_by_play.append(f"{team_b_name} has no players left! {team_a_name} wins by forfeit.")
+                record_game_result(result, game, inning, winner="a")
                 return full_play_by_play
-            if score[team_a_name] != score[team_b_name]:
+            if score[0] != score[1]:
                 break
             inning += 1
-        if score[team_a_name] == score[team_b_name]:
+        if score[0] == score[1]:
             full_play_by_play.append("💀 Game tied at the end of the 13th inning. Everyone dies! 💀\n")
     else:
         full_play_by_play.append("🎉 Game Over! 🎉\n")
-    if score[team_a_name] > score[team_b_name]:
+    if score[0] > score[1]:
         suffix = "win" if team_a_name.endswith("s") else "wins"
         full_play_by_play.append(f"🏆 {team_a_name} {suffix}! 🏆")
-    elif score[team_b_name] > score[team_a_name]:
+    elif score[1] > score[0]:
         suffix = "win" if team_b_name.endswith("s") else "wins"
         full_play_by_play.append(f"🏆 {team_b_name} {suffix}! 🏆")
+    record_game_result(result, game, min(inning, 13))
     return full_play_by_play
@@ -0,0 +1,18 @@
+"""
+Benchmarks for the Basebrawl engine.
+
+    python -m benchmarks run --output baseline.json
+    ... change the engine ...
+    python -m benchmarks run --output current.json
+    python -m benchmarks compare baseline.json current.json
+
+`run` plays a fixed set of seeded matchups for games, at-bats and pitches per
+second plus per-game latency percentiles (benchmarks/engine.py), and times the
+engine's hot functions on their own (benchmarks/micro.py). `compare` exits
+with status 1 if any metric got worse by more than the threshold.
+
+`python -m benchmarks phases` breaks game time down by engine phase
+(phase_timing.py), and `python -m benchmarks memory` does the same for
+memory (benchmarks/memory.py). `python -m benchmarks --profile out.speedscope.json <command>`
+profiles any command (profiling.py).
+"""
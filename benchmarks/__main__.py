@@ -0,0 +1,110 @@
+import argparse
+import json
+import platform
+import sys
+from contextlib import nullcontext
+
+from Players import get_teams
+from rng import set_default_backend
+from benchmarks.compare import compare_results, format_comparison, load_results
+from benchmarks.engine import benchmark_games
+from benchmarks.memory import format_memory_report, profile_memory_by_name
+from benchmarks.micro import run_micro_benchmarks
+from benchmarks.phases import time_phases_by_name
+from phase_timing import format_breakdown
+from profiling import profiling
+
+
+def run(args):
+    set_default_backend(args.backend)
+    teams = get_teams()
+    results = {
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "seed": args.seed,
+        "games": benchmark_games(args.games, seed=args.seed, teams=teams),
+        "micro": run_micro_benchmarks(args.iterations, args.rounds, seed=args.seed, teams=teams),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+def phases(args):
+    teams = get_teams()
+    names = list(teams.keys())
+    team_a_name = args.team_a or names[0]
+    team_b_name = args.team_b or names[1]
+    timings = time_phases_by_name(team_a_name, team_b_name, args.games, seed=args.seed, teams=teams)
+    print(f"{team_a_name} vs {team_b_name}, {args.games} games")
+    print(format_breakdown(timings["aggregate"]))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(timings, f, indent=2)
+
+
+def memory(args):
+    teams = get_teams()
+    names = list(teams.keys())
+    team_a_name = args.team_a or names[0]
+    team_b_name = args.team_b or names[1]
+    report = profile_memory_by_name(team_a_name, team_b_name, args.games, seed=args.seed, teams=teams)
+    print(f"{team_a_name} vs {team_b_name}, {args.games} games")
+    print(format_memory_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+def compare(args):
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the Basebrawl engine.")
+    parser.add_argument("--profile", default=None, metavar="PATH",
+                        help="profile the command and write a speedscope, collapsed or pstats file (see profiling.py)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and print the results as JSON")
+    run_parser.add_argument("--games", type=int, default=200, help="games for the throughput and latency run")
+    run_parser.add_argument("--iterations", type=int, default=200, help="calls per micro-benchmark round")
+    run_parser.add_argument("--rounds", type=int, default=5, help="rounds per micro-benchmark")
+    run_parser.add_argument("--seed", default="0", help="seed for the games and micro-benchmarks")
+    run_parser.add_argument("--backend", default="mersenne", help="RNG backend (see rng.BACKENDS)")
+    run_parser.add_argument("--output", default=None, help="also save the results to this file")
+    run_parser.set_defaults(handler=run)
+
+    phases_parser = commands.add_parser("phases", help="break game time down by engine phase")
+    phases_parser.add_argument("--team-a", default=None, help="team from players.csv (default: the first)")
+    phases_parser.add_argument("--team-b", default=None, help="team from players.csv (default: the second)")
+    phases_parser.add_argument("--games", type=int, default=200)
+    phases_parser.add_argument("--seed", default="0")
+    phases_parser.add_argument("--output", default=None, help="also save per-game and aggregate breakdowns as JSON")
+    phases_parser.set_defaults(handler=phases)
+
+    memory_parser = commands.add_parser("memory", help="peak and retained memory per game, phase and list builder")
+    memory_parser.add_argument("--team-a", default=None, help="team from players.csv (default: the first)")
+    memory_parser.add_argument("--team-b", default=None, help="team from players.csv (default: the second)")
+    memory_parser.add_argument("--games", type=int, default=50)
+    memory_parser.add_argument("--seed", default="0")
+    memory_parser.add_argument("--output", default=None, help="also save per-game and aggregate reports as JSON")
+    memory_parser.set_defaults(handler=memory)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a saved baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="relative change that counts as a regression (default 0.10)")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    with profiling(args.profile) if args.profile else nullcontext():
+        args.handler(args)
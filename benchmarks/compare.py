@@ -0,0 +1,67 @@
+"""
+Regression checks between two benchmark result files.
+
+Rates (*_per_second) are better when higher and times (*_ms, *_us) when
+lower; every other number in the results is informational.
+"""
+import json
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def flatten_metrics(results, prefix=""):
+    """{"games.games_per_second": ..., "micro.get_next_batter.mean_us": ...} for every comparable metric."""
+    metrics = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, prefix=f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and metric_direction(key) != 0:
+            metrics[name] = value
+    return metrics
+
+
+def metric_direction(key):
+    """1 if a bigger value is better, -1 if a smaller one is, 0 if the metric isn't compared."""
+    if key.endswith("_per_second"):
+        return 1
+    if key.endswith("_ms") or key.endswith("_us"):
+        return -1
+    return 0
+
+
+def compare_results(baseline, current, threshold=0.10):
+    """
+    Compares every metric found in both results. Returns a list of
+    {"metric", "baseline", "current", "change", "regression"} rows, where change
+    is the relative change (positive means better) and regression is True when
+    it is worse than -threshold.
+    """
+    baseline_metrics = flatten_metrics(baseline)
+    current_metrics = flatten_metrics(current)
+    rows = []
+    for name, old in baseline_metrics.items():
+        if name not in current_metrics or old == 0:
+            continue
+        new = current_metrics[name]
+        change = metric_direction(name.rsplit(".", 1)[-1]) * (new - old) / old
+        rows.append({
+            "metric": name,
+            "baseline": old,
+            "current": new,
+            "change": change,
+            "regression": change < -threshold
+        })
+    return rows
+
+
+def format_comparison(rows):
+    lines = []
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        lines.append(f"{row['metric']:<60} {row['baseline']:>12.2f} {row['current']:>12.2f} "
+                     f"{row['change'] * 100:>+7.1f}% {flag}")
+    return "\n".join(lines)
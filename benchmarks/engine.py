@@ -0,0 +1,128 @@
+"""
+Whole-game throughput and latency for play_full_game.
+
+Every run plays the same matchups with the same seeds, so two runs play
+exactly the same games and only the time taken can differ.
+"""
+import gc
+import math
+import time
+from contextlib import contextmanager
+
+from Players import get_teams
+from basebrawl5 import play_full_game
+from rng import GameRandom, game_seed, using_rng
+from simulation import matchup_rosters
+
+# The first few pairs from players.csv, plus a mirror match.
+DEFAULT_MATCHUP_COUNT = 4
+
+
+def default_matchups(teams):
+    names = list(teams.keys())
+    pairs = [(names[i], names[i + 1]) for i in range(0, 2 * (DEFAULT_MATCHUP_COUNT - 1), 2)]
+    pairs.append((names[0], names[0]))
+    return pairs
+
+
+class SiteCounter:
+    """Wraps a draw site and adds one to each of owner's `counts` attributes per draw."""
+    def __init__(self, stream, owner, counts):
+        self.stream = stream
+        self.owner = owner
+        self.counts = counts
+
+    def randint(self, a, b):
+        for name in self.counts:
+            setattr(self.owner, name, getattr(self.owner, name) + 1)
+        return self.stream.randint(a, b)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class CountingRandom(GameRandom):
+    """A GameRandom that counts pitches and at-bats through the raw-roll sites."""
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.at_bats = 0
+        self.pitches = 0
+        self.first_pitch = SiteCounter(self.first_pitch, self, ("at_bats", "pitches"))
+        self.later_pitch = SiteCounter(self.later_pitch, self, ("pitches",))
+
+
+@contextmanager
+def gc_paused():
+    """Turns off automatic garbage collection inside the with-block; collect between timings instead."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _game_jobs(teams, matchups, n_games):
+    """(game_index, team_a, team_b, display_a, display_b) for every game of the run, matchups in turn."""
+    rosters = [matchup_rosters(teams, a, b) for a, b in matchups]
+    for game_index in range(n_games):
+        yield (game_index,) + rosters[game_index % len(rosters)]
+
+
+def benchmark_games(n_games=200, seed=0, matchups=None, teams=None):
+    """
+    Plays n_games seeded games across the matchups and returns
+    {"games", "at_bats", "pitches", "seconds", "games_per_second", "at_bats_per_second",
+    "pitches_per_second", "p50_ms", "p95_ms", "p99_ms"}.
+    at_bats counts at-bats that saw at least one pitch. The counts come from
+    a separate untimed pass over the same games, so counting costs nothing here.
+    The garbage collector is paused while timing, so a collection landing in one
+    game doesn't show up as a slow game.
+    """
+    if teams is None:
+        teams = get_teams()
+    if matchups is None:
+        matchups = default_matchups(teams)
+
+    at_bats = 0
+    pitches = 0
+    for game_index, team_a, team_b, display_a, display_b in _game_jobs(teams, matchups, n_games):
+        rng = CountingRandom(game_seed(seed, game_index))
+        with using_rng(rng):
+            play_full_game(team_a, team_b, team_a, team_b, display_a, display_b)
+        at_bats += rng.at_bats
+        pitches += rng.pitches
+
+    latencies = []
+    with gc_paused():
+        for game_index, team_a, team_b, display_a, display_b in _game_jobs(teams, matchups, n_games):
+            rng = GameRandom(game_seed(seed, game_index))
+            start = time.perf_counter()
+            with using_rng(rng):
+                play_full_game(team_a, team_b, team_a, team_b, display_a, display_b)
+            latencies.append(time.perf_counter() - start)
+            gc.collect()
+
+    seconds = sum(latencies)
+    latencies.sort()
+    return {
+        "games": n_games,
+        "at_bats": at_bats,
+        "pitches": pitches,
+        "seconds": seconds,
+        "games_per_second": n_games / seconds,
+        "at_bats_per_second": at_bats / seconds,
+        "pitches_per_second": pitches / seconds,
+        "p50_ms": percentile(latencies, 0.50) * 1000.0,
+        "p95_ms": percentile(latencies, 0.95) * 1000.0,
+        "p99_ms": percentile(latencies, 0.99) * 1000.0
+    }
@@ -0,0 +1,216 @@
+"""
+Where the memory in a game goes (tracemalloc).
+
+Reuses the engine's phase hooks (phase_timing.py): a PhaseMemory set as the
+phase timer charges allocations to phases instead of time. For each phase it
+records the bytes still held when the phase ends (exclusive, like phase
+times) and the highest point memory reached above where the phase started.
+The engine's short-lived list builders (get_next_batter,
+remove_dead_from_bases, simulate_brawl_team) are wrapped the same way, per call.
+
+Per game it also reports the peak above the starting point, the bytes the
+play-by-play list holds once the game is over, and what deep-copying the two
+rosters cost (the roster_copy phase).
+
+tracemalloc counts bytes, not allocation events, so "blocks" are the memory
+blocks still live when a game ends. Games run several times slower while traced.
+"""
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+import basebrawl5
+from Players import get_teams
+from phase_timing import PHASES, state as timing_state
+from rng import GameRandom, game_seed, using_rng
+from simulation import matchup_rosters
+
+TRACKED_FUNCTIONS = ("get_next_batter", "remove_dead_from_bases", "simulate_brawl_team")
+
+
+class PhaseMemory:
+    """Bytes retained and peak bytes per phase, and per call of the TRACKED_FUNCTIONS."""
+    def __init__(self):
+        self.net_bytes = dict.fromkeys(PHASES, 0)
+        self.peak_bytes = dict.fromkeys(PHASES, 0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.functions = {name: {"calls": 0, "peak_bytes": 0, "max_peak_bytes": 0, "net_bytes": 0}
+                          for name in TRACKED_FUNCTIONS}
+        self.stack = []
+        # Open phases and function calls: [name, traced bytes at entry, peak above that, is_phase].
+        self.scopes = []
+        self.last = 0
+
+    def _sync(self):
+        """Charges memory growth since the last call to the current phase and raises every open scope's peak."""
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for scope in self.scopes:
+            scope[2] = max(scope[2], peak - scope[1])
+        if self.stack:
+            self.net_bytes[self.stack[-1]] += current - self.last
+        self.last = current
+        return current
+
+    def enter(self, phase):
+        current = self._sync()
+        self.stack.append(phase)
+        self.calls[phase] += 1
+        self.scopes.append([phase, current, 0, True])
+
+    def exit(self):
+        self._sync()
+        phase = self.stack.pop()
+        # timing_phases trims the phase stack after an exception, so drop any scopes left open with it.
+        while self.scopes:
+            name, _, peak, is_phase = self.scopes.pop()
+            if is_phase and name == phase:
+                self.peak_bytes[phase] = max(self.peak_bytes[phase], peak)
+                break
+
+    def wrap(self, name, func):
+        """func, measured as a call of the tracked function name."""
+        stats = self.functions[name]
+
+        def measured(*args, **kwargs):
+            scope = [name, self._sync(), 0, False]
+            self.scopes.append(scope)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                current = self._sync()
+                if scope in self.scopes:
+                    self.scopes.remove(scope)
+                stats["calls"] += 1
+                stats["peak_bytes"] += scope[2]
+                stats["max_peak_bytes"] = max(stats["max_peak_bytes"], scope[2])
+                stats["net_bytes"] += current - scope[1]
+        return measured
+
+    def add(self, other):
+        for phase in PHASES:
+            self.net_bytes[phase] += other.net_bytes[phase]
+            self.peak_bytes[phase] = max(self.peak_bytes[phase], other.peak_bytes[phase])
+            self.calls[phase] += other.calls[phase]
+        for name, stats in other.functions.items():
+            total = self.functions[name]
+            total["calls"] += stats["calls"]
+            total["peak_bytes"] += stats["peak_bytes"]
+            total["max_peak_bytes"] = max(total["max_peak_bytes"], stats["max_peak_bytes"])
+            total["net_bytes"] += stats["net_bytes"]
+
+    def breakdown(self):
+        """{"phases": {phase: {"calls", "net_kib", "peak_kib"}}, "functions": {name: {"calls", "mean_peak_bytes", "max_peak_bytes", "net_bytes"}}}."""
+        return {
+            "phases": {
+                phase: {
+                    "calls": self.calls[phase],
+                    "net_kib": self.net_bytes[phase] / 1024.0,
+                    "peak_kib": self.peak_bytes[phase] / 1024.0
+                }
+                for phase in PHASES
+            },
+            "functions": {
+                name: {
+                    "calls": stats["calls"],
+                    "mean_peak_bytes": stats["peak_bytes"] / stats["calls"] if stats["calls"] else 0.0,
+                    "max_peak_bytes": stats["max_peak_bytes"],
+                    "net_bytes": stats["net_bytes"]
+                }
+                for name, stats in self.functions.items()
+            }
+        }
+
+
+@contextmanager
+def tracking_memory(memory):
+    """Charge the engine's allocations on this thread to memory inside the with-block (starts tracemalloc if needed)."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    originals = {name: getattr(basebrawl5, name) for name in TRACKED_FUNCTIONS}
+    previous = timing_state.timer
+    try:
+        for name, func in originals.items():
+            setattr(basebrawl5, name, memory.wrap(name, func))
+        timing_state.timer = memory
+        memory.enter("other")
+        try:
+            yield memory
+        finally:
+            del memory.stack[1:]
+            memory.exit()
+    finally:
+        timing_state.timer = previous
+        for name, func in originals.items():
+            setattr(basebrawl5, name, func)
+        if started:
+            tracemalloc.stop()
+
+
+def log_bytes(log):
+    """Bytes held by a play-by-play list and its strings."""
+    return sys.getsizeof(log) + sum(sys.getsizeof(line) for line in log)
+
+
+def profile_memory(team_a, team_b, team_a_name, team_b_name, n_games, seed=0):
+    """
+    Plays n_games seeded games under tracemalloc. Returns {"per_game": [...],
+    "aggregate": PhaseMemory.breakdown()}, where each game has its peak_kib,
+    retained_kib and live blocks after the game, log_kib and log_lines of the
+    play-by-play, and roster_copy_kib.
+    """
+    total = PhaseMemory()
+    per_game = []
+    tracemalloc.start()
+    try:
+        for game_index in range(n_games):
+            memory = PhaseMemory()
+            snapshot_before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            with using_rng(GameRandom(game_seed(seed, game_index))), tracking_memory(memory):
+                log = basebrawl5.play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name)
+            retained = tracemalloc.get_traced_memory()[0] - start
+            blocks = sum(stat.count_diff for stat in
+                         tracemalloc.take_snapshot().compare_to(snapshot_before, "filename"))
+            per_game.append({
+                "peak_kib": memory.peak_bytes["other"] / 1024.0,
+                "retained_kib": retained / 1024.0,
+                "retained_blocks": blocks,
+                "log_kib": log_bytes(log) / 1024.0,
+                "log_lines": len(log),
+                "roster_copy_kib": memory.net_bytes["roster_copy"] / 1024.0
+            })
+            total.add(memory)
+            del log
+    finally:
+        tracemalloc.stop()
+    return {"per_game": per_game, "aggregate": total.breakdown()}
+
+
+def profile_memory_by_name(team_a_name, team_b_name, n_games, seed=0, teams=None):
+    """profile_memory for two teams from players.csv, looked up by name."""
+    if teams is None:
+        teams = get_teams()
+    team_a, team_b, display_a, display_b = matchup_rosters(teams, team_a_name, team_b_name)
+    return profile_memory(team_a, team_b, display_a, display_b, n_games, seed=seed)
+
+
+def format_memory_report(report):
+    games = report["per_game"]
+    lines = []
+    if games:
+        for key in ("peak_kib", "retained_kib", "retained_blocks", "log_kib", "log_lines", "roster_copy_kib"):
+            values = [game[key] for game in games]
+            lines.append(f"{key:<20} mean {sum(values) / len(values):>10.1f}   max {max(values):>10.1f}")
+        lines.append("")
+    lines.append(f"{'phase':<20} {'calls':>8} {'net KiB':>10} {'peak KiB':>10}")
+    for phase, row in sorted(report["aggregate"]["phases"].items(), key=lambda item: -item[1]["peak_kib"]):
+        lines.append(f"{phase:<20} {row['calls']:>8} {row['net_kib']:>10.1f} {row['peak_kib']:>10.1f}")
+    lines.append("")
+    lines.append(f"{'function':<24} {'calls':>8} {'mean peak B':>12} {'max peak B':>11} {'net B':>8}")
+    for name, row in report["aggregate"]["functions"].items():
+        lines.append(f"{name:<24} {row['calls']:>8} {row['mean_peak_bytes']:>12.1f} "
+                     f"{row['max_peak_bytes']:>11} {row['net_bytes']:>8}")
+    return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""
+Micro-benchmarks for the engine's hot functions.
+
+Each benchmark builds a batch of fresh mid-game situations from two
+players.csv teams (untimed), then times calling the function once on each.
+The best and median of several rounds are reported, since single calls are
+too short to time on their own. The situations and rolls are seeded, so
+every run times the same calls.
+"""
+import copy
+import gc
+import time
+
+from Players import get_teams
+from basebrawl5 import (
+    GameState,
+    HalfInningState,
+    apply_injury_to_player,
+    assign_defensive_positions,
+    at_bat_with_pitch_sequence,
+    calculate_pitching_stint,
+    describe_full_play,
+    format_bso,
+    get_next_batter,
+    process_hit_with_correct_base_running,
+    simulate_brawl,
+    update_injury_status,
+)
+from rng import GameRandom, using_rng
+from benchmarks.engine import gc_paused, percentile
+
+
+def fresh_situation(teams, team_a_name, team_b_name):
+    """Two fresh rosters with Team A batting against Team B's first player pitching."""
+    team_a = copy.deepcopy(teams[team_a_name])
+    team_b = copy.deepcopy(teams[team_b_name])
+    for player in team_a + team_b:
+        player.remaining_innings = calculate_pitching_stint(player)
+    pitcher = team_b[0]
+    defensive_positions = assign_defensive_positions(team_b[1:])
+    defensive_positions["pitcher"] = pitcher
+    return {
+        "team_a": team_a,
+        "team_b": team_b,
+        "team_a_name": team_a_name,
+        "team_b_name": team_b_name,
+        "pitcher": pitcher,
+        "defensive_positions": defensive_positions,
+        "game": GameState(team_a_name, team_b_name, team_a, team_b),
+    }
+
+
+def top_half(s, base_runners, outs):
+    """Team A's half-inning against the situation's pitcher, with the given bases and outs."""
+    return HalfInningState(s["game"], True, s["pitcher"], s["defensive_positions"], base_runners, outs)
+
+
+def setup_at_bat(s):
+    team_a = s["team_a"]
+    return at_bat_with_pitch_sequence, (top_half(s, [None, team_a[1], None], 0), team_a[0], True)
+
+
+def setup_process_hit(s):
+    team_a = s["team_a"]
+    return process_hit_with_correct_base_running, (
+        top_half(s, [team_a[1], None, team_a[2]], 1), team_a[0], "potential_double"
+    )
+
+
+def setup_next_batter(s):
+    team_a = s["team_a"]
+    return get_next_batter, (team_a, team_a[0], [], [team_a[1]])
+
+
+def setup_brawl(s):
+    return simulate_brawl, (s["team_a"], s["team_b"], s["team_a_name"], s["team_b_name"])
+
+
+def setup_injury_status(s):
+    team_a = s["team_a"]
+    outcomes = ["Winded", "Shook Up", "Injured", "Knocked Out"]
+    for player, outcome in zip(team_a, outcomes):
+        apply_injury_to_player(player, outcome, team_a)
+    return update_injury_status, (team_a, s["team_a_name"], [])
+
+
+def setup_describe_play(s):
+    team_a = s["team_a"]
+    movements = [f"{team_a[1].name} advances to third."]
+    return describe_full_play, (
+        team_a[0], "double", movements, "and reaches second", [None, team_a[0], team_a[1]], [],
+        format_bso(0, 0, 1)
+    )
+
+
+MICRO_BENCHMARKS = {
+    "at_bat_with_pitch_sequence": setup_at_bat,
+    "process_hit_with_correct_base_running": setup_process_hit,
+    "get_next_batter": setup_next_batter,
+    "simulate_brawl": setup_brawl,
+    "update_injury_status": setup_injury_status,
+    "describe_full_play": setup_describe_play,
+}
+
+
+def run_micro_benchmark(name, iterations=200, rounds=5, seed=0, teams=None):
+    """
+    Times `rounds` rounds of `iterations` calls of one micro-benchmark, each call
+    on a fresh situation. Every round replays the same situations and rolls.
+    Returns {"calls", "best_us", "median_us"}, the per-call time of the fastest
+    and the median round.
+    """
+    if teams is None:
+        teams = get_teams()
+    team_a_name, team_b_name = list(teams.keys())[:2]
+    setup = MICRO_BENCHMARKS[name]
+    per_call = []
+    for _ in range(rounds):
+        rng = GameRandom(seed=f"{seed}/{name}")
+        with using_rng(rng):
+            calls = [setup(fresh_situation(teams, team_a_name, team_b_name)) for _ in range(iterations)]
+        gc.collect()
+        with using_rng(rng), gc_paused():
+            start = time.perf_counter()
+            for function, args in calls:
+                function(*args)
+            per_call.append((time.perf_counter() - start) / iterations)
+    per_call.sort()
+    return {
+        "calls": iterations * rounds,
+        "best_us": per_call[0] * 1e6,
+        "median_us": percentile(per_call, 0.50) * 1e6
+    }
+
+
+def run_micro_benchmarks(iterations=200, rounds=5, seed=0, names=None, teams=None):
+    """run_micro_benchmark for each named benchmark (all of them by default)."""
+    if teams is None:
+        teams = get_teams()
+    return {
+        name: run_micro_benchmark(name, iterations, rounds, seed, teams)
+        for name in (names or MICRO_BENCHMARKS)
+    }
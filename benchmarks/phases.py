@@ -0,0 +1,32 @@
+"""
+Where the time in a game goes, phase by phase (see phase_timing.py).
+"""
+from Players import get_teams
+from basebrawl5 import play_full_game
+from phase_timing import PhaseTimer, timing_phases
+from rng import GameRandom, game_seed, using_rng
+from simulation import matchup_rosters
+
+
+def time_phases(team_a, team_b, team_a_name, team_b_name, n_games, seed=0):
+    """
+    Plays n_games seeded games with phase timing on. Returns
+    {"per_game": [breakdown, ...], "aggregate": breakdown} (see PhaseTimer.breakdown).
+    """
+    total = PhaseTimer()
+    per_game = []
+    for game_index in range(n_games):
+        timer = PhaseTimer()
+        with using_rng(GameRandom(game_seed(seed, game_index))), timing_phases(timer):
+            play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name)
+        per_game.append(timer.breakdown())
+        total.add(timer)
+    return {"per_game": per_game, "aggregate": total.breakdown()}
+
+
+def time_phases_by_name(team_a_name, team_b_name, n_games, seed=0, teams=None):
+    """time_phases for two teams from players.csv, looked up by name."""
+    if teams is None:
+        teams = get_teams()
+    team_a, team_b, display_a, display_b = matchup_rosters(teams, team_a_name, team_b_name)
+    return time_phases(team_a, team_b, display_a, display_b, n_games, seed=seed)
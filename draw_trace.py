@@ -0,0 +1,295 @@
+"""
+Traces of every random draw a game makes, and where two traces part ways.
+
+A DrawTape (rng.py) is enough to replay a game; a DrawTrace also records, for
+each draw, the site it came through (a stream or one of its aliases), the
+engine function and line that asked for it, and where the game was: inning,
+half, batter and pitch of the at-bat. After refactoring a hot path, trace the
+same seeded game before and after and diff the two:
+
+    git stash; python draw_trace.py record --seed 7 --output before.trace; git stash pop
+    python draw_trace.py record --seed 7 --output after.trace
+    python draw_trace.py diff before.trace after.trace
+
+diff prints the first draw where the two runs disagree, with the draws around
+it, and the first disagreement in each stream. Streams are independent, so a
+draw dropped from flavor shifts only the flavor stream, while a reordered
+get_fielder_for_base shows up in baserunning.
+
+Traces are saved as a small binary file: a header, a string table (sites,
+functions, batter names, shuffle orders) and one fixed-size record per draw.
+"""
+import argparse
+import struct
+import sys
+
+from Players import get_teams
+from basebrawl5 import current_game, play_full_game
+from rng import GameRandom, STREAM_NAMES, SITE_STREAMS, game_seed, using_rng
+from simulation import matchup_rosters
+
+MAGIC = b"BBDT"
+VERSION = 1
+KINDS = ("randint", "random", "uniform", "choice", "shuffle")
+# site, kind, function, line, inning, is_top, batter (0xFFFF for none), pitch_number, value
+RECORD = struct.Struct("<HBHHHBHHd")
+NO_STRING = 0xFFFF
+
+
+class Draw:
+    """One traced draw. value is the number drawn, the index picked by choice, or the order shuffle produced."""
+    __slots__ = ("site", "kind", "function", "line", "inning", "is_top", "batter", "pitch_number", "value")
+
+    def __init__(self, site, kind, function, line, inning, is_top, batter, pitch_number, value):
+        self.site = site
+        self.kind = kind
+        self.function = function
+        self.line = line
+        self.inning = inning
+        self.is_top = is_top
+        self.batter = batter
+        self.pitch_number = pitch_number
+        self.value = value
+
+    @property
+    def stream(self):
+        return SITE_STREAMS.get(self.site, self.site)
+
+    def same_draw(self, other):
+        """Whether two draws asked the same site for the same kind of draw and got the same value."""
+        return self.site == other.site and self.kind == other.kind and self.value == other.value
+
+    def describe(self):
+        half = "top" if self.is_top else "bottom"
+        where = f"inning {self.inning} {half}"
+        if self.batter is not None:
+            where += f", {self.batter} pitch {self.pitch_number}"
+        return f"{self.site}.{self.kind} -> {self.value!r} in {self.function}:{self.line} ({where})"
+
+
+class TracingStream:
+    """
+    Wraps one site's stream and appends a Draw to trace.draws for every call,
+    with the caller's frame and where this thread's game is (see basebrawl5.current_game).
+    """
+    def __init__(self, stream, site, trace):
+        self.stream = stream
+        self.site = site
+        self.draws = trace.draws
+
+    def _record(self, kind, value):
+        caller = sys._getframe(2)
+        game = current_game()
+        if game is None:
+            inning, is_top, batter, pitch_number = 0, True, None, 0
+        else:
+            inning, is_top, pitch_number = game.inning, game.is_top, game.pitch_number
+            batter = game.batter.name if game.batter is not None else None
+        self.draws.append(Draw(self.site, kind, caller.f_code.co_name, caller.f_lineno, inning, is_top,
+                               batter, pitch_number, value))
+
+    def randint(self, a, b):
+        value = self.stream.randint(a, b)
+        self._record("randint", value)
+        return value
+
+    def random(self):
+        value = self.stream.random()
+        self._record("random", value)
+        return value
+
+    def uniform(self, a, b):
+        value = self.stream.uniform(a, b)
+        self._record("uniform", value)
+        return value
+
+    def choice(self, seq):
+        index = self.stream.choice(range(len(seq)))
+        self._record("choice", index)
+        return seq[index]
+
+    def shuffle(self, x):
+        order = list(range(len(x)))
+        self.stream.shuffle(order)
+        x[:] = [x[i] for i in order]
+        self._record("shuffle", tuple(order))
+
+
+class DrawTrace:
+    """
+    Every draw of one game, in the order they were made:
+
+        trace = DrawTrace()
+        with using_rng(trace.record(GameRandom(seed=42))):
+            play_full_game(...)
+        trace.save("game.trace")
+    """
+    def __init__(self, draws=None):
+        self.draws = draws if draws is not None else []
+
+    def record(self, rng):
+        """Wraps every stream and site of rng to trace into this trace, and returns rng."""
+        for site in STREAM_NAMES + tuple(SITE_STREAMS):
+            setattr(rng, site, TracingStream(getattr(rng, site), site, self))
+        return rng
+
+    def stream_draws(self, stream):
+        """The draws of one stream (its aliases included), in order."""
+        return [draw for draw in self.draws if draw.stream == stream]
+
+    def save(self, path):
+        strings = {}
+
+        def index(text):
+            if text is None:
+                return NO_STRING
+            if text not in strings:
+                strings[text] = len(strings)
+            return strings[text]
+
+        records = []
+        for draw in self.draws:
+            if draw.kind == "shuffle":
+                value = float(index(",".join(map(str, draw.value))))
+            else:
+                value = float(draw.value)
+            records.append(RECORD.pack(index(draw.site), KINDS.index(draw.kind), index(draw.function), draw.line,
+                                       draw.inning, draw.is_top, index(draw.batter), draw.pitch_number, value))
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<BII", VERSION, len(strings), len(records)))
+            for text in strings:
+                encoded = text.encode("utf-8")
+                f.write(struct.pack("<H", len(encoded)) + encoded)
+            f.write(b"".join(records))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a draw trace")
+        version, n_strings, n_records = struct.unpack_from("<BII", data, 4)
+        if version != VERSION:
+            raise ValueError(f"{path} is a version {version} draw trace; this reads version {VERSION}")
+        offset = 4 + struct.calcsize("<BII")
+        strings = []
+        for _ in range(n_strings):
+            (length,) = struct.unpack_from("<H", data, offset)
+            offset += 2
+            strings.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+
+        def text(i):
+            return None if i == NO_STRING else strings[i]
+
+        draws = []
+        for site, kind, function, line, inning, is_top, batter, pitch_number, value in \
+                RECORD.iter_unpack(data[offset:offset + n_records * RECORD.size]):
+            kind = KINDS[kind]
+            if kind == "shuffle":
+                value = tuple(int(i) for i in strings[int(value)].split(",") if i)
+            elif kind in ("randint", "choice"):
+                value = int(value)
+            draws.append(Draw(text(site), kind, text(function), line, inning, bool(is_top), text(batter),
+                              pitch_number, value))
+        return cls(draws)
+
+
+def first_divergence(draws_a, draws_b):
+    """Index of the first draw that differs between two draw lists, or None if they match (including length)."""
+    for i, (a, b) in enumerate(zip(draws_a, draws_b)):
+        if not a.same_draw(b):
+            return i
+    if len(draws_a) != len(draws_b):
+        return min(len(draws_a), len(draws_b))
+    return None
+
+
+def diff_traces(trace_a, trace_b):
+    """
+    {"first": index or None, "streams": {stream: index or None}}: the first
+    draw where the traces disagree overall and within each stream.
+    """
+    return {
+        "first": first_divergence(trace_a.draws, trace_b.draws),
+        "streams": {stream: first_divergence(trace_a.stream_draws(stream), trace_b.stream_draws(stream))
+                    for stream in STREAM_NAMES}
+    }
+
+
+def format_diff(trace_a, trace_b, context=3):
+    diff = diff_traces(trace_a, trace_b)
+    first = diff["first"]
+    if first is None:
+        return f"The traces match ({len(trace_a.draws)} draws)."
+    lines = [f"First divergence at draw {first} of {len(trace_a.draws)} / {len(trace_b.draws)}:"]
+    for i in range(max(0, first - context), first + context + 1):
+        marker = ">>" if i == first else "  "
+        a = trace_a.draws[i].describe() if i < len(trace_a.draws) else "(end of trace)"
+        b = trace_b.draws[i].describe() if i < len(trace_b.draws) else "(end of trace)"
+        if a == b:
+            lines.append(f"{marker} {i:>6}   {a}")
+        else:
+            lines.append(f"{marker} {i:>6} - {a}")
+            lines.append(f"{marker} {i:>6} + {b}")
+    lines.append("")
+    lines.append("First divergence per stream:")
+    for stream, index in diff["streams"].items():
+        if index is None:
+            lines.append(f"  {stream:<12} matches")
+            continue
+        stream_a = trace_a.stream_draws(stream)
+        stream_b = trace_b.stream_draws(stream)
+        a = stream_a[index].describe() if index < len(stream_a) else "(end of stream)"
+        b = stream_b[index].describe() if index < len(stream_b) else "(end of stream)"
+        lines.append(f"  {stream:<12} draw {index}: - {a}")
+        lines.append(f"  {'':<12} draw {index}: + {b}")
+    return "\n".join(lines)
+
+
+def trace_game(team_a, team_b, team_a_name, team_b_name, seed, game_index=0):
+    """Traces game game_index of a batch seeded with seed, like simulation.replay_game without alternating."""
+    trace = DrawTrace()
+    with using_rng(trace.record(GameRandom(game_seed(seed, game_index)))):
+        log = play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name)
+    return trace, log
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trace a game's random draws, or find where two traces diverge.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="trace one seeded game")
+    record_parser.add_argument("--team-a", default=None, help="team from players.csv (default: the first)")
+    record_parser.add_argument("--team-b", default=None, help="team from players.csv (default: the second)")
+    record_parser.add_argument("--seed", default="0")
+    record_parser.add_argument("--game-index", type=int, default=0)
+    record_parser.add_argument("--output", required=True)
+
+    diff_parser = commands.add_parser("diff", help="show the first draw where two traces diverge")
+    diff_parser.add_argument("before")
+    diff_parser.add_argument("after")
+    diff_parser.add_argument("--context", type=int, default=3, help="draws to show around the divergence")
+
+    show_parser = commands.add_parser("show", help="print a trace's draws")
+    show_parser.add_argument("trace")
+    show_parser.add_argument("--start", type=int, default=0)
+    show_parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        teams = get_teams()
+        names = list(teams.keys())
+        team_a, team_b, display_a, display_b = matchup_rosters(teams, args.team_a or names[0], args.team_b or names[1])
+        trace, _ = trace_game(team_a, team_b, display_a, display_b, args.seed, args.game_index)
+        trace.save(args.output)
+        print(f"Traced {len(trace.draws)} draws to {args.output}")
+    elif args.command == "diff":
+        before, after = DrawTrace.load(args.before), DrawTrace.load(args.after)
+        print(format_diff(before, after, args.context))
+        if diff_traces(before, after)["first"] is not None:
+            sys.exit(1)
+    else:
+        trace = DrawTrace.load(args.trace)
+        for i, draw in enumerate(trace.draws[args.start:args.start + args.count], start=args.start):
+            print(f"{i:>6} {draw.describe()}")
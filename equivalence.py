@@ -0,0 +1,303 @@
+"""
+Statistical equivalence between the reference engine and a candidate engine.
+
+A faster engine only replaces basebrawl5 if it plays the same game, so this
+plays many seeded games with each and tests whether the outcome distributions
+could have come from the same engine:
+
+    runs per half-inning        chi-square and KS
+    at-bat outcomes             chi-square
+    brawls per game             chi-square
+    injury tiers                chi-square
+    innings, pitches, at-bats   chi-square / KS on game length
+
+    python equivalence.py --candidate my_engine:play_full_game --games 2000
+
+Any engine with play_full_game's signature that reports its games through
+metrics.begin_game/end_game and the same GameEvents fields can be named on the
+command line. Engines that don't can be compared from code by passing a
+`play(team_a, team_b, team_a_name, team_b_name, seed)` function that returns a
+summary dict like game_summary's.
+
+The two engines get different seeds, so the samples are independent even for a
+candidate that draws random numbers exactly like the reference. Each test's
+p-value is checked against alpha divided by the number of tests (Bonferroni),
+so a faithful candidate fails about alpha of the time. KS tests on whole-number
+data are conservative, and at-bats and half-innings within a game are not
+independent, so treat borderline p-values as a prompt to rerun with more games.
+"""
+import argparse
+import importlib
+import math
+import sys
+
+from Players import get_teams
+from metrics import INJURY_TIERS, collecting_games
+from rng import GameRandom, game_seed, using_rng
+from simulation import matchup_rosters
+
+MIN_EXPECTED = 5
+
+
+#===== Game Summaries =====#
+
+def game_summary(events):
+    """The engine-neutral summary of one game compared by the tests, from its metrics.GameEvents."""
+    return {
+        "half_inning_runs": list(events.half_inning_runs),
+        "at_bats": dict(events.at_bats),
+        "brawls": events.brawls,
+        "injuries": dict(events.injuries),
+        "innings": events.innings,
+        "pitches": events.pitches
+    }
+
+
+def engine_player(play_full_game):
+    """A play function for an engine with play_full_game's signature that reports through the metrics hooks."""
+    def play(team_a, team_b, team_a_name, team_b_name, seed):
+        with collecting_games() as games, using_rng(GameRandom(seed)):
+            play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name)
+        if len(games) != 1:
+            raise ValueError(f"{play_full_game.__module__}.{play_full_game.__name__} did not report its game "
+                             f"through metrics.begin_game/end_game")
+        return game_summary(games[0])
+    return play
+
+
+def load_engine(spec):
+    """"module:function" (function defaults to play_full_game) -> play function."""
+    module_name, _, function_name = spec.partition(":")
+    return engine_player(getattr(importlib.import_module(module_name), function_name or "play_full_game"))
+
+
+def play_summaries(play, matchups, n_games, seed, label):
+    """n_games summaries, cycling through matchups and alternating home and away like simulate_matchup."""
+    summaries = []
+    for game_index in range(n_games):
+        team_a, team_b, team_a_name, team_b_name = matchups[game_index % len(matchups)]
+        game_seed_value = game_seed(f"{seed}/{label}", game_index)
+        if (game_index // len(matchups)) % 2:
+            summaries.append(play(team_b, team_a, team_b_name, team_a_name, game_seed_value))
+        else:
+            summaries.append(play(team_a, team_b, team_a_name, team_b_name, game_seed_value))
+    return summaries
+
+
+#===== Tests =====#
+
+def chi_square_sf(statistic, df):
+    """P(X >= statistic) for a chi-square distribution with df degrees of freedom."""
+    if df <= 0:
+        return 1.0
+    if statistic <= 0:
+        return 1.0
+    a = df / 2.0
+    x = statistic / 2.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1.0:
+        # Series for the lower incomplete gamma.
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1.0
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Continued fraction for the upper incomplete gamma (Lentz).
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def chi_square_test(counts_a, counts_b):
+    """
+    Chi-square test that two {category: count} samples share one distribution.
+    Categories too rare for the test are pooled. Returns (statistic, df, p_value).
+    """
+    total_a = sum(counts_a.values())
+    total_b = sum(counts_b.values())
+    total = total_a + total_b
+    if not total_a or not total_b:
+        return 0.0, 0, 1.0
+    rows = []
+    pooled = [0, 0]
+    for category in sorted(set(counts_a) | set(counts_b), key=str):
+        a, b = counts_a.get(category, 0), counts_b.get(category, 0)
+        if (a + b) * min(total_a, total_b) / total < MIN_EXPECTED:
+            pooled[0] += a
+            pooled[1] += b
+        else:
+            rows.append([a, b])
+    if pooled[0] + pooled[1]:
+        if (pooled[0] + pooled[1]) * min(total_a, total_b) / total >= MIN_EXPECTED or not rows:
+            rows.append(pooled)
+        else:
+            smallest = min(rows, key=sum)
+            smallest[0] += pooled[0]
+            smallest[1] += pooled[1]
+    statistic = 0.0
+    for a, b in rows:
+        expected_a = (a + b) * total_a / total
+        expected_b = (a + b) * total_b / total
+        statistic += (a - expected_a) ** 2 / expected_a + (b - expected_b) ** 2 / expected_b
+    df = len(rows) - 1
+    return statistic, df, chi_square_sf(statistic, df)
+
+
+def ks_test(values_a, values_b):
+    """Two-sample Kolmogorov-Smirnov test (asymptotic p-value). Returns (D, p_value)."""
+    if not values_a or not values_b:
+        return 0.0, 1.0
+    values_a = sorted(values_a)
+    values_b = sorted(values_b)
+    n, m = len(values_a), len(values_b)
+    i = j = 0
+    d = 0.0
+    while i < n and j < m:
+        value = min(values_a[i], values_b[j])
+        while i < n and values_a[i] == value:
+            i += 1
+        while j < m and values_b[j] == value:
+            j += 1
+        d = max(d, abs(i / n - j / m))
+    effective = math.sqrt(n * m / (n + m))
+    lam = (effective + 0.12 + 0.11 / effective) * d
+    if lam < 1e-3:
+        return d, 1.0
+    p = 2.0 * sum((-1) ** (k - 1) * math.exp(-2.0 * k * k * lam * lam) for k in range(1, 101))
+    return d, min(1.0, max(0.0, p))
+
+
+def _tally(values):
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def _summed(summaries, key):
+    counts = {}
+    for summary in summaries:
+        for category, count in summary[key].items():
+            counts[category] = counts.get(category, 0) + count
+    return counts
+
+
+def equivalence_tests(reference, candidate):
+    """[{"name", "test", "statistic", "df", "p_value"}] comparing two lists of game summaries."""
+    def runs(summaries):
+        return [runs for summary in summaries for runs in summary["half_inning_runs"]]
+
+    def at_bats(summary):
+        return sum(summary["at_bats"].values())
+
+    def injuries(summaries):
+        counts = _summed(summaries, "injuries")
+        return {tier: counts.get(tier, 0) for tier in INJURY_TIERS}
+
+    tests = []
+
+    def chi_square(name, counts_a, counts_b):
+        statistic, df, p_value = chi_square_test(counts_a, counts_b)
+        tests.append({"name": name, "test": "chi-square", "statistic": statistic, "df": df, "p_value": p_value})
+
+    def ks(name, values_a, values_b):
+        statistic, p_value = ks_test(values_a, values_b)
+        tests.append({"name": name, "test": "KS", "statistic": statistic, "df": None, "p_value": p_value})
+
+    chi_square("runs per half-inning", _tally(runs(reference)), _tally(runs(candidate)))
+    ks("runs per half-inning", runs(reference), runs(candidate))
+    chi_square("at-bat outcomes", _summed(reference, "at_bats"), _summed(candidate, "at_bats"))
+    chi_square("brawls per game", _tally(s["brawls"] for s in reference), _tally(s["brawls"] for s in candidate))
+    chi_square("injury tiers", injuries(reference), injuries(candidate))
+    chi_square("innings per game", _tally(s["innings"] for s in reference), _tally(s["innings"] for s in candidate))
+    ks("pitches per game", [s["pitches"] for s in reference], [s["pitches"] for s in candidate])
+    ks("at-bats per game", [at_bats(s) for s in reference], [at_bats(s) for s in candidate])
+    return tests
+
+
+#===== Comparison =====#
+
+def compare_engines(reference_play, candidate_play, matchups, n_games=2000, seed=0, alpha=0.01):
+    """
+    Plays n_games with each engine over matchups, a list of
+    (team_a, team_b, team_a_name, team_b_name), and runs equivalence_tests.
+    Returns {"games", "alpha", "threshold", "tests", "drift"}, where drift lists
+    the tests whose p-value is below threshold = alpha / number of tests.
+    """
+    reference = play_summaries(reference_play, matchups, n_games, seed, "reference")
+    candidate = play_summaries(candidate_play, matchups, n_games, seed, "candidate")
+    tests = equivalence_tests(reference, candidate)
+    threshold = alpha / len(tests)
+    for test in tests:
+        test["drift"] = test["p_value"] < threshold
+    return {
+        "games": n_games,
+        "alpha": alpha,
+        "threshold": threshold,
+        "tests": tests,
+        "drift": [f"{test['name']} ({test['test']})" for test in tests if test["drift"]]
+    }
+
+
+def assert_equivalent(report):
+    """Raises AssertionError listing every drifted test in a compare_engines report."""
+    if report["drift"]:
+        raise AssertionError("Candidate engine drifted from the reference: " + ", ".join(report["drift"])
+                             + "\n" + format_report(report))
+
+
+def default_matchups(teams=None, n_matchups=4):
+    """The first n_matchups pairings of players.csv teams, as compare_engines matchups."""
+    if teams is None:
+        teams = get_teams()
+    names = list(teams.keys())
+    pairs = [(a, b) for i, a in enumerate(names) for b in names[i + 1:]][:n_matchups]
+    return [matchup_rosters(teams, a, b) for a, b in pairs]
+
+
+def format_report(report):
+    lines = [f"{'distribution':<24} {'test':<11} {'statistic':>10} {'df':>4} {'p-value':>10}"]
+    for test in report["tests"]:
+        df = "" if test["df"] is None else test["df"]
+        flag = "  DRIFT" if test["drift"] else ""
+        lines.append(f"{test['name']:<24} {test['test']:<11} {test['statistic']:>10.4f} {df:>4} "
+                     f"{test['p_value']:>10.4g}{flag}")
+    lines.append(f"{report['games']} games per engine; drift below p = {report['threshold']:.2g} "
+                 f"(alpha {report['alpha']:g} over {len(report['tests'])} tests)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test a candidate engine's outcome distributions against basebrawl5.")
+    parser.add_argument("--candidate", default="basebrawl5:play_full_game", help="module:function to test")
+    parser.add_argument("--reference", default="basebrawl5:play_full_game", help="module:function to test against")
+    parser.add_argument("--games", type=int, default=2000, help="games per engine")
+    parser.add_argument("--matchups", type=int, default=4, help="players.csv pairings to cycle through")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--alpha", type=float, default=0.01, help="family-wise false alarm rate")
+    args = parser.parse_args()
+
+    report = compare_engines(load_engine(args.reference), load_engine(args.candidate),
+                             default_matchups(n_matchups=args.matchups), n_games=args.games,
+                             seed=args.seed, alpha=args.alpha)
+    print(format_report(report))
+    if report["drift"]:
+        print("DRIFT: " + ", ".join(report["drift"]))
+        sys.exit(1)
@@ -0,0 +1,309 @@
+"""
+Fuzzing the engine with random rosters.
+
+Each case builds two rosters from its own seed, picking for each team one of
+the shapes user uploads have broken the engine with before:
+
+    random      7-12 players with stats 0-12
+    extreme     stats of only 0, 10 and 11-20
+    one_player  a single player
+    all_zero    every stat 0
+    all_dead    every player already dead
+    huge        100-250 players
+    empty       no players at all
+
+and plays one seeded game. A case fails if the game raises, is called by the
+watchdog (watchdog.py) or runs past the timeout (the while-True loops in
+half_inning_with_fixed_base_running and the pitch loop), or an at-bat falls
+through to the "reached the end without returning a result" fallback. Cases are spread over worker processes:
+
+    python fuzz.py --games 1000000 --output fuzz.json
+    python fuzz.py --replay 0:48213            # play one case again
+
+Failures are grouped by kind and the engine line they happened on. The first
+case of each group is shrunk (players removed and stats evened out while it
+still fails the same way) into a reproducer with the rosters spelled out, so
+it still reproduces after the case generator changes.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+from Team_Upload import Player, STAT_NAMES
+from basebrawl5 import play_full_game
+from metrics import collecting_games
+from rng import GameRandom, game_seed, using_rng
+
+ROSTER_KINDS = ("random", "extreme", "one_player", "all_zero", "all_dead", "huge", "empty")
+ENGINE_FILE = "basebrawl5.py"
+# Engine functions whose loops only end when the game state says so.
+LOOP_FUNCTIONS = ("_play_full_game", "half_inning_with_fixed_base_running", "at_bat_with_pitch_sequence")
+
+
+class GameTimeout(Exception):
+    pass
+
+
+#===== Cases =====#
+
+def random_roster_spec(team_name, kind, rng):
+    """A roster of the given kind as a list of {"name", stats..., "dead"} dicts."""
+    if kind == "empty":
+        return []
+    if kind == "one_player":
+        size = 1
+    elif kind == "huge":
+        size = rng.randint(100, 250)
+    else:
+        size = rng.randint(7, 12)
+    spec = []
+    for i in range(size):
+        if kind == "all_zero":
+            stats = dict.fromkeys(STAT_NAMES, 0)
+        elif kind == "extreme":
+            stats = {stat: rng.choice((0, 0, 10, 10, rng.randint(11, 20))) for stat in STAT_NAMES}
+        else:
+            stats = {stat: rng.randint(0, 12) for stat in STAT_NAMES}
+        spec.append({"name": f"{team_name} #{i + 1}", **stats, "dead": kind == "all_dead"})
+    return spec
+
+
+def case_spec(seed, case_index):
+    """The rosters and game seed of one fuzz case: {"team_a", "team_b", "kinds", "game_seed"}."""
+    rng = random.Random(f"{seed}/{case_index}/rosters")
+    kinds = [rng.choice(ROSTER_KINDS), rng.choice(ROSTER_KINDS)]
+    return {
+        "kinds": kinds,
+        "team_a": random_roster_spec("Fuzz A", kinds[0], rng),
+        "team_b": random_roster_spec("Fuzz B", kinds[1], rng),
+        "game_seed": game_seed(seed, case_index)
+    }
+
+
+def build_roster(spec):
+    roster = []
+    for entry in spec:
+        player = Player(entry["name"], **{stat: entry[stat] for stat in STAT_NAMES})
+        player.is_dead = entry["dead"]
+        roster.append(player)
+    return roster
+
+
+#===== Running Cases =====#
+
+def _on_alarm(signum, frame):
+    raise GameTimeout()
+
+
+def engine_location(tb):
+    """"function:line" of the innermost engine frame in a traceback, and the engine call stack."""
+    frames = [frame for frame in traceback.extract_tb(tb) if os.path.basename(frame.filename) == ENGINE_FILE]
+    if not frames:
+        frames = traceback.extract_tb(tb)[-1:]
+    stack = [f"{frame.name}:{frame.lineno}" for frame in frames]
+    return (stack[-1] if stack else "?"), stack
+
+
+def run_case(spec, timeout=2.0):
+    """
+    Plays one case and returns None if it went fine, or a failure dict with its
+    "kind" (exception, timeout, called or error_fallback), "message", "location" and "stack".
+    """
+    team_a, team_b = build_roster(spec["team_a"]), build_roster(spec["team_b"])
+    use_alarm = timeout and hasattr(signal, "setitimer")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    output = io.StringIO()
+    result = {}
+    try:
+        try:
+            with collecting_games() as games, using_rng(GameRandom(spec["game_seed"])), redirect_stdout(output):
+                play_full_game(team_a, team_b, team_a, team_b, "Fuzz A", "Fuzz B", result=result)
+        finally:
+            # Disarm before looking at what happened, so the alarm can't go off while reporting a crash.
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except GameTimeout:
+        _, stack = engine_location(sys.exc_info()[2])
+        # Where the alarm lands inside a stuck loop is chance, so group timeouts by the innermost loop.
+        loops = [frame.split(":")[0] for frame in stack if frame.split(":")[0] in LOOP_FUNCTIONS]
+        location = loops[-1] if loops else "?"
+        return {"kind": "timeout", "message": f"still playing after {timeout}s", "location": location, "stack": stack}
+    except Exception as e:
+        location, stack = engine_location(e.__traceback__)
+        return {"kind": "exception", "message": f"{type(e).__name__}: {e}", "location": location, "stack": stack}
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous)
+    if result.get("called"):
+        return {"kind": "called", "message": f"called by the watchdog in inning {result['innings']}",
+                "location": result["called"], "stack": []}
+    if games and games[0].at_bats.get("error"):
+        warning = output.getvalue().strip().splitlines()
+        return {"kind": "error_fallback", "message": warning[-1] if warning else "",
+                "location": "at_bat_with_pitch_sequence", "stack": []}
+    return None
+
+
+def signature(failure):
+    """What failures are grouped by: kind, exception type and engine location."""
+    message = failure["message"].split(":")[0] if failure["kind"] == "exception" else ""
+    return f"{failure['kind']} {message} at {failure['location']}".replace("  ", " ")
+
+
+def _fuzz_chunk(job):
+    """Worker entry point: runs cases start..start+count-1 and returns (games, failures by signature)."""
+    seed, start, count, timeout = job
+    failures = {}
+    for case_index in range(start, start + count):
+        failure = run_case(case_spec(seed, case_index), timeout)
+        if failure is None:
+            continue
+        key = signature(failure)
+        if key in failures:
+            failures[key]["count"] += 1
+        else:
+            failures[key] = {**failure, "signature": key, "count": 1, "seed": seed, "case_index": case_index}
+    return count, failures
+
+
+#===== Shrinking =====#
+
+def shrink_case(spec, failure, timeout=2.0, max_attempts=300):
+    """
+    A smaller spec that still fails with the same signature: players are removed
+    (in halves, then quarters, down to one at a time), then stats set to 5 and
+    the dead revived, keeping each change that still fails the same way.
+    Stops after max_attempts games. Removing a player changes how the game's
+    draws fall, so some failures only reproduce with most of the roster left.
+    """
+    target = signature(failure)
+    attempts = 0
+
+    def still_fails(candidate):
+        nonlocal attempts
+        attempts += 1
+        result = run_case(candidate, timeout)
+        return result is not None and signature(result) == target
+
+    spec = {**spec, "team_a": list(spec["team_a"]), "team_b": list(spec["team_b"])}
+    for team in ("team_a", "team_b"):
+        # Remove runs of players, halving the run length each pass, so big rosters shrink quickly.
+        run = max(1, len(spec[team]) // 2)
+        while attempts < max_attempts:
+            i = 0
+            while i < len(spec[team]) and attempts < max_attempts:
+                candidate = {**spec, team: spec[team][:i] + spec[team][i + run:]}
+                if still_fails(candidate):
+                    spec = candidate
+                else:
+                    i += run
+            if run == 1:
+                break
+            run //= 2
+    for team in ("team_a", "team_b"):
+        for i, entry in enumerate(spec[team]):
+            for stat, plain in [(stat, 5) for stat in STAT_NAMES] + [("dead", False)]:
+                if entry[stat] == plain or attempts >= max_attempts:
+                    continue
+                roster = list(spec[team])
+                roster[i] = {**roster[i], stat: plain}
+                candidate = {**spec, team: roster}
+                if still_fails(candidate):
+                    spec = candidate
+                    entry = roster[i]
+    return spec
+
+
+#===== Farm =====#
+
+def fuzz(n_games, seed=0, workers=None, chunk_size=500, timeout=2.0, shrink=True):
+    """
+    Runs n_games fuzz cases over `workers` processes (defaults to one per CPU).
+    Returns {"games", "seconds", "games_per_second", "failed_games", "failures"},
+    where each failure group has its signature, count, first seed:case_index
+    and, with shrink, a shrunk "reproducer" spec.
+    """
+    jobs = [(seed, start, min(chunk_size, n_games - start), timeout) for start in range(0, n_games, chunk_size)]
+    started = time.perf_counter()
+    if workers == 1:
+        results = map(_fuzz_chunk, jobs)
+        failures = _merge_failures(results)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            failures = _merge_failures(executor.map(_fuzz_chunk, jobs))
+    seconds = time.perf_counter() - started
+    groups = sorted(failures.values(), key=lambda failure: -failure["count"])
+    if shrink:
+        for failure in groups:
+            failure["reproducer"] = shrink_case(case_spec(failure["seed"], failure["case_index"]), failure, timeout)
+    return {
+        "games": n_games,
+        "seconds": seconds,
+        "games_per_second": n_games / seconds if seconds else 0.0,
+        "failed_games": sum(failure["count"] for failure in groups),
+        "failures": groups
+    }
+
+
+def _merge_failures(results):
+    failures = {}
+    for _, chunk_failures in results:
+        for key, failure in chunk_failures.items():
+            if key in failures:
+                failures[key]["count"] += failure["count"]
+            else:
+                failures[key] = failure
+    return failures
+
+
+def format_fuzz_report(report):
+    lines = [f"{report['games']} games in {report['seconds']:.1f}s ({report['games_per_second']:.0f}/s), "
+             f"{report['failed_games']} failed"]
+    for failure in report["failures"]:
+        lines.append(f"{failure['count']:>8}  {failure['signature']}  (replay {failure['seed']}:{failure['case_index']})")
+        lines.append(f"{'':>8}  {failure['message']}")
+        if "reproducer" in failure:
+            reproducer = failure["reproducer"]
+            lines.append(f"{'':>8}  shrunk to {len(reproducer['team_a'])} vs {len(reproducer['team_b'])} players, "
+                         f"game seed {reproducer['game_seed']!r}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fuzz the engine with random rosters.")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--timeout", type=float, default=2.0, help="seconds before a game counts as stuck")
+    parser.add_argument("--no-shrink", action="store_true", help="skip shrinking failures into reproducers")
+    parser.add_argument("--output", default=None, help="also save the report as JSON")
+    parser.add_argument("--replay", default=None, metavar="SEED:INDEX", help="play one case and show how it went")
+    args = parser.parse_args()
+
+    if args.replay:
+        replay_seed, _, replay_index = args.replay.rpartition(":")
+        spec = case_spec(replay_seed, int(replay_index))
+        print(f"Rosters: {spec['kinds'][0]} ({len(spec['team_a'])}) vs {spec['kinds'][1]} ({len(spec['team_b'])})")
+        failure = run_case(spec, args.timeout)
+        print(json.dumps(failure, indent=2) if failure else "No failure.")
+        sys.exit(1 if failure else 0)
+
+    report = fuzz(args.games, seed=args.seed, workers=args.workers, chunk_size=args.chunk_size,
+                  timeout=args.timeout, shrink=not args.no_shrink)
+    print(format_fuzz_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if report["failures"]:
+        sys.exit(1)
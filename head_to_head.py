@@ -0,0 +1,171 @@
+"""
+Head-to-head win-probability matrix for every team in players.csv.
+
+Run `python head_to_head.py` to build or refresh h2h_matrix.json. Each cell is
+stored under the roster hashes of its two teams, so when one team's rows in
+players.csv change, only that team's row and column get simulated again.
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from Players import get_teams
+from metrics import CACHE_HITS, CACHE_MISSES
+from profiling import profiling
+from simulation import matchup_rosters, simulate_matchup, win_probability
+
+MATRIX_FILE = "h2h_matrix.json"
+DEFAULT_GAMES_PER_PAIR = 200
+
+
+def roster_hash(roster):
+    """
+    Returns a short hash of a roster's players.csv rows (names and base stats, in order).
+    Changing any player on the team changes the hash.
+    """
+    rows = [
+        f"{p.name},{p.base_power},{p.base_agility},{p.base_chutzpah},{p.base_batting},"
+        f"{p.base_pitching},{p.base_baserunning},{p.base_fielding},{p.base_brawling}"
+        for p in roster
+    ]
+    return hashlib.sha1("\n".join(rows).encode("utf-8")).hexdigest()[:16]
+
+
+def cell_key(hash_a, hash_b):
+    return f"{hash_a}:{hash_b}"
+
+
+def load_matrix_cache(path=MATRIX_FILE):
+    """Load the saved cells, or an empty cache if the file doesn't exist yet."""
+    if not os.path.exists(path):
+        return {"cells": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_matrix_cache(cache, path=MATRIX_FILE):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def lookup_cell(cells, hash_a, hash_b, games_per_pair=0):
+    """
+    Returns Team A's win probability from the cache, or None if the pair is missing
+    or was simulated with fewer than games_per_pair games.
+    Cells are only stored one way round, so the reverse pair is flipped.
+    """
+    tally = cells.get(cell_key(hash_a, hash_b))
+    if tally is not None and tally["games"] >= games_per_pair:
+        return win_probability(tally)
+    tally = cells.get(cell_key(hash_b, hash_a))
+    if tally is not None and tally["games"] >= games_per_pair:
+        return 1.0 - win_probability(tally)
+    return None
+
+
+def _simulate_pair(job):
+    """Worker entry point: simulates one pair and returns (key, tally)."""
+    key, teams, team_a_name, team_b_name, n_games, seed = job
+    team_a, team_b, display_a, display_b = matchup_rosters(teams, team_a_name, team_b_name)
+    pair_seed = None if seed is None else f"{seed}/{team_a_name}/{team_b_name}"
+    return key, simulate_matchup(team_a, team_b, display_a, display_b, n_games, seed=pair_seed)
+
+
+def stale_pairs(teams, cells, games_per_pair):
+    """
+    Lists the (team_a_name, team_b_name) pairs, including mirror matches, that have
+    no cached result for the current rosters.
+    """
+    names = list(teams.keys())
+    hashes = {name: roster_hash(teams[name]) for name in names}
+    pairs = []
+    for i, name_a in enumerate(names):
+        for name_b in names[i:]:
+            if lookup_cell(cells, hashes[name_a], hashes[name_b], games_per_pair) is None:
+                pairs.append((name_a, name_b))
+    return pairs
+
+
+def build_matrix(teams=None, games_per_pair=DEFAULT_GAMES_PER_PAIR, workers=None, path=MATRIX_FILE, seed=None):
+    """
+    Brings the saved matrix up to date and returns it (see load_matrix).
+    Only pairs without a cached result for the current rosters are simulated,
+    spread across `workers` processes (defaults to one per CPU).
+    With a seed, each pair's games are seeded from the seed and the team names,
+    so the matrix comes out the same for any number of workers.
+    """
+    if teams is None:
+        teams = get_teams()
+    cache = load_matrix_cache(path)
+    cells = cache.get("cells", {})
+    hashes = {name: roster_hash(roster) for name, roster in teams.items()}
+
+    jobs = []
+    for name_a, name_b in stale_pairs(teams, cells, games_per_pair):
+        key = cell_key(hashes[name_a], hashes[name_b])
+        subset = {name_a: teams[name_a], name_b: teams[name_b]}
+        jobs.append((key, subset, name_a, name_b, games_per_pair, seed))
+    n_teams = len(teams)
+    CACHE_MISSES.inc(len(jobs), cache="h2h_matrix")
+    CACHE_HITS.inc(n_teams * (n_teams + 1) // 2 - len(jobs), cache="h2h_matrix")
+
+    if jobs:
+        if workers == 1:
+            results = [_simulate_pair(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_simulate_pair, jobs))
+        for key, tally in results:
+            cells[key] = tally
+
+    # Drop cells that no current pair of rosters refers to.
+    live_keys = set()
+    for hash_a in hashes.values():
+        for hash_b in hashes.values():
+            live_keys.add(cell_key(hash_a, hash_b))
+    cache["cells"] = {key: tally for key, tally in cells.items() if key in live_keys}
+    cache["teams"] = hashes
+    save_matrix_cache(cache, path)
+    return load_matrix(teams, path=path)
+
+
+def load_matrix(teams=None, path=MATRIX_FILE):
+    """
+    Reads the saved matrix without simulating anything.
+    Returns {"teams": [...], "probabilities": [[...]], "stale": n}, where
+    probabilities[i][j] is the chance that teams[i] beats teams[j] (None if not cached)
+    and stale counts the pairings with no result for the current rosters.
+    """
+    if teams is None:
+        teams = get_teams()
+    cells = load_matrix_cache(path).get("cells", {})
+    names = list(teams.keys())
+    hashes = [roster_hash(teams[name]) for name in names]
+    probabilities = [[lookup_cell(cells, hash_a, hash_b) for hash_b in hashes] for hash_a in hashes]
+    stale = sum(1 for i, row in enumerate(probabilities) for p in row[i:] if p is None)
+    return {"teams": names, "probabilities": probabilities, "stale": stale}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the head-to-head win-probability matrix.")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES_PER_PAIR, help="games per pair")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--output", default=MATRIX_FILE, help="where to save the matrix")
+    parser.add_argument("--seed", default=None, help="seed the games so the matrix can be reproduced")
+    parser.add_argument("--profile", default=None, metavar="PATH",
+                        help="profile the build and write it to PATH (use --workers 1; see profiling.py)")
+    args = parser.parse_args()
+
+    teams = get_teams()
+    pending = stale_pairs(teams, load_matrix_cache(args.output).get("cells", {}), args.games)
+    print(f"Simulating {len(pending)} of {len(teams) * (len(teams) + 1) // 2} pairings...")
+    with profiling(args.profile) if args.profile else nullcontext():
+        matrix = build_matrix(teams, games_per_pair=args.games, workers=args.workers, path=args.output,
+                              seed=args.seed)
+    for name, row in zip(matrix["teams"], matrix["probabilities"]):
+        print(f"{name:>30} " + " ".join(f"{p:.2f}" for p in row))
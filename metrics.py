@@ -0,0 +1,295 @@
+"""
+In-process metrics for running the simulator as a service.
+
+Counters and histograms live in a Registry and can be read in Prometheus text
+format, either from a local HTTP endpoint or from a file rewritten every few
+seconds:
+
+    enable_engine_metrics()
+    serve_metrics(port=9108)                    # GET http://localhost:9108/metrics
+    MetricsDumper("metrics.prom", interval=15).start()
+
+Cache hits and misses (the game reservoir and the head-to-head matrix) and
+games called by the watchdog are always counted. What happens inside games (pitches, at-bats, brawls, injuries, deaths)
+is only counted after enable_engine_metrics(), since it costs a little on
+every pitch; when it is off the engine checks one attribute per at-bat.
+"""
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+INJURY_TIERS = ("Winded", "Shook Up", "Injured", "Knocked Out", "Killed")
+
+
+#===== Metric Types =====#
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+class Counter:
+    """A count that only goes up, optionally split by labels: counter.inc(tier="Winded")."""
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self.values.get(tuple(sorted(labels.items())), 0)
+
+    def samples(self):
+        with self.lock:
+            values = dict(self.values) or {(): 0}
+        return [f"{self.name}{_label_text(key)} {value}" for key, value in sorted(values.items())]
+
+
+class Histogram:
+    """Observations counted into cumulative buckets, with their sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            if index < len(self.buckets):
+                self.bucket_counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def samples(self):
+        with self.lock:
+            bucket_counts = list(self.bucket_counts)
+            total, count = self.sum, self.count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {count}')
+        lines.append(f"{self.name}_sum {total}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+
+    def _add(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help_text):
+        return self._add(Counter(name, help_text))
+
+    def histogram(self, name, help_text, buckets):
+        return self._add(Histogram(name, help_text, buckets))
+
+    def render(self):
+        """Every metric in Prometheus text exposition format."""
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+#===== Basebrawl Metrics =====#
+
+REGISTRY = Registry()
+GAMES = REGISTRY.counter("basebrawl_games_total", "Games played to the end.")
+PITCHES = REGISTRY.counter("basebrawl_pitches_total", "Pitches thrown.")
+BRAWLS = REGISTRY.counter("basebrawl_brawls_total", "Brawls that broke out.")
+INJURIES = REGISTRY.counter("basebrawl_injuries_total", "Injuries from collisions and brawls, by tier.")
+DEATHS = REGISTRY.counter("basebrawl_deaths_total", "Players who died.")
+FORFEITS = REGISTRY.counter("basebrawl_forfeits_total", "Games that ended by forfeit.")
+EXTRA_INNINGS = REGISTRY.counter("basebrawl_extra_inning_games_total", "Games that went past the 9th inning.")
+GAMES_CALLED = REGISTRY.counter("basebrawl_games_called_total", "Games called off by the watchdog, by reason.")
+AT_BATS = REGISTRY.counter("basebrawl_at_bats_total", "Finished at-bats, by outcome.")
+CACHE_HITS = REGISTRY.counter("basebrawl_cache_hits_total", "Requests served from a cache, by cache.")
+CACHE_MISSES = REGISTRY.counter("basebrawl_cache_misses_total", "Requests a cache had to compute, by cache.")
+RESERVOIR_FAILURES = REGISTRY.counter("basebrawl_reservoir_failures_total",
+                                      "Games the reservoir's refill thread failed to simulate.")
+GAME_DURATION = REGISTRY.histogram("basebrawl_game_duration_seconds", "Wall-clock time to play a game.",
+                                   (0.001, 0.002, 0.004, 0.006, 0.008, 0.01, 0.015, 0.02, 0.05, 0.1, 0.5))
+PITCHES_PER_GAME = REGISTRY.histogram("basebrawl_pitches_per_game", "Pitches thrown in a game.",
+                                      (100, 150, 200, 250, 300, 350, 400, 500, 700, 1000))
+RUNS_PER_HALF_INNING = REGISTRY.histogram("basebrawl_runs_per_half_inning", "Runs scored in a completed half-inning.",
+                                          (0, 1, 2, 3, 4, 5, 6, 8, 10, 15))
+
+
+class GameEvents:
+    """
+    What has happened so far in the game being played on this thread.
+    at_bats counts finished at-bats by the engine's outcome name ("strike_out",
+    "potential_single", ...); forfeit and innings are set when the game ends.
+    """
+    __slots__ = ("start", "pitches", "brawls", "deaths", "injuries", "at_bats", "half_inning_runs",
+                 "forfeit", "innings")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.pitches = 0
+        self.brawls = 0
+        self.deaths = 0
+        self.injuries = dict.fromkeys(INJURY_TIERS, 0)
+        self.at_bats = {}
+        self.half_inning_runs = []
+        self.forfeit = False
+        self.innings = 0
+
+
+class _GameState(threading.local):
+    events = None
+    collected = None
+
+
+# The engine reads game_state.events, which is None unless engine metrics are on.
+game_state = _GameState()
+_engine_metrics = False
+
+
+def enable_engine_metrics(enabled=True):
+    """Start (or stop) counting what happens inside games."""
+    global _engine_metrics
+    _engine_metrics = enabled
+
+
+@contextmanager
+def collecting_games():
+    """
+    Yields a list that gets the GameEvents of every game finished on this thread
+    inside the with-block, whether or not engine metrics are on.
+    """
+    previous = game_state.collected
+    game_state.collected = collected = []
+    try:
+        yield collected
+    finally:
+        game_state.collected = previous
+
+
+def begin_game():
+    """Called by play_full_game as a game starts."""
+    game_state.events = GameEvents() if _engine_metrics or game_state.collected is not None else None
+
+
+def end_game(forfeit, innings):
+    """Called by play_full_game as a game ends, however it ends."""
+    events = game_state.events
+    if events is None:
+        return
+    game_state.events = None
+    events.forfeit = forfeit
+    events.innings = innings
+    if game_state.collected is not None:
+        game_state.collected.append(events)
+    if not _engine_metrics:
+        return
+    GAMES.inc()
+    PITCHES.inc(events.pitches)
+    BRAWLS.inc(events.brawls)
+    DEATHS.inc(events.deaths)
+    for tier, count in events.injuries.items():
+        if count:
+            INJURIES.inc(count, tier=tier)
+    for outcome, count in events.at_bats.items():
+        AT_BATS.inc(count, outcome=outcome)
+    for runs in events.half_inning_runs:
+        RUNS_PER_HALF_INNING.observe(runs)
+    if forfeit:
+        FORFEITS.inc()
+    if innings > 9:
+        EXTRA_INNINGS.inc()
+    GAME_DURATION.observe(time.perf_counter() - events.start)
+    PITCHES_PER_GAME.observe(events.pitches)
+
+
+def game_called(reason):
+    """Called by play_full_game when the watchdog calls a game (see watchdog.py); always counted."""
+    GAMES_CALLED.inc(reason=reason)
+
+
+def injury_tier(outcome):
+    """The tier an apply_injury_to_player outcome counts under (collisions knock players out)."""
+    if outcome.startswith("Collision"):
+        return "Knocked Out"
+    for tier in INJURY_TIERS:
+        if outcome.startswith(tier):
+            return tier
+    return None
+
+
+#===== Export =====#
+
+def serve_metrics(port=9108, host="127.0.0.1", registry=REGISTRY):
+    """
+    Serves registry at http://host:port/metrics from a daemon thread and returns
+    the server (call shutdown() to stop it).
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def dump_metrics(path, registry=REGISTRY):
+    """Writes registry to path in Prometheus text format (via a temporary file, so readers never see half of it)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(registry.render())
+    os.replace(tmp_path, path)
+
+
+class MetricsDumper(threading.Thread):
+    """Rewrites the metrics file every `interval` seconds until stop() is called."""
+    def __init__(self, path, interval=15.0, registry=REGISTRY):
+        super().__init__(name="metrics-dump", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            dump_metrics(self.path, self.registry)
+
+    def stop(self):
+        self.stopped.set()
+        dump_metrics(self.path, self.registry)
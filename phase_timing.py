@@ -0,0 +1,105 @@
+"""
+Optional per-phase timing for the engine.
+
+The engine checks `state.timer` once per call of an instrumented function and
+then only tests a local variable around each phase, so with no timer set the
+hooks cost next to nothing. With a PhaseTimer set, every phase's time is
+charged to it exclusively: a brawl that breaks out during a walk counts as
+brawl time, not walk time.
+
+    timer = PhaseTimer()
+    with timing_phases(timer):
+        log = play_full_game(...)
+    print(format_breakdown(timer.breakdown()))
+
+`python -m benchmarks phases` does this over a batch of seeded games.
+
+Phases:
+
+    roster_copy         deep-copying both rosters at the start of play_full_game
+    injury_recovery     recovery rolls at the start of each half-inning
+    knockout_decrement  counting down knockouts at the start of each half-inning
+    batter_selection    forfeit check, eligible batters and get_next_batter
+    pickoffs            pickoff attempts before the pitch
+    steals              delayed steal attempts before the pitch
+    pitch_loop          at_bat_with_pitch_sequence
+    hit_baserunning     process_hit_with_correct_base_running
+    walks               moving runners on walks and beanings
+    brawls              simulate_brawl and its aftermath
+    log_rendering       play descriptions, batter status and half-inning summaries
+    other               everything else in the game
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+PHASES = ("roster_copy", "injury_recovery", "knockout_decrement", "batter_selection", "pickoffs", "steals", "pitch_loop",
+          "hit_baserunning", "walks", "brawls", "log_rendering", "other")
+
+
+class _TimingState(threading.local):
+    timer = None
+
+
+# The engine reads state.timer; like the RNG it is per thread.
+state = _TimingState()
+
+
+class PhaseTimer:
+    """Accumulates exclusive wall-clock seconds and entry counts per phase."""
+    def __init__(self):
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.stack = []
+        self.last = 0.0
+
+    def enter(self, phase):
+        now = time.perf_counter()
+        if self.stack:
+            self.seconds[self.stack[-1]] += now - self.last
+        self.stack.append(phase)
+        self.calls[phase] += 1
+        self.last = now
+
+    def exit(self):
+        now = time.perf_counter()
+        self.seconds[self.stack.pop()] += now - self.last
+        self.last = now
+
+    def add(self, other):
+        for phase in PHASES:
+            self.seconds[phase] += other.seconds[phase]
+            self.calls[phase] += other.calls[phase]
+
+    def breakdown(self):
+        """{phase: {"ms", "calls", "share"}}, where share is the fraction of all timed time."""
+        total = sum(self.seconds.values())
+        return {
+            phase: {
+                "ms": self.seconds[phase] * 1000.0,
+                "calls": self.calls[phase],
+                "share": self.seconds[phase] / total if total else 0.0
+            }
+            for phase in PHASES
+        }
+
+
+@contextmanager
+def timing_phases(timer):
+    """Charge the engine's phases on this thread to timer inside the with-block; time outside phases is "other"."""
+    previous = state.timer
+    state.timer = timer
+    timer.enter("other")
+    try:
+        yield timer
+    finally:
+        del timer.stack[1:]
+        timer.exit()
+        state.timer = previous
+
+
+def format_breakdown(breakdown):
+    lines = [f"{'phase':<20} {'ms':>10} {'calls':>8} {'share':>7}"]
+    for phase, row in sorted(breakdown.items(), key=lambda item: -item[1]["ms"]):
+        lines.append(f"{phase:<20} {row['ms']:>10.2f} {row['calls']:>8} {row['share']:>7.1%}")
+    return "\n".join(lines)
@@ -0,0 +1,192 @@
+"""
+Profiling with flamegraph and speedscope output.
+
+    python profiling.py --output profile.speedscope.json
+    python profiling.py --output h2h.folded head_to_head.py --games 20 --workers 1
+    python -m benchmarks --profile phases.speedscope.json phases
+
+With no script, a batch of seeded games is profiled; otherwise the script runs
+with the arguments after it, as `python script.py ...` would. From code:
+
+    with profiling("profile.speedscope.json"):
+        play_full_game(...)
+
+The default profiler samples the running thread's stack every millisecond,
+which costs little and gives whole call stacks, so time shows up under the
+engine function that spent it (attempt_base_advancement, format_player_status,
+...). Output formats, picked from the file extension unless given:
+
+    speedscope  (.json) JSON for https://www.speedscope.app
+    collapsed   (.folded, .txt) "outer;inner;leaf microseconds" lines for flamegraph.pl, inferno or speedscope
+    pstats      (.prof, .pstats) cProfile statistics for pstats or snakeviz (uses cProfile instead of sampling)
+
+Only the thread that starts profiling is sampled, so run parallel workloads
+with one worker.
+"""
+import argparse
+import cProfile
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from Players import get_teams
+from simulation import matchup_rosters, simulate_matchup
+
+FORMATS = ("speedscope", "collapsed", "pstats")
+
+
+def format_for_path(path):
+    """The format a --profile path asks for: .prof/.pstats for pstats, .txt/.folded/.collapsed for collapsed, else speedscope."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".prof", ".pstats"):
+        return "pstats"
+    if extension in (".txt", ".folded", ".collapsed"):
+        return "collapsed"
+    return "speedscope"
+
+
+class SamplingProfiler(threading.Thread):
+    """Records the stack of one thread every `interval` seconds until stop() is called."""
+    def __init__(self, thread_id=None, interval=0.001):
+        super().__init__(name="sampling-profiler", daemon=True)
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.samples = []
+        self.weights = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        last = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((getattr(code, "co_qualname", code.co_name), code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(tuple(stack))
+            self.weights.append(now - last)
+            last = now
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def frame_label(frame):
+    name, filename, line = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def write_collapsed(samples, weights, path):
+    """One "outer;inner;leaf microseconds" line per distinct stack."""
+    totals = Counter()
+    for stack, weight in zip(samples, weights):
+        totals[";".join(frame_label(frame) for frame in stack)] += weight
+    with open(path, "w") as f:
+        for stack, seconds in totals.most_common():
+            f.write(f"{stack} {max(1, round(seconds * 1e6))}\n")
+
+
+def write_speedscope(samples, weights, path, name="basebrawl"):
+    """A speedscope "sampled" profile, weighted by the seconds between samples."""
+    frames = []
+    frame_index = {}
+    indexed_samples = []
+    for stack in samples:
+        indices = []
+        for frame in stack:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            indices.append(frame_index[frame])
+        indexed_samples.append(indices)
+    total = sum(weights)
+    document = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": total,
+            "samples": indexed_samples,
+            "weights": weights
+        }],
+        "name": name,
+        "exporter": "basebrawl profiling.py"
+    }
+    with open(path, "w") as f:
+        json.dump(document, f)
+
+
+@contextmanager
+def profiling(path, format=None, interval=0.001):
+    """Profiles the with-block on this thread and writes the result to path (format defaults to format_for_path)."""
+    format = format or format_for_path(path)
+    if format not in FORMATS:
+        raise ValueError(f"Unknown profile format: {format}")
+    if format == "pstats":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            profiler.dump_stats(path)
+        return
+
+    # The sampler only gets the GIL when the profiled thread gives it up, so ask for that more often.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval / 2))
+    sampler = SamplingProfiler(interval=interval)
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+        if format == "collapsed":
+            write_collapsed(sampler.samples, sampler.weights, path)
+        else:
+            write_speedscope(sampler.samples, sampler.weights, path)
+
+
+def play_seeded_games(n_games, seed=0, team_a_name=None, team_b_name=None):
+    """The default workload: n_games seeded games between two players.csv teams."""
+    teams = get_teams()
+    names = list(teams.keys())
+    team_a, team_b, display_a, display_b = matchup_rosters(teams, team_a_name or names[0], team_b_name or names[1])
+    return simulate_matchup(team_a, team_b, display_a, display_b, n_games, seed=seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile a Basebrawl workload.")
+    parser.add_argument("--output", default="profile.speedscope.json", help="where to write the profile")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="default: from the output's extension")
+    parser.add_argument("--interval", type=float, default=0.001, help="seconds between samples")
+    parser.add_argument("--games", type=int, default=200, help="games for the default workload")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--team-a", default=None)
+    parser.add_argument("--team-b", default=None)
+    parser.add_argument("script", nargs="?", help="script to profile instead of the default workload")
+    parser.add_argument("script_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    with profiling(args.output, format=args.format, interval=args.interval):
+        if args.script:
+            sys.argv = [args.script] + args.script_args
+            runpy.run_path(args.script, run_name="__main__")
+        else:
+            play_seeded_games(args.games, seed=args.seed, team_a_name=args.team_a, team_b_name=args.team_b)
+    print(f"Wrote {args.format or format_for_path(args.output)} profile to {args.output}")
@@ -0,0 +1,174 @@
+"""
+Rare-event rate estimates by importance sampling.
+
+Incinerations, foul-limit smitings, brawl deaths and the everyone-dies tie are
+too rare to count well by brute force. Here the engine's rare-event sites (see
+rng.py) draw from tilted odds that make those events common, and every game is
+weighted by the likelihood ratio of the draws it made, so the weighted rates
+are still unbiased estimates of the real ones.
+
+Only draws that happen near an event are tilted (a raw 75, a long foul streak,
+a brawl casualty), and each event is estimated in its own run with only its own
+sites tilted, so each game makes few tilted draws and the weights stay tame.
+The tilts are deliberately mild: every tilted draw that doesn't produce the event
+makes the game's weight swing, so strong tilts on common draws end up noisier
+than brute force. Check effective_games when changing them.
+The everyone-dies tie isn't decided by any single draw, so it is counted by
+plain simulation.
+"""
+import math
+import re
+
+from Players import get_teams
+from rng import GameRandom, game_seed, using_rng
+from simulation import matchup_rosters
+from basebrawl5 import play_full_game
+
+# Tilts for each rare-event site. "targets" are the randint values to favour and
+# "mix" the chance of drawing from them; "below"/"below_chance" tilt random()
+# so that it lands below the threshold with the given chance.
+DEFAULT_TILTS = {
+    # Heat rolls of 1-10 (heat is rolled against power, which tops out at 10)
+    # and the 25% beaning check.
+    "beaning": {"targets": range(1, 11), "mix": 0.3, "below": 0.25, "below_chance": 0.6},
+    # The foul band for the contact roll, widened to cover most batting/chutzpah gaps.
+    "foul_streak": {"targets": range(30, 60), "mix": 0.7},
+    # Injury rolls of 96+ are "Killed". Kills aren't that rare per game, so this stays gentle.
+    "casualty": {"targets": range(96, 101), "mix": 0.05},
+}
+
+
+class TiltedStream:
+    """
+    Stands in for a random stream at one rare-event site.
+    randint draws from a mix of the usual uniform roll and a uniform pick from
+    the target values; random() lands below `below` with probability below_chance.
+    Each draw multiplies owner.weight by its likelihood ratio (real odds / tilted odds).
+    """
+    def __init__(self, stream, owner, targets=(), mix=0.5, below=None, below_chance=0.5):
+        self.stream = stream
+        self.owner = owner
+        self.targets = frozenset(targets)
+        self.mix = mix
+        self.below = below
+        self.below_chance = below_chance
+        self.targets_by_range = {}
+
+    def randint(self, a, b):
+        key = (a, b)
+        if key not in self.targets_by_range:
+            self.targets_by_range[key] = sorted(v for v in self.targets if a <= v <= b)
+        targets = self.targets_by_range[key]
+        if not targets:
+            return self.stream.randint(a, b)
+        if self.stream.random() < self.mix:
+            value = self.stream.choice(targets)
+        else:
+            value = self.stream.randint(a, b)
+        n = b - a + 1
+        tilted = (1 - self.mix) / n
+        if value in self.targets:
+            tilted += self.mix / len(targets)
+        self.owner.weight *= (1 / n) / tilted
+        return value
+
+    def random(self):
+        if self.below is None:
+            return self.stream.random()
+        u = self.stream.random()
+        if self.stream.random() < self.below_chance:
+            self.owner.weight *= self.below / self.below_chance
+            return u * self.below
+        self.owner.weight *= (1 - self.below) / (1 - self.below_chance)
+        return self.below + u * (1 - self.below)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class RareEventRandom(GameRandom):
+    """A GameRandom whose rare-event sites are tilted, tracking the game's likelihood ratio in weight."""
+    def __init__(self, seed=None, tilts=None):
+        super().__init__(seed)
+        self.weight = 1.0
+        for site, params in (DEFAULT_TILTS if tilts is None else tilts).items():
+            setattr(self, site, TiltedStream(getattr(self, site), self, **params))
+
+
+#===== Event Counting =====#
+
+def count_brawl_deaths(log, result):
+    """Number of players listed as killed in brawl casualty lines."""
+    deaths = 0
+    for line in log:
+        if "casualties:" not in line:
+            continue
+        for names in re.findall(r"(?:^|! |: )([^!:]*?) (?:is|are) killed!", line):
+            deaths += len(re.split(r", | and ", names))
+    return deaths
+
+
+# Each rare event, the sites tilted to estimate it, and how to count it in a game's log.
+RARE_EVENTS = {
+    "incineration": (("beaning",), lambda log, result: sum("is INCINERATED!" in line for line in log)),
+    "foul_limit_smite": (("foul_streak",), lambda log, result: sum("is SMITED!" in line for line in log)),
+    "killed_in_brawl": (("casualty",), count_brawl_deaths),
+    "everyone_dies": ((), lambda log, result: sum("Everyone dies!" in line for line in log)),
+}
+
+
+def estimate_rare_event(event, team_a, team_b, team_a_name, team_b_name, n_games, seed=0, tilts=None):
+    """
+    Plays n_games with only this event's sites tilted and returns the estimated
+    number of times it happens per game: {"rate", "std_error", "hits", "effective_games"}.
+    hits is how often it actually happened in the tilted games, and effective_games
+    is the effective sample size of the weights; if that is far below n_games the
+    tilts are too aggressive for this matchup.
+    """
+    sites, count_event = RARE_EVENTS[event]
+    tilts = DEFAULT_TILTS if tilts is None else tilts
+    event_tilts = {site: tilts[site] for site in sites if site in tilts}
+    weights = []
+    weighted = []
+    hits = 0
+    for game_index in range(n_games):
+        rng = RareEventRandom(seed=game_seed(seed, game_index), tilts=event_tilts)
+        result = {}
+        with using_rng(rng):
+            if game_index % 2 == 1:
+                log = play_full_game(team_b, team_a, team_b, team_a, team_b_name, team_a_name, result=result)
+            else:
+                log = play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name, result=result)
+        count = count_event(log, result)
+        hits += count
+        weights.append(rng.weight)
+        weighted.append(rng.weight * count)
+
+    rate = sum(weighted) / n_games
+    if n_games > 1:
+        variance = sum((x - rate) ** 2 for x in weighted) / (n_games - 1)
+        std_error = math.sqrt(variance / n_games)
+    else:
+        std_error = float("nan")
+    squares = sum(w * w for w in weights)
+    effective_games = sum(weights) ** 2 / squares if squares else 0.0
+    return {"rate": rate, "std_error": std_error, "hits": hits, "effective_games": effective_games}
+
+
+def estimate_rare_events(team_a, team_b, team_a_name, team_b_name, n_games, seed=0, tilts=None):
+    """
+    estimate_rare_event for every event in RARE_EVENTS, each in its own run so that
+    one event's tilts don't add noise to another's weights.
+    """
+    return {
+        event: estimate_rare_event(event, team_a, team_b, team_a_name, team_b_name, n_games, seed=seed, tilts=tilts)
+        for event in RARE_EVENTS
+    }
+
+
+def estimate_rare_events_by_name(team_a_name, team_b_name, n_games, seed=0, teams=None):
+    """estimate_rare_events for two teams from players.csv, looked up by name."""
+    if teams is None:
+        teams = get_teams()
+    team_a, team_b, display_a, display_b = matchup_rosters(teams, team_a_name, team_b_name)
+    return estimate_rare_events(team_a, team_b, display_a, display_b, n_games, seed=seed)
@@ -0,0 +1,152 @@
+"""
+A small stock of pre-simulated games so the app can serve a game instantly.
+
+The reservoir keeps a few finished games for the matchups users are likely to
+ask for next (each open session's dropdown pair in both batting orders) plus a
+few random pairs for the SCRAMBLERIZER. A background thread tops the stock back
+up whenever a game is taken, so serving a game only costs rendering its log.
+One reservoir is shared by every session of the app; a session that hasn't
+said what it wants for session_ttl seconds is forgotten.
+"""
+import random
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from Players import get_teams
+from metrics import CACHE_HITS, CACHE_MISSES, RESERVOIR_FAILURES
+from simulation import matchup_rosters
+from basebrawl5 import play_full_game
+
+RANDOM_KEY = "random"
+# Seconds the refill thread waits after a game raises, doubling with each failure in a row up to the max.
+FAILURE_BACKOFF = 1.0
+MAX_FAILURE_BACKOFF = 60.0
+
+
+class GameReservoir:
+    def __init__(self, teams=None, depth=2, random_depth=3, session_ttl=600):
+        """
+        depth is how many games to keep for each wanted matchup,
+        random_depth how many random-pair games to keep for the SCRAMBLERIZER,
+        session_ttl how many seconds a session's wanted matchups last without a new call to want.
+        """
+        self.teams = teams if teams is not None else get_teams()
+        self.team_names = list(self.teams.keys())
+        self.depth = depth
+        self.random_depth = random_depth
+        self.session_ttl = session_ttl
+        self.stock = {RANDOM_KEY: deque()}
+        # session -> (time of its last want call, its matchups)
+        self.sessions = {}
+        self.wanted = []
+        self.condition = threading.Condition()
+        self.worker = threading.Thread(target=self._refill_forever, name="game-reservoir", daemon=True)
+        self.worker.start()
+
+    # --- Requests from the app ---
+
+    def want(self, matchups, session=None):
+        """
+        Tell the reservoir which matchups a session wants kept stocked, most likely first.
+        Each matchup is (team_a_name, team_b_name, flipped), using the same
+        flip_order convention as the app. This replaces the session's earlier
+        matchups but not other sessions'. Stock for matchups no session wants any more is dropped.
+        """
+        now = time.monotonic()
+        with self.condition:
+            self.sessions[session] = (now, list(matchups))
+            for other, (last_seen, _) in list(self.sessions.items()):
+                if now - last_seen > self.session_ttl:
+                    del self.sessions[other]
+            # The most recently active session's matchups are filled first.
+            self.wanted = []
+            for _, session_matchups in sorted(self.sessions.values(), key=lambda entry: entry[0], reverse=True):
+                for key in session_matchups:
+                    if key not in self.wanted:
+                        self.wanted.append(key)
+            for key in list(self.stock):
+                if key != RANDOM_KEY and key not in self.wanted:
+                    del self.stock[key]
+            for key in self.wanted:
+                self.stock.setdefault(key, deque())
+            self.condition.notify()
+
+    def take(self, team_a_name, team_b_name, flipped=False):
+        """
+        Returns the log of a finished game for this matchup.
+        Falls back to simulating it on the spot if the stock is empty.
+        """
+        key = (team_a_name, team_b_name, flipped)
+        with self.condition:
+            games = self.stock.get(key)
+            log = games.popleft() if games else None
+            self.condition.notify()
+        if log is None:
+            CACHE_MISSES.inc(cache="reservoir")
+            log = self.simulate(key)
+        else:
+            CACHE_HITS.inc(cache="reservoir")
+        return log
+
+    def take_random(self):
+        """Returns the log of a finished game between two random teams."""
+        with self.condition:
+            games = self.stock[RANDOM_KEY]
+            log = games.popleft() if games else None
+            self.condition.notify()
+        if log is None:
+            CACHE_MISSES.inc(cache="reservoir")
+            log = self.simulate(RANDOM_KEY)
+        else:
+            CACHE_HITS.inc(cache="reservoir")
+        return log
+
+    # --- Simulation ---
+
+    def simulate(self, key):
+        """Play the game a stock key stands for and return its log."""
+        if key == RANDOM_KEY:
+            team_a_name, team_b_name = random.sample(self.team_names, 2)
+            flipped = False
+        else:
+            team_a_name, team_b_name, flipped = key
+        team_a, team_b, display_a, display_b = matchup_rosters(self.teams, team_a_name, team_b_name)
+        if flipped:
+            return play_full_game(team_b, team_a, team_b, team_a, display_b, display_a)
+        return play_full_game(team_a, team_b, team_a, team_b, display_a, display_b)
+
+    def _next_key_to_fill(self):
+        """The most wanted key that is below its target depth, or None if everything is full."""
+        for key in self.wanted:
+            if len(self.stock[key]) < self.depth:
+                return key
+        if len(self.stock[RANDOM_KEY]) < self.random_depth:
+            return RANDOM_KEY
+        return None
+
+    def _refill_forever(self):
+        failures = 0
+        while True:
+            with self.condition:
+                key = self._next_key_to_fill()
+                while key is None:
+                    self.condition.wait()
+                    key = self._next_key_to_fill()
+            # A game that raises must not kill the thread, or every session loses the stock for good.
+            try:
+                log = self.simulate(key)
+            except Exception:
+                RESERVOIR_FAILURES.inc()
+                print(f"Game reservoir: simulating {key} failed:", file=sys.stderr)
+                traceback.print_exc()
+                time.sleep(min(FAILURE_BACKOFF * 2 ** failures, MAX_FAILURE_BACKOFF))
+                failures += 1
+                continue
+            failures = 0
+            with self.condition:
+                # The user may have changed the dropdowns while we were simulating.
+                if key in self.stock:
+                    self.stock[key].append(log)
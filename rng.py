@@ -0,0 +1,314 @@
+"""
+Random number streams for the Basebrawl engine.
+
+Every roll the engine makes goes through one of a few named streams, so two
+games given the same seed use the same numbers for the same kind of event,
+even if one of them rolls more often somewhere else:
+
+    pitch        pitch rolls, heat, bunts and contact
+    baserunning  baserunning rolls, assists, pickoffs, steals and rundowns
+    brawl        whether a brawl breaks out and how it goes
+    injury       collision injuries and recovery rolls
+    lineup       batting order, defensive positions, pitchers and stints
+    flavor       which flavor text gets printed
+
+The default GameRandom sends every stream to the global random module, so
+unseeded games still draw from it. They don't draw exactly as they used to,
+though: every game now rolls its players' pitching stints as it starts (from
+the lineup stream) instead of copying the stints rolled when the rosters were
+loaded, so each game makes one more draw for every player with odd agility.
+
+Where seeded streams come from is up to the backend (see BACKENDS):
+
+    mersenne     random.Random, the stdlib Mersenne Twister (the default)
+    numpy        NumPy's PCG64, drawing d100s and uniforms in blocks (needs numpy)
+
+and a DrawTape can record every draw of a game and play it back exactly.
+
+A few draw sites are aliases of a stream rather than streams of their own.
+They draw the same numbers in the same order as their stream, but give
+rare_events.py, variance_reduction.py and the benchmarks a place to change
+the odds or count draws:
+
+    first_pitch  raw roll of the first pitch of each at-bat (pitch)
+    later_pitch  raw roll of every later pitch of the at-bat (pitch)
+    contact      contact roll, until the foul_streak site takes over (pitch)
+    beaning      heat roll and beaning check on a pitch whose raw roll is 75 (pitch)
+    foul_streak  contact roll once the batter has fouled 3+ times this at-bat (pitch)
+    casualty     injury rolls for brawl casualties (brawl)
+"""
+import hashlib
+import json
+import random
+import threading
+from contextlib import contextmanager
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+STREAM_NAMES = ("pitch", "baserunning", "brawl", "injury", "lineup", "flavor")
+SITE_STREAMS = {
+    "first_pitch": "pitch",
+    "later_pitch": "pitch",
+    "contact": "pitch",
+    "beaning": "pitch",
+    "foul_streak": "pitch",
+    "casualty": "brawl",
+}
+
+
+#===== Backends =====#
+# A backend is a function (seed, stream_name) -> stream. A stream needs the
+# methods the engine calls: randint, random, uniform, choice and shuffle.
+
+def mersenne_stream(seed, name):
+    """The stdlib Mersenne Twister; unseeded streams share the global random module."""
+    if seed is None:
+        return random
+    return random.Random(f"{seed}/{name}")
+
+
+class NumpyStream:
+    """
+    A stream on NumPy's PCG64 that draws d100s and uniforms in blocks and hands
+    them out from a buffer, so each roll is a list pop instead of a trip through
+    random.Random.randint. Other ranges, choice and shuffle are built on the
+    buffered uniforms. Blocks start small, since a game only makes a few hundred
+    draws per stream, and double up to block_size for long-lived streams.
+    """
+    def __init__(self, seed=None, block_size=4096):
+        if numpy is None:
+            raise ImportError("The numpy RNG backend needs numpy installed (pip install numpy)")
+        if seed is not None:
+            seed = int.from_bytes(hashlib.sha256(str(seed).encode()).digest()[:16], "big")
+        self.generator = numpy.random.Generator(numpy.random.PCG64(seed))
+        self.block_size = block_size
+        self.d100_block = self.uniform_block = 32
+        self.d100s = []
+        self.uniforms = []
+
+    def randint(self, a, b):
+        if a == 1 and b == 100:
+            if not self.d100s:
+                self.d100s = self.generator.integers(1, 101, size=self.d100_block).tolist()
+                self.d100_block = min(2 * self.d100_block, self.block_size)
+            return self.d100s.pop()
+        return a + int(self.random() * (b - a + 1))
+
+    def random(self):
+        if not self.uniforms:
+            self.uniforms = self.generator.random(self.uniform_block).tolist()
+            self.uniform_block = min(2 * self.uniform_block, self.block_size)
+        return self.uniforms.pop()
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, x):
+        for i in range(len(x) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            x[i], x[j] = x[j], x[i]
+
+
+def numpy_stream(seed, name):
+    """Buffered PCG64; unseeded streams are seeded from the OS like random.Random()."""
+    return NumpyStream(None if seed is None else f"{seed}/{name}")
+
+
+BACKENDS = {"mersenne": mersenne_stream, "numpy": numpy_stream}
+_default_backend = "mersenne"
+
+
+def set_default_backend(backend):
+    """
+    Pick the backend GameRandom uses when none is given, by name or as a function.
+    Batch helpers that build their own GameRandoms pick it up too. Worker
+    processes only see it if they are forked after it is set.
+    """
+    global _default_backend, _default_rng
+    if isinstance(backend, str) and backend not in BACKENDS:
+        raise ValueError(f"Unknown RNG backend: {backend}")
+    _default_backend = backend
+    _default_rng = GameRandom()
+
+
+class GameRandom:
+    """
+    One game's set of random streams.
+    Each stream comes from the backend (a name in BACKENDS or a function, see
+    above) given the seed and the stream name. With the default mersenne backend
+    and seed=None every stream is the global random module; otherwise each
+    stream is its own random.Random seeded from the seed and the stream name.
+    Wrappers that need to know where the game is can ask
+    basebrawl5.current_game(); a GameRandom can be shared by many games at once
+    (the unseeded default is), so it doesn't keep track of that itself.
+    """
+    def __init__(self, seed=None, backend=None):
+        self.seed = seed
+        if backend is None:
+            backend = _default_backend
+        if isinstance(backend, str):
+            backend = BACKENDS[backend]
+        for name in STREAM_NAMES:
+            setattr(self, name, backend(seed, name))
+        for site, name in SITE_STREAMS.items():
+            setattr(self, site, getattr(self, name))
+
+
+def game_seed(master_seed, game_index):
+    """
+    The seed for game number game_index of a batch run with master_seed.
+    Each game's streams depend only on these two numbers (random.Random hashes
+    string seeds with SHA-512, so not even on the process or PYTHONHASHSEED),
+    so game k plays out the same however the batch is split across workers,
+    and can be replayed on its own with GameRandom(game_seed(master_seed, k)).
+    """
+    return f"{master_seed}:{game_index}"
+
+
+#===== Draw Tapes =====#
+
+class RecordingStream:
+    """
+    Wraps a stream and appends (kind, value) to draws for every call.
+    choice is recorded as the index picked and shuffle as the resulting order,
+    drawn from the wrapped stream exactly as a direct call would be.
+    """
+    def __init__(self, stream, draws):
+        self.stream = stream
+        self.draws = draws
+
+    def randint(self, a, b):
+        value = self.stream.randint(a, b)
+        self.draws.append(("randint", value))
+        return value
+
+    def random(self):
+        value = self.stream.random()
+        self.draws.append(("random", value))
+        return value
+
+    def uniform(self, a, b):
+        value = self.stream.uniform(a, b)
+        self.draws.append(("uniform", value))
+        return value
+
+    def choice(self, seq):
+        index = self.stream.choice(range(len(seq)))
+        self.draws.append(("choice", index))
+        return seq[index]
+
+    def shuffle(self, x):
+        order = list(range(len(x)))
+        self.stream.shuffle(order)
+        x[:] = [x[i] for i in order]
+        self.draws.append(("shuffle", order))
+
+
+class ReplayStream:
+    """Hands back a recorded stream's draws in order, failing loudly if the game asks for something else."""
+    def __init__(self, draws):
+        self.draws = draws
+        self.position = 0
+
+    def _next(self, kind):
+        if self.position >= len(self.draws):
+            raise ValueError(f"Replay tape ran out after {self.position} draws")
+        recorded_kind, value = self.draws[self.position]
+        if recorded_kind != kind:
+            raise ValueError(f"Replay tape has a {recorded_kind} at draw {self.position}, but the game asked for {kind}")
+        self.position += 1
+        return value
+
+    def randint(self, a, b):
+        return self._next("randint")
+
+    def random(self):
+        return self._next("random")
+
+    def uniform(self, a, b):
+        return self._next("uniform")
+
+    def choice(self, seq):
+        return seq[self._next("choice")]
+
+    def shuffle(self, x):
+        order = self._next("shuffle")
+        x[:] = [x[i] for i in order]
+
+
+class DrawTape:
+    """
+    Every draw one game made, stream by stream:
+
+        tape = DrawTape()
+        with using_rng(tape.record(GameRandom(seed=42))):
+            log = play_full_game(...)
+        with using_rng(tape.replay()):
+            assert play_full_game(...) == log
+    """
+    def __init__(self, draws=None):
+        self.draws = draws if draws is not None else {name: [] for name in STREAM_NAMES}
+
+    def record(self, rng):
+        """Wraps rng's streams (and the sites that alias them) to record into this tape, and returns rng."""
+        for name in STREAM_NAMES:
+            stream = getattr(rng, name)
+            recorder = RecordingStream(stream, self.draws[name])
+            setattr(rng, name, recorder)
+            for site, site_stream in SITE_STREAMS.items():
+                if site_stream == name and getattr(rng, site) is stream:
+                    setattr(rng, site, recorder)
+        return rng
+
+    def replay_stream(self, seed, name):
+        """Backend that plays this tape back; use replay() rather than calling it directly."""
+        return ReplayStream(self.draws[name])
+
+    def replay(self):
+        """A GameRandom that draws exactly what the recorded game drew."""
+        return GameRandom(backend=self.replay_stream)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.draws, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls({name: [tuple(draw) for draw in draws] for name, draws in json.load(f).items()})
+
+
+# The engine looks up the streams per thread, so the app's sessions and the
+# background reservoir can each play their own games at the same time.
+_local = threading.local()
+_default_rng = GameRandom()
+
+
+def current_rng():
+    """The GameRandom the engine should roll with on this thread."""
+    return getattr(_local, "rng", _default_rng)
+
+
+@contextmanager
+def using_rng(rng):
+    """
+    Make the engine roll with rng inside the with-block on this thread:
+
+        with using_rng(GameRandom(seed=42)):
+            log = play_full_game(...)
+    """
+    previous = getattr(_local, "rng", None)
+    _local.rng = rng
+    try:
+        yield rng
+    finally:
+        if previous is None:
+            del _local.rng
+        else:
+            _local.rng = previous
@@ -0,0 +1,197 @@
+"""
+Scaling studies on synthetic leagues.
+
+players.csv only has 9-player teams, so this builds leagues of any size out
+of copies of its players (renamed, since players are told apart by name) and
+measures how the engine grows:
+
+    roster   time and peak memory per game as teams grow from 9 to 100 players
+    league   time per game and league memory from 16 to 10,000 teams
+    workers  games per second of a parallel batch as workers are added
+
+Run `python scaling.py --output scaling.json` for all three. Each curve point
+also gets a growth exponent, the slope of log(cost) against log(size) from the
+previous point: about 1 is linear, about 2 is quadratic.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+import tracemalloc
+
+from Players import get_teams
+from Team_Upload import Player
+from basebrawl5 import play_full_game
+from rng import GameRandom, game_seed, using_rng
+from simulation import simulate_matchup_parallel
+
+ROSTER_SIZES = (9, 12, 18, 25, 35, 50, 70, 100)
+LEAGUE_SIZES = (16, 100, 1000, 10000)
+
+STAT_NAMES = ("power", "agility", "chutzpah", "batting", "pitching", "baserunning", "fielding", "brawling")
+
+
+#===== Synthetic Leagues =====#
+
+def synthetic_team(team_name, players_per_team, templates, rng):
+    """A roster of players_per_team copies of random template players, each with its own name."""
+    roster = []
+    for i in range(players_per_team):
+        template = rng.choice(templates)
+        stats = {stat: getattr(template, "base_" + stat) for stat in STAT_NAMES}
+        roster.append(Player(name=f"{team_name} #{i + 1}", **stats))
+    return roster
+
+
+def synthetic_league(n_teams, players_per_team=9, seed=0):
+    """{team_name: roster} for n_teams synthetic teams built from players.csv's players."""
+    templates = [player for roster in get_teams().values() for player in roster]
+    rng = random.Random(f"{seed}/league")
+    return {
+        f"Team {t + 1}": synthetic_team(f"Team {t + 1}", players_per_team, templates, rng)
+        for t in range(n_teams)
+    }
+
+
+#===== Measurements =====#
+
+def time_games(pairs, seed=0):
+    """Plays each (team_a, team_b, name_a, name_b) pair once, seeded, and returns milliseconds per game."""
+    start = time.perf_counter()
+    for game_index, (team_a, team_b, name_a, name_b) in enumerate(pairs):
+        with using_rng(GameRandom(game_seed(seed, game_index))):
+            play_full_game(team_a, team_b, team_a, team_b, name_a, name_b)
+    return (time.perf_counter() - start) * 1000.0 / len(pairs)
+
+
+def peak_game_memory(team_a, team_b, name_a, name_b, seed=0):
+    """Peak memory in KiB allocated while playing one seeded game."""
+    tracemalloc.start()
+    try:
+        with using_rng(GameRandom(game_seed(seed, 0))):
+            play_full_game(team_a, team_b, team_a, team_b, name_a, name_b)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024.0
+
+
+def add_growth_exponents(points, size_key, cost_key):
+    """Sets each point's "growth_exponent": log(cost ratio) / log(size ratio) against the previous point."""
+    previous = None
+    for point in points:
+        point["growth_exponent"] = None
+        if previous is not None and previous[cost_key] > 0 and point[cost_key] > 0:
+            point["growth_exponent"] = (math.log(point[cost_key] / previous[cost_key])
+                                        / math.log(point[size_key] / previous[size_key]))
+        previous = point
+    return points
+
+
+def roster_size_curve(sizes=ROSTER_SIZES, games=20, seed=0):
+    """ms per game and peak KiB per game for two synthetic teams of each size."""
+    points = []
+    for size in sizes:
+        league = synthetic_league(2, size, seed=seed)
+        (name_a, team_a), (name_b, team_b) = league.items()
+        ms = time_games([(team_a, team_b, name_a, name_b)] * games, seed=seed)
+        points.append({
+            "players_per_team": size,
+            "ms_per_game": ms,
+            "peak_kib_per_game": peak_game_memory(team_a, team_b, name_a, name_b, seed=seed)
+        })
+    return add_growth_exponents(points, "players_per_team", "ms_per_game")
+
+
+def league_size_curve(sizes=LEAGUE_SIZES, players_per_team=9, games=50, seed=0):
+    """
+    Time to build each league, its memory in MiB, and ms per game between random
+    pairs of its teams (which should stay flat, since a game only touches its two teams).
+    """
+    points = []
+    for n_teams in sizes:
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            league = synthetic_league(n_teams, players_per_team, seed=seed)
+            build_ms = (time.perf_counter() - start) * 1000.0
+            league_mib = tracemalloc.get_traced_memory()[0] / (1024.0 * 1024.0)
+        finally:
+            tracemalloc.stop()
+        names = list(league)
+        rng = random.Random(f"{seed}/pairs")
+        pairs = []
+        for _ in range(games):
+            name_a, name_b = rng.sample(names, 2)
+            pairs.append((league[name_a], league[name_b], name_a, name_b))
+        points.append({
+            "teams": n_teams,
+            "players_per_team": players_per_team,
+            "build_ms": build_ms,
+            "league_mib": league_mib,
+            "ms_per_game": time_games(pairs, seed=seed)
+        })
+        del league, pairs
+    return add_growth_exponents(points, "teams", "league_mib")
+
+
+def worker_curve(worker_counts=None, games=400, players_per_team=9, seed=0):
+    """Games per second and speedup over one worker for a seeded parallel batch."""
+    if worker_counts is None:
+        cpus = os.cpu_count() or 1
+        worker_counts = sorted({w for w in (1, 2, 4, 8, cpus) if w <= cpus})
+    league = synthetic_league(2, players_per_team, seed=seed)
+    (name_a, team_a), (name_b, team_b) = league.items()
+    points = []
+    for workers in worker_counts:
+        chunk_size = max(1, games // (4 * workers))
+        start = time.perf_counter()
+        simulate_matchup_parallel(team_a, team_b, name_a, name_b, games, seed=seed, workers=workers,
+                                  chunk_size=chunk_size)
+        seconds = time.perf_counter() - start
+        points.append({"workers": workers, "games_per_second": games / seconds})
+    for point in points:
+        point["speedup"] = point["games_per_second"] / points[0]["games_per_second"]
+    return points
+
+
+def format_curve(title, points):
+    lines = [title]
+    keys = list(points[0].keys()) if points else []
+    lines.append("  ".join(f"{key:>18}" for key in keys))
+    for point in points:
+        cells = []
+        for key in keys:
+            value = point[key]
+            cells.append(f"{'-':>18}" if value is None else f"{value:>18.3f}" if isinstance(value, float)
+                         else f"{value:>18}")
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure how the engine scales on synthetic leagues.")
+    parser.add_argument("--study", choices=("roster", "league", "workers", "all"), default="all")
+    parser.add_argument("--games", type=int, default=20, help="games per point (workers: games per batch x 20)")
+    parser.add_argument("--roster-sizes", type=int, nargs="+", default=list(ROSTER_SIZES))
+    parser.add_argument("--league-sizes", type=int, nargs="+", default=list(LEAGUE_SIZES))
+    parser.add_argument("--workers", type=int, nargs="+", default=None, help="worker counts to try")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--output", default=None, help="also save the curves as JSON")
+    args = parser.parse_args()
+
+    curves = {}
+    if args.study in ("roster", "all"):
+        curves["roster"] = roster_size_curve(args.roster_sizes, games=args.games, seed=args.seed)
+        print(format_curve("Roster size", curves["roster"]))
+    if args.study in ("league", "all"):
+        curves["league"] = league_size_curve(args.league_sizes, games=args.games, seed=args.seed)
+        print(format_curve("League size", curves["league"]))
+    if args.study in ("workers", "all"):
+        curves["workers"] = worker_curve(args.workers, games=args.games * 20, seed=args.seed)
+        print(format_curve("Workers", curves["workers"]))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(curves, f, indent=2)
@@ -0,0 +1,367 @@
+"""
+Headless batch simulation for Basebrawl matchups.
+
+These helpers run play_full_game many times and tally who won instead of
+keeping the play-by-play, so we can estimate win probabilities.
+"""
+import copy
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from statistics import NormalDist
+
+from Players import get_teams
+from Team_Upload import next_player_id
+from basebrawl5 import play_full_game
+from rng import GameRandom, game_seed, using_rng
+
+
+def matchup_rosters(teams, team_a_name, team_b_name):
+    """
+    Returns (team_a, team_b, display_a, display_b) for a matchup, built the same way the app does.
+    If a team plays itself, Team A becomes "<name> (CLONES)" and each of its players is
+    renamed "CLONE <name>" and given a new player ID, so the mirror match has two independent rosters.
+    """
+    if team_a_name == team_b_name:
+        team_a = copy.deepcopy(teams[team_a_name])
+        team_b = copy.deepcopy(teams[team_b_name])
+        for player in team_a:
+            player.name = "CLONE " + player.name
+            player.player_id = next_player_id()
+        return team_a, team_b, team_a_name + " (CLONES)", team_b_name
+    return teams[team_a_name], teams[team_b_name], team_a_name, team_b_name
+
+
+def play_game_result(team_a, team_b, team_a_name, team_b_name):
+    """
+    Plays one game and returns the result dict filled in by play_full_game
+    (score_a, score_b, winner, forfeit, innings). The log is thrown away.
+    """
+    result = {}
+    play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name, result=result)
+    return result
+
+
+def game_value(result, side="a"):
+    """
+    Scores a single game from one side's point of view:
+    1 for a win, 0.5 for the everyone-dies tie, 0 for a loss.
+    """
+    if result["winner"] is None:
+        return 0.5
+    return 1.0 if result["winner"] == side else 0.0
+
+
+def new_tally():
+    return {"games": 0, "wins_a": 0, "wins_b": 0, "ties": 0}
+
+
+def add_to_tally(tally, winner):
+    """Count one game, where winner is "a", "b" or None from Team A's point of view."""
+    tally["games"] += 1
+    if winner == "a":
+        tally["wins_a"] += 1
+    elif winner == "b":
+        tally["wins_b"] += 1
+    else:
+        tally["ties"] += 1
+
+
+def merge_tallies(tallies):
+    """Adds up tallies of the same matchup, e.g. the chunks of a parallel run."""
+    total = new_tally()
+    for tally in tallies:
+        for key in total:
+            total[key] += tally[key]
+    return total
+
+
+def seeded_game(seed, game_index):
+    """
+    Context manager that plays game game_index of a batch with its own streams
+    (see rng.game_seed), or with the current streams when seed is None.
+    """
+    if seed is None:
+        return nullcontext()
+    return using_rng(GameRandom(game_seed(seed, game_index)))
+
+
+def play_matchup_game(team_a, team_b, team_a_name, team_b_name, game_index, alternate=True, seed=None):
+    """
+    Plays game number game_index of a matchup and returns the winner ("a", "b" or None)
+    from Team A's point of view. With alternate=True the teams swap who bats first
+    on odd-numbered games, like the app's flip_order. With a seed the game depends
+    only on (seed, game_index).
+    """
+    with seeded_game(seed, game_index):
+        if alternate and game_index % 2 == 1:
+            result = play_game_result(team_b, team_a, team_b_name, team_a_name)
+            return {"a": "b", "b": "a"}.get(result["winner"])
+        return play_game_result(team_a, team_b, team_a_name, team_b_name)["winner"]
+
+
+def simulate_matchup(team_a, team_b, team_a_name, team_b_name, n_games, alternate=True, seed=None, start=0):
+    """
+    Plays n_games between two rosters and returns a tally dict
+    ({"games", "wins_a", "wins_b", "ties"}) from Team A's point of view.
+    The games are numbered from start, so a seeded batch can be played in chunks
+    and the chunks' tallies merged.
+    """
+    tally = new_tally()
+    for game_index in range(start, start + n_games):
+        add_to_tally(tally, play_matchup_game(team_a, team_b, team_a_name, team_b_name, game_index, alternate,
+                                              seed=seed))
+    return tally
+
+
+def win_probability(tally):
+    """Team A's win probability from a tally, counting ties as half a win."""
+    if tally["games"] == 0:
+        return 0.5
+    return (tally["wins_a"] + 0.5 * tally["ties"]) / tally["games"]
+
+
+def confidence_interval(tally, z=1.96):
+    """
+    Wilson score interval for Team A's win probability (95% by default).
+    With no games played the interval is the whole range [0, 1].
+    """
+    n = tally["games"]
+    if n == 0:
+        return 0.0, 1.0
+    p = win_probability(tally)
+    denominator = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+#===== Time-Budgeted Estimates =====#
+
+def estimate_matchup(team_a, team_b, team_a_name, team_b_name, budget_ms=200, alternate=True):
+    """
+    Plays as many games as fit in budget_ms of wall-clock time and returns
+    {"win_probability", "games", "ci_low", "ci_high", "elapsed_ms"} for Team A.
+    A new game is only started if the average game so far still fits in the
+    time left, so the budget is overshot by at most one unusually long game.
+    """
+    tally = new_tally()
+    start = time.perf_counter()
+    deadline = start + budget_ms / 1000.0
+    now = start
+    while True:
+        average_game = (now - start) / tally["games"] if tally["games"] else 0.0
+        if now >= deadline or now + average_game > deadline:
+            break
+        add_to_tally(tally, play_matchup_game(team_a, team_b, team_a_name, team_b_name, tally["games"], alternate))
+        now = time.perf_counter()
+    ci_low, ci_high = confidence_interval(tally)
+    return {
+        "win_probability": win_probability(tally),
+        "games": tally["games"],
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "elapsed_ms": (now - start) * 1000.0
+    }
+
+
+def estimate_matchup_by_name(team_a_name, team_b_name, budget_ms=200, teams=None):
+    """
+    estimate_matchup for two teams from players.csv, looked up by name.
+    A team can be matched against itself (its clones bat as Team A).
+    """
+    if teams is None:
+        teams = get_teams()
+    team_a, team_b, display_a, display_b = matchup_rosters(teams, team_a_name, team_b_name)
+    return estimate_matchup(team_a, team_b, display_a, display_b, budget_ms=budget_ms)
+
+
+#===== Sequential Early Stopping =====#
+
+def sprt_step(value, p0, p1):
+    """
+    Log-likelihood ratio contributed by one game (1 win, 0.5 tie, 0 loss)
+    for H1: p = p1 against H0: p = p0.
+    """
+    return value * math.log(p1 / p0) + (1 - value) * math.log((1 - p1) / (1 - p0))
+
+
+def sequential_checkpoints(min_games, max_games):
+    """The game counts at which simulate_matchup_sequential's "ci" method looks at its interval."""
+    checkpoints = set()
+    games = min_games
+    while games < max_games:
+        checkpoints.add(games)
+        games *= 2
+    checkpoints.add(max_games)
+    return checkpoints
+
+
+def simulate_matchup_sequential(team_a, team_b, team_a_name, team_b_name, threshold=0.5, alpha=0.05,
+                                beta=0.05, indifference=0.05, max_games=10000, method="sprt",
+                                min_games=10, alternate=True):
+    """
+    Plays games until it is known, at the chosen error rates, whether Team A's win
+    probability is above or below threshold (0.5 asks "who wins this matchup?").
+
+    method="sprt" runs Wald's sequential probability ratio test of
+    p = threshold - indifference against p = threshold + indifference; alpha and beta
+    are its false-"above" and false-"below" rates. Matchups that really sit inside
+    the indifference zone can take up to max_games.
+    method="ci" looks at the Wilson interval only at doubling checkpoints (min_games,
+    2 * min_games, 4 * min_games, ... and max_games) and stops at the first one where
+    the interval no longer contains threshold. alpha is split evenly across the
+    checkpoints (Bonferroni), so the chance of a wrong decision at any of them stays
+    under alpha, however many there are. Its ci_low and ci_high use the split alpha too.
+
+    Returns {"decision": "above" | "below" | "undecided", "win_probability", "games",
+    "ci_low", "ci_high"} plus the tally counts.
+    """
+    if method not in ("sprt", "ci"):
+        raise ValueError(f"Unknown sequential method: {method}")
+    if min_games < 1:
+        raise ValueError(f"min_games must be at least 1, got {min_games}")
+    p0 = min(max(threshold - indifference, 1e-6), 1 - 1e-6)
+    p1 = min(max(threshold + indifference, 1e-6), 1 - 1e-6)
+    upper = math.log((1 - beta) / alpha)
+    lower = math.log(beta / (1 - alpha))
+    checkpoints = sequential_checkpoints(min_games, max_games)
+    looks = len(checkpoints) if method == "ci" else 1
+    z = NormalDist().inv_cdf(1 - alpha / (2 * looks))
+
+    tally = new_tally()
+    llr = 0.0
+    decision = "undecided"
+    while tally["games"] < max_games:
+        winner = play_matchup_game(team_a, team_b, team_a_name, team_b_name, tally["games"], alternate)
+        add_to_tally(tally, winner)
+        if method == "sprt":
+            llr += sprt_step(game_value({"winner": winner}), p0, p1)
+            if llr >= upper:
+                decision = "above"
+                break
+            if llr <= lower:
+                decision = "below"
+                break
+        elif tally["games"] in checkpoints:
+            ci_low, ci_high = confidence_interval(tally, z)
+            if ci_low > threshold:
+                decision = "above"
+                break
+            if ci_high < threshold:
+                decision = "below"
+                break
+
+    ci_low, ci_high = confidence_interval(tally, z)
+    summary = dict(tally)
+    summary.update({
+        "decision": decision,
+        "win_probability": win_probability(tally),
+        "ci_low": ci_low,
+        "ci_high": ci_high
+    })
+    return summary
+
+
+#===== Common Random Numbers =====#
+
+def matchup_variant(team_a, team_b, team_a_name, team_b_name, alternate=True):
+    """
+    Wraps a matchup as a variant for simulate_paired: a function of the game index
+    that plays that game and returns Team A's result (1 win, 0.5 tie, 0 loss).
+    """
+    def play(game_index):
+        winner = play_matchup_game(team_a, team_b, team_a_name, team_b_name, game_index, alternate)
+        return game_value({"winner": winner})
+    return play
+
+
+def simulate_paired(variant_a, variant_b, n_games, seed=0):
+    """
+    Plays game k of both variants with the same random streams (common random numbers),
+    so the difference between them comes from the variants rather than from luck.
+    A variant is any function of the game index returning a number, e.g. from
+    matchup_variant, or one that changes a rule before playing.
+
+    Returns {"games", "mean_a", "mean_b", "difference", "std_error", "ci_low", "ci_high",
+    "correlation"}, where difference is mean_b - mean_a, std_error is the paired
+    standard error of that difference, and the interval is 95%.
+    """
+    if n_games < 1:
+        raise ValueError(f"simulate_paired needs at least one game, got {n_games}")
+    values_a = []
+    values_b = []
+    for game_index in range(n_games):
+        with using_rng(GameRandom(game_seed(seed, game_index))):
+            values_a.append(variant_a(game_index))
+        with using_rng(GameRandom(game_seed(seed, game_index))):
+            values_b.append(variant_b(game_index))
+
+    mean_a = sum(values_a) / n_games
+    mean_b = sum(values_b) / n_games
+    differences = [b - a for a, b in zip(values_a, values_b)]
+    difference = mean_b - mean_a
+    if n_games > 1:
+        variance = sum((d - difference) ** 2 for d in differences) / (n_games - 1)
+        std_error = math.sqrt(variance / n_games)
+    else:
+        std_error = float("nan")
+    spread_a = math.sqrt(sum((a - mean_a) ** 2 for a in values_a))
+    spread_b = math.sqrt(sum((b - mean_b) ** 2 for b in values_b))
+    if spread_a > 0 and spread_b > 0:
+        covariance = sum((a - mean_a) * (b - mean_b) for a, b in zip(values_a, values_b))
+        correlation = covariance / (spread_a * spread_b)
+    else:
+        correlation = float("nan")
+    return {
+        "games": n_games,
+        "mean_a": mean_a,
+        "mean_b": mean_b,
+        "difference": difference,
+        "std_error": std_error,
+        "ci_low": difference - 1.96 * std_error,
+        "ci_high": difference + 1.96 * std_error,
+        "correlation": correlation
+    }
+
+
+#===== Reproducible Parallel Batches =====#
+
+def _simulate_chunk(job):
+    """Worker entry point: plays one chunk of a seeded batch and returns its tally."""
+    team_a, team_b, team_a_name, team_b_name, start, n_games, alternate, seed = job
+    return simulate_matchup(team_a, team_b, team_a_name, team_b_name, n_games, alternate, seed=seed, start=start)
+
+
+def simulate_matchup_parallel(team_a, team_b, team_a_name, team_b_name, n_games, seed=0, workers=None,
+                              chunk_size=1000, alternate=True):
+    """
+    simulate_matchup spread over `workers` processes (defaults to one per CPU) in
+    chunks of chunk_size games. Every game is seeded from (seed, game index), so
+    the tally is the same for any number of workers or chunk size, and any single
+    game can be looked at again with replay_game.
+    """
+    jobs = []
+    for start in range(0, n_games, chunk_size):
+        count = min(chunk_size, n_games - start)
+        jobs.append((team_a, team_b, team_a_name, team_b_name, start, count, alternate, seed))
+    if workers == 1:
+        return merge_tallies(_simulate_chunk(job) for job in jobs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_tallies(executor.map(_simulate_chunk, jobs))
+
+
+def replay_game(team_a, team_b, team_a_name, team_b_name, seed, game_index, alternate=True):
+    """
+    Plays game game_index of a seeded batch again, on its own, and returns
+    (log, result) exactly as that game went in the batch. result is from the
+    point of view of whichever team batted first, as in play_full_game.
+    """
+    result = {}
+    with seeded_game(seed, game_index):
+        if alternate and game_index % 2 == 1:
+            log = play_full_game(team_b, team_a, team_b, team_a, team_b_name, team_a_name, result=result)
+        else:
+            log = play_full_game(team_a, team_b, team_a, team_b, team_a_name, team_b_name, result=result)
+    return log, result
@@ -0,0 +1,111 @@
+"""
+Limits on how long one game can run.
+
+Every game gets a Watchdog that counts its pitches and plate appearances (each
+time the half-inning loop calls a batter up) and, optionally, watches the
+clock. When a limit is passed the game is called: play_full_game stops, logs
+why, and returns the partial score with result["called"] set to the reason,
+and metrics.GAMES_CALLED counts it. Lines from the half-inning in progress are
+lost, since that half never finished.
+
+The default limits are far beyond any real game (a nine-inning game throws
+about 300 pitches) and only count, so seeded games play out the same on any
+machine. A wall-clock limit is off by default for the same reason; turn it on
+for services that would rather drop a game than hold a worker:
+
+    set_default_limits(GameLimits(max_pitches=2000, max_plate_appearances=600, max_seconds=0.5))
+
+    with game_limits(GameLimits(max_seconds=0.1)):     # this thread only
+        log = play_full_game(...)
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+
+class GameLimits:
+    """Per-game limits; None means no limit."""
+    def __init__(self, max_pitches=None, max_plate_appearances=None, max_seconds=None):
+        self.max_pitches = max_pitches
+        self.max_plate_appearances = max_plate_appearances
+        self.max_seconds = max_seconds
+
+    def __bool__(self):
+        return any(limit is not None for limit in (self.max_pitches, self.max_plate_appearances, self.max_seconds))
+
+
+DEFAULT_LIMITS = GameLimits(max_pitches=2000, max_plate_appearances=600)
+NO_LIMITS = GameLimits()
+
+
+class GameCalled(Exception):
+    """Raised inside the engine when a game passes one of its limits; play_full_game catches it."""
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class Watchdog:
+    """Counts one game's pitches and plate appearances and raises GameCalled past its limits."""
+    __slots__ = ("limits", "pitches", "plate_appearances", "deadline")
+
+    def __init__(self, limits):
+        self.limits = limits
+        self.pitches = 0
+        self.plate_appearances = 0
+        self.deadline = time.perf_counter() + limits.max_seconds if limits.max_seconds is not None else None
+
+    def _check_clock(self):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise GameCalled("time limit")
+
+    def pitch(self):
+        self.pitches += 1
+        if self.limits.max_pitches is not None and self.pitches > self.limits.max_pitches:
+            raise GameCalled("pitch limit")
+        self._check_clock()
+
+    def plate_appearance(self):
+        self.plate_appearances += 1
+        if self.limits.max_plate_appearances is not None and self.plate_appearances > self.limits.max_plate_appearances:
+            raise GameCalled("plate appearance limit")
+        self._check_clock()
+
+
+class _WatchdogState(threading.local):
+    limits = None
+    watchdog = None
+
+
+# The engine reads state.watchdog, which is None when no limits apply.
+state = _WatchdogState()
+_default_limits = DEFAULT_LIMITS
+
+
+def set_default_limits(limits):
+    """The limits for games on threads without their own (NO_LIMITS turns the watchdog off)."""
+    global _default_limits
+    _default_limits = limits
+
+
+@contextmanager
+def game_limits(limits):
+    """Play games on this thread with limits inside the with-block."""
+    previous = state.limits
+    state.limits = limits
+    try:
+        yield limits
+    finally:
+        state.limits = previous
+
+
+def begin_watchdog():
+    """Called by play_full_game as a game starts."""
+    limits = state.limits if state.limits is not None else _default_limits
+    state.watchdog = Watchdog(limits) if limits else None
+    return state.watchdog
+
+
+def end_watchdog():
+    """Called by play_full_game as a game ends, however it ends."""
+    state.watchdog = None